@@ -18,12 +18,13 @@ from app.services.paper_service import (
 from app.services.pdf_service import (
     download_and_process_paper, 
     download_pdf, 
-    read_pdf_file_to_bytes, 
+    extract_text_from_pdf,
     extract_text_from_pdf_bytes,
     proxy_pdf_from_url
 )
 from app.services.url_service import detect_url_type, fetch_metadata_from_url
 from app.utils.url_utils import extract_paper_id_from_url
+from app.utils.pdf_utils import strip_non_printable_text
 from app.database.supabase_client import (
     get_paper_by_id,
     get_paper_by_source,
@@ -36,7 +37,7 @@ from app.database.supabase_client import (
     insert_message,
     get_paper_by_arxiv_id
 )
-from app.services.storage_service import upload_file_to_storage, get_file_url
+from app.services.storage_service import upload_file_to_storage, upload_path_to_storage, get_file_url
 from app.dependencies import validate_environment, get_current_user
 from app.core.exceptions import InvalidPDFUrlError, PDFDownloadError, StorageError, LLMServiceError
 from app.services.llm_service import generate_highlight_summary, generate_highlight_explanation
@@ -236,21 +237,18 @@ async def submit_paper(
             # Download the PDF
             pdf_path, is_new_download = await download_pdf(source_url)
             
-            # Read the PDF file into bytes
-            pdf_content = await read_pdf_file_to_bytes(pdf_path)
-            
             # Extract filename from URL or use a default name
             from urllib.parse import urlparse
             parsed_url = urlparse(source_url)
             path_parts = parsed_url.path.split('/')
-            file_name = path_parts[-1] if path_parts[-1] else f"paper_{hashlib.md5(source_url.encode()).hexdigest()[:8]}.pdf"
+            file_name = path_parts[-1] if path_parts[-1] else f"paper_{hashlib.blake2b(source_url.encode(), digest_size=4).hexdigest()}.pdf"
             
             # Make sure the filename ends with .pdf
             if not file_name.lower().endswith('.pdf'):
                 file_name += '.pdf'
             
             # Upload the PDF to Supabase storage
-            file_path = await upload_file_to_storage(pdf_content, file_name)
+            file_path = await upload_path_to_storage(pdf_path, file_name)
             
             # Generate the public URL
             source_url = await get_file_url(file_path)
@@ -632,8 +630,9 @@ async def process_paper_in_background(source_url: str, source_type: str, paper_i
             # Get related papers using the paper ID, title, and abstract
             related_papers = await get_related_papers(
                 paper_id=paper_id,
-                title=paper.get("title"),
-                abstract=extracted_abstract or paper.get("abstract")
+                paper=paper,
+                # An empty extracted abstract falls back to the stored one
+                abstract=extracted_abstract or None
             )
         except Exception as e:
             logger.error(f"Error getting related papers for {source_url}: {str(e)}")
@@ -670,8 +669,7 @@ async def process_paper_in_background(source_url: str, source_type: str, paper_i
                 # Try to update with a truncated or sanitized version of the text
                 try:
                     # Further sanitize the text by removing any potential problematic characters
-                    import re
-                    sanitized_text = re.sub(r'[^\x20-\x7E\n\r\t]', '', full_text)
+                    sanitized_text = strip_non_printable_text(full_text)
                     # Truncate if still too large
                     if len(sanitized_text) > 1000000:  # Limit to 1MB
                         sanitized_text = sanitized_text[:1000000] + "... [truncated]"
@@ -693,15 +691,22 @@ async def process_paper_in_background(source_url: str, source_type: str, paper_i
         # Update status to error
         await update_paper(paper_id, {"tags": {"status": "error", "error_message": str(e)}})
 
-async def run_immediate_processing(file_content: bytes, paper_id: UUID, source_url: str, source_type: str) -> None:
+async def run_immediate_processing(
+    file_content: Optional[Union[bytes, memoryview]],
+    paper_id: UUID,
+    source_url: str,
+    source_type: str,
+    full_text: Optional[str] = None
+) -> None:
     """
     Run metadata extraction and summarization immediately after upload.
     
     Args:
-        file_content: The binary content of the uploaded PDF file
+        file_content: The binary content of the uploaded PDF file, or None if full_text is given
         paper_id: The UUID of the paper
         source_url: The URL to the paper in storage
         source_type: The type of source ("arxiv", "pdf", "file")
+        full_text: The text of the PDF if it was already extracted
     """
     try:
         logger.info(f"Starting immediate processing for paper {paper_id}")
@@ -709,8 +714,9 @@ async def run_immediate_processing(file_content: bytes, paper_id: UUID, source_u
         # Update status to processing
         await update_paper(paper_id, {"tags": {"status": "processing", "processing_stage": "extracting_text"}})
         
-        # Extract text from PDF bytes
-        full_text = await extract_text_from_pdf_bytes(file_content)
+        # Extract text from PDF bytes unless the caller already has it
+        if full_text is None:
+            full_text = await extract_text_from_pdf_bytes(file_content)
         
         if not full_text:
             logger.error(f"Failed to extract text from PDF for paper {paper_id}")
@@ -814,8 +820,7 @@ async def run_immediate_processing(file_content: bytes, paper_id: UUID, source_u
             # Try to save with a truncated or sanitized version of the text
             try:
                 # Further sanitize the text by removing any potential problematic characters
-                import re
-                sanitized_text = re.sub(r'[^\x20-\x7E\n\r\t]', '', full_text)
+                sanitized_text = strip_non_printable_text(full_text)
                 # Truncate if still too large
                 if len(sanitized_text) > 1000000:  # Limit to 1MB
                     sanitized_text = sanitized_text[:1000000] + "... [truncated]"
@@ -871,27 +876,30 @@ async def download_and_run_immediate_processing(source_url: str, source_type: st
             await update_paper(paper_id, {"tags": {"status": "error", "error_message": "Failed to download PDF"}})
             return
         
-        # Read the PDF file into bytes
-        pdf_content = await read_pdf_file_to_bytes(pdf_path)
+        # Extract straight from the cached file; going through the bytes would copy
+        # the whole PDF into a worker process and skip the text caches. With the
+        # text in hand the PDF itself is never read again, so it isn't loaded
+        full_text = await extract_text_from_pdf(pdf_path)
         
-        # Run immediate processing with the downloaded content
+        # Run immediate processing with the extracted text
         await run_immediate_processing(
-            file_content=pdf_content, 
+            file_content=None, 
             paper_id=paper_id,
             source_url=source_url,
-            source_type=source_type
+            source_type=source_type,
+            full_text=full_text
         )
         
     except Exception as e:
         logger.error(f"Error downloading PDF for immediate processing for paper {paper_id}: {str(e)}")
         await update_paper(paper_id, {"tags": {"status": "error", "error_message": f"PDF download error: {str(e)}"}})
 
-async def process_additional_paper_data(file_content: bytes, paper_id: UUID, full_text: str) -> None:
+async def process_additional_paper_data(file_content: Optional[Union[bytes, memoryview]], paper_id: UUID, full_text: str) -> None:
     """
     Process additional paper data after immediate processing is complete.
     
     Args:
-        file_content: The binary content of the PDF file
+        file_content: The binary content of the PDF file, if it was loaded
         paper_id: The UUID of the paper
         full_text: The already extracted text from the PDF
     """
@@ -932,8 +940,7 @@ async def process_additional_paper_data(file_content: bytes, paper_id: UUID, ful
         try:
             related_papers = await get_related_papers(
                 paper_id=paper_id,
-                title=paper.get("title"),
-                abstract=paper.get("abstract")
+                paper=paper
             )
             
             if related_papers:
@@ -42,11 +42,30 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str = Field(default_factory=lambda: os.getenv("OPENAI_API_KEY", ""))
     OPENAI_MODEL: str = Field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4o"))
     OPENAI_EMBEDDING_MODEL: str = Field(default_factory=lambda: os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-large"))
+    # Number of texts sent per embeddings request (the API accepts up to 2048)
+    OPENAI_EMBEDDING_BATCH_SIZE: int = Field(default_factory=lambda: int(os.getenv("OPENAI_EMBEDDING_BATCH_SIZE", "256")))
+    # Size of the embeddings requested from the text-embedding-3 models, which can be
+    # shortened without retraining (e.g. 1024); 0 keeps the model's full size (3072 for
+    # -large). The vector index must be created with the same size
+    OPENAI_EMBEDDING_DIMENSIONS: int = Field(default_factory=lambda: int(os.getenv("OPENAI_EMBEDDING_DIMENSIONS", "0")))
+    # Maximum number of embeddings requests in flight for one call
+    OPENAI_EMBEDDING_CONCURRENCY: int = Field(default_factory=lambda: int(os.getenv("OPENAI_EMBEDDING_CONCURRENCY", "8")))
     
     # Gemini API configuration
     GEMINI_API_KEY: str = Field(default_factory=lambda: os.getenv("GEMINI_API_KEY", ""))
     GEMINI_MODEL: str = Field(default_factory=lambda: os.getenv("GEMINI_MODEL", "gemini-1.5-pro"))
     
+    # Maximum number of concurrent requests to the LLM providers
+    LLM_MAX_CONCURRENCY: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_CONCURRENCY", "32")))
+    # Largest output the configured LLMs accept in one response (gpt-4o allows 16384, Gemini 1.5 8192)
+    LLM_MAX_OUTPUT_TOKENS: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "8192")))
+    
+    # Maximum number of concurrent PDF downloads
+    PDF_DOWNLOAD_CONCURRENCY: int = Field(default_factory=lambda: int(os.getenv("PDF_DOWNLOAD_CONCURRENCY", "16")))
+    
+    # Number of worker processes used to extract text from PDFs
+    PDF_EXTRACTION_WORKERS: int = Field(default_factory=lambda: int(os.getenv("PDF_EXTRACTION_WORKERS", str(os.cpu_count() or 1))))
+    
     # YouTube API configuration
     YOUTUBE_API_KEY: str = Field(default_factory=lambda: os.getenv("YOUTUBE_API_KEY", ""))
     
@@ -114,6 +133,10 @@ OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
 GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
 GEMINI_MODEL: str = os.getenv("GEMINI_MODEL", "gemini-1.5-pro")
+LLM_MAX_CONCURRENCY: int = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+LLM_MAX_OUTPUT_TOKENS: int = int(os.getenv("LLM_MAX_OUTPUT_TOKENS", "8192"))
+PDF_DOWNLOAD_CONCURRENCY: int = int(os.getenv("PDF_DOWNLOAD_CONCURRENCY", "16"))
+PDF_EXTRACTION_WORKERS: int = int(os.getenv("PDF_EXTRACTION_WORKERS", str(os.cpu_count() or 1)))
 SENDGRID_API_KEY: str = os.getenv("SENDGRID_API_KEY", "")
 SENDGRID_FROM_EMAIL: str = os.getenv("SENDGRID_FROM_EMAIL", "")
 LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
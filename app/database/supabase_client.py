@@ -9,6 +9,9 @@ import re
 
 logger = get_logger(__name__)
 
+# arXiv ID anywhere in a URL; the version suffix is matched outside the group
+_ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})(?:v\d+)?')
+
 # Initialize Supabase client
 try:
     supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
@@ -101,12 +104,10 @@ async def get_paper_by_source(source_url: str, source_type: str) -> Optional[Dic
             # For arXiv papers, also try to match by arXiv ID
             if source_type == "arxiv" and "arxiv.org" in source_url:
                 # Extract arXiv ID from URL
-                match = re.search(r'(\d{4}\.\d{4,5}(?:v\d+)?)', source_url)
+                match = _ARXIV_ID_RE.search(source_url)
                 if match:
+                    # The version suffix is matched outside the group
                     arxiv_id = match.group(1)
-                    # Remove version if present
-                    if 'v' in arxiv_id:
-                        arxiv_id = arxiv_id.split('v')[0]
                     
                     # Try to find by arXiv ID
                     response = supabase.table("papers").select("*").eq("arxiv_id", arxiv_id).execute()
@@ -240,9 +241,10 @@ async def add_paper_to_user(user_id: str, paper_id: str) -> None:
         # First check if the user already has this paper
         check_response = (
             supabase.table("users_papers")
-            .select("*")
+            .select("paper_id")
             .eq("user_id", user_id)
             .eq("paper_id", paper_id)
+            .limit(1)
             .execute()
         )
         
@@ -415,11 +417,17 @@ async def get_paper_full_text(paper_id: UUID) -> Optional[str]:
         SupabaseError: If there's an error retrieving the paper
     """
     try:
-        # Get the paper from the database
-        paper = await get_paper_by_id(str(paper_id))
-        if not paper:
+        # Fetch only the full text column rather than the whole paper row
+        response = (
+            supabase.table("papers")
+            .select("full_text")
+            .eq("id", str(paper_id))
+            .execute()
+        )
+        if not response.data:
             logger.warning(f"Paper with ID {paper_id} not found")
             return None
+        paper = response.data[0]
             
         # Check if the paper has been processed
         if not paper.get("full_text"):
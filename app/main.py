@@ -18,6 +18,8 @@ from fastapi.staticfiles import StaticFiles
 from app.dependencies import validate_environment
 from app.api.v1.endpoints import chat, papers, learning, waiting_list, consulting
 from app.api import payments
+from app.services import paper_service, pdf_service, storage_service
+from app.utils import embedding_utils
 from app.core.config import get_settings
 from app.core.logger import get_logger
 import inspect
@@ -106,6 +108,17 @@ if not proxied_pdfs_dir.exists():
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the shared HTTP clients and the PDF extraction process pool."""
+    await paper_service.close_http_client()
+    await pdf_service.close_http_client()
+    await storage_service.close_http_client()
+    await embedding_utils.close_http_client()
+    pdf_service.shutdown_pdf_pool()
+
+
 @app.get("/", include_in_schema=False)
 async def root():
     """Root endpoint that returns basic API information."""
@@ -1,4 +1,6 @@
+import asyncio
 import re
+from functools import lru_cache
 from typing import List, Dict, Any
 from uuid import UUID
 
@@ -9,6 +11,51 @@ from app.core.exceptions import ChunkingError
 
 logger = get_logger(__name__)
 
+# Section title keywords for each metadata flag, matched as substrings in one pass
+_SECTION_FLAG_RE = re.compile(
+    r'(?P<is_introduction>introduction)'
+    r'|(?P<is_conclusion>conclusion|discussion|summary)'
+    r'|(?P<is_methodology>method|approach|experiment)'
+    r'|(?P<is_abstract>abstract)',
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=8)
+def _get_text_splitter(max_chunk_size: int, overlap: int) -> RecursiveCharacterTextSplitter:
+    """
+    Get a text splitter for the given chunk size and overlap, built once per combination.
+    
+    Args:
+        max_chunk_size: Maximum size of each chunk
+        overlap: Overlap between chunks
+        
+    Returns:
+        A shared RecursiveCharacterTextSplitter
+    """
+    return RecursiveCharacterTextSplitter(
+        chunk_size=max_chunk_size,
+        chunk_overlap=overlap,
+        separators=["\n\n", "\n", ". ", " ", ""],
+        keep_separator=True
+    )
+
+
+def _section_flags(section_title: str) -> Dict[str, bool]:
+    """
+    Classify a section title into the chunk metadata flags.
+    
+    Args:
+        section_title: The title of the section
+        
+    Returns:
+        Dictionary of the is_introduction, is_conclusion, is_methodology and is_abstract flags
+    """
+    flags = dict.fromkeys(("is_introduction", "is_conclusion", "is_methodology", "is_abstract"), False)
+    for match in _SECTION_FLAG_RE.finditer(section_title):
+        flags[match.lastgroup] = True
+    return flags
+
 
 async def chunk_text(
     text: str,
@@ -33,14 +80,14 @@ async def chunk_text(
     try:
         logger.info(f"Chunking text for paper ID: {paper_id}")
         
+        paper_id_str = str(paper_id)
+        
         # If pre-processed chunks are provided, use them
         if pre_processed_chunks:
             logger.info(f"Using {len(pre_processed_chunks)} pre-processed chunks for paper ID: {paper_id}")
             # Ensure paper_id is in metadata
             for chunk in pre_processed_chunks:
-                if "metadata" not in chunk:
-                    chunk["metadata"] = {}
-                chunk["metadata"]["paper_id"] = str(paper_id)
+                chunk.setdefault("metadata", {})["paper_id"] = paper_id_str
             
             logger.info(f"Successfully created {len(pre_processed_chunks)} chunks for paper ID: {paper_id}")
             return pre_processed_chunks
@@ -50,55 +97,38 @@ async def chunk_text(
         sections = extract_sections(text)
         chunks = []
         
-        # Process each section using LangChain's RecursiveCharacterTextSplitter
-        for section_num, (section_title, section_content) in enumerate(sections):
-            # Use Langchain RecursiveCharacterTextSplitter for each section
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=max_chunk_size,
-                chunk_overlap=overlap,
-                separators=["\n\n", "\n", ". ", " ", ""],
-                keep_separator=True
-            )
-            
-            # Create documents with metadata
+        # Split every section with one shared LangChain RecursiveCharacterTextSplitter.
+        # split_text returns plain strings; create_documents would wrap each one in a
+        # Document with a deep copy of the metadata that is immediately copied again.
+        # Splitting is pure-Python CPU work that threads can't parallelize under the
+        # GIL, so it runs in a single worker thread to keep the event loop free
+        text_splitter = _get_text_splitter(max_chunk_size, overlap)
+        sections_chunks = await asyncio.to_thread(
+            lambda: [text_splitter.split_text(section_content) for _, section_content in sections]
+        )
+        
+        for section_num, ((section_title, _), section_chunks) in enumerate(zip(sections, sections_chunks)):
+            # Metadata shared by every chunk of this section
             section_metadata = {
                 "section_title": section_title,
                 "section_number": section_num,
-                "paper_id": str(paper_id),
-                "is_introduction": "introduction" in section_title.lower(),
-                "is_conclusion": any(
-                    word in section_title.lower() 
-                    for word in ["conclusion", "discussion", "summary"]
-                ),
-                "is_methodology": any(
-                    word in section_title.lower() 
-                    for word in ["method", "approach", "experiment"]
-                ),
-                "is_abstract": "abstract" in section_title.lower()
+                "paper_id": paper_id_str,
+                **_section_flags(section_title)
             }
             
-            section_chunks = text_splitter.create_documents(
-                [section_content], 
-                metadatas=[section_metadata]
-            )
-            
-            for chunk_num, chunk_doc in enumerate(section_chunks):
-                chunk_text = chunk_doc.page_content
-                
-                # Skip empty chunks
-                if not chunk_text.strip():
-                    continue
-                
-                # Format the chunk with metadata
-                chunk = {
+            # Format the non-empty chunks with metadata
+            chunks.extend(
+                {
                     "text": chunk_text,
                     "metadata": {
-                        **chunk_doc.metadata,
+                        **section_metadata,
                         "chunk_id": f"{section_num}_{chunk_num}",
                         "length": len(chunk_text)
                     }
                 }
-                chunks.append(chunk)
+                for chunk_num, chunk_text in enumerate(section_chunks)
+                if chunk_text.strip()
+            )
         
         # If no sections were found, create chunks from the raw text
         if not chunks:
@@ -107,46 +137,31 @@ async def chunk_text(
                 "Using raw text chunking."
             )
             
-            # Use Langchain RecursiveCharacterTextSplitter for raw text
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=max_chunk_size,
-                chunk_overlap=overlap,
-                separators=["\n\n", "\n", ". ", " ", ""],
-                keep_separator=True
-            )
-            
-            # Create documents with metadata
+            # Metadata shared by every raw chunk
             raw_metadata = {
                 "section_title": "No Section",
-                "paper_id": str(paper_id),
+                "paper_id": paper_id_str,
                 "is_introduction": False,
                 "is_conclusion": False,
                 "is_methodology": False,
                 "is_abstract": False
             }
             
-            raw_chunks = text_splitter.create_documents(
-                [text],
-                metadatas=[raw_metadata]
-            )
+            raw_chunks = await asyncio.to_thread(text_splitter.split_text, text)
             
-            for chunk_num, chunk_doc in enumerate(raw_chunks):
-                chunk_text = chunk_doc.page_content
-                
-                # Skip empty chunks
-                if not chunk_text.strip():
-                    continue
-                
-                # Format the chunk with metadata
-                chunk = {
+            # Format the non-empty chunks with metadata
+            chunks.extend(
+                {
                     "text": chunk_text,
                     "metadata": {
-                        **chunk_doc.metadata,
+                        **raw_metadata,
                         "chunk_id": f"raw_{chunk_num}",
                         "length": len(chunk_text)
                     }
                 }
-                chunks.append(chunk)
+                for chunk_num, chunk_text in enumerate(raw_chunks)
+                if chunk_text.strip()
+            )
         
         logger.info(
             f"Successfully created {len(chunks)} chunks for paper ID: {paper_id}"
@@ -158,54 +173,51 @@ async def chunk_text(
         raise ChunkingError(f"Error chunking text: {str(e)}")
 
 
+# Section header lines: well-known section names, all-caps titles, or numbered titles.
+# Horizontal whitespace only ([^\S\n]), so a header never spans more than one line.
+_SECTION_HEADER_RE = re.compile(
+    r'^(?:'
+    r'(?:\d+\.?[^\S\n]*)?(?:INTRODUCTION|ABSTRACT|BACKGROUND|RELATED WORK|METHODOLOGY|METHODS|EXPERIMENTS|RESULTS|DISCUSSION|CONCLUSION|REFERENCES)(?:[^\S\n]*\d+\.?)?'
+    r'|(?:\d+\.?[^\S\n]*)?[A-Z][A-Z \t\r\f\v]+'  # All caps title
+    r'|\d+\.[^\S\n]+[A-Z][a-zA-Z \t\r\f\v]+'      # Numbered sections
+    r')[^\S\n]*$',
+    re.MULTILINE
+)
+
+
 def extract_sections(text: str) -> List[tuple]:
     """
     Extract sections from a scientific paper text.
     
+    Header lines are found in a single regex pass over the text, and each
+    section's content is sliced out between consecutive headers.
+    
     Args:
         text: The paper text
         
     Returns:
         List of tuples (section_title, section_content)
     """
-    # Define patterns to identify section headers
-    section_patterns = [
-        r'^(?:\d+\.?\s*)?(?:INTRODUCTION|ABSTRACT|BACKGROUND|RELATED WORK|METHODOLOGY|METHODS|EXPERIMENTS|RESULTS|DISCUSSION|CONCLUSION|REFERENCES)(?:\s*\d+\.?)?(?:\n|\s*$)',
-        r'^(?:\d+\.?\s*)?[A-Z][A-Z\s]+(?:\n|\s*$)',  # All caps title
-        r'^\d+\.\s+[A-Z][a-zA-Z\s]+(?:\n|\s*$)'      # Numbered sections
-    ]
-    
-    # Find potential section headers
-    lines = text.split('\n')
     sections = []
-    current_section = ("Introduction", "")
+    section_title = "Introduction"
+    content_start = 0
     
-    for line in lines:
-        found_header = False
+    for match in _SECTION_HEADER_RE.finditer(text):
+        # Content runs up to the newline before this header; leading blank lines are dropped
+        content = text[content_start:max(match.start() - 1, content_start)].lstrip('\n')
+        if content.strip():
+            sections.append((section_title, content))
         
-        for pattern in section_patterns:
-            match = re.match(pattern, line, re.MULTILINE)
-            if match:
-                # If we found a header, save the current section and start a new one
-                if current_section[1].strip():
-                    sections.append(current_section)
-                current_section = (line.strip(), "")
-                found_header = True
-                break
-        
-        if not found_header:
-            # Add this line to the current section
-            current_section = (
-                current_section[0], 
-                current_section[1] + "\n" + line if current_section[1] else line
-            )
+        section_title = match.group(0).strip()
+        content_start = match.end() + 1
     
     # Add the last section
-    if current_section[1].strip():
-        sections.append(current_section)
+    content = text[content_start:].lstrip('\n')
+    if content.strip():
+        sections.append((section_title, content))
     
     # If no sections were found, create a single section with the entire text
     if not sections:
         sections = [("Introduction", text)]
     
-    return sections 
\ No newline at end of file
+    return sections
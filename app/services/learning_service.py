@@ -21,10 +21,9 @@ from app.api.v1.models import (
     QuestionItem
 )
 from app.services.llm_service import generate_text, mock_generate_learning_content_json
-from app.services.pdf_service import get_paper_pdf
+from app.services.pdf_service import get_paper_pdf, extract_text_from_pdf
 from app.templates.prompts.learning_content import get_learning_content_prompt
 from uuid import UUID
-from app.utils.pdf_utils import extract_text_from_pdf
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -58,19 +57,21 @@ CATEGORY_MAPPING = {
 # Cache to avoid regenerating content for the same paper
 learning_path_cache: Dict[str, LearningPath] = {}
 
-async def generate_youtube_search_query(paper_id: str) -> str:
+async def generate_youtube_search_query(paper_id: str, paper: Optional[Dict[str, Any]] = None) -> str:
     """
     Generate a YouTube search query using LLM based on paper content.
     
     Args:
         paper_id: The ID of the paper
+        paper: The paper record, if the caller already fetched it
         
     Returns:
         str: A search query optimized for finding relevant educational videos
     """
     try:
         # Get paper details
-        paper = await get_paper_by_id(paper_id)
+        if paper is None:
+            paper = await get_paper_by_id(paper_id)
         if not paper:
             logger.warning(f"Paper with ID {paper_id} not found, using fallback query")
             return "machine learning paper explanation"
@@ -121,12 +122,13 @@ async def generate_youtube_search_query(paper_id: str) -> str:
         # Return a fallback query based on the paper ID as a last resort
         return f"paper explanation tutorial"
 
-async def fetch_youtube_videos(paper_id: str) -> List[Dict[str, Any]]:
+async def fetch_youtube_videos(paper_id: str, paper: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Fetch educational YouTube videos related to the paper topic.
     
     Args:
         paper_id: The ID of the paper
+        paper: The paper record, if the caller already fetched it
         
     Returns:
         List[Dict[str, Any]]: A list of YouTube video metadata
@@ -137,7 +139,8 @@ async def fetch_youtube_videos(paper_id: str) -> List[Dict[str, Any]]:
             return _get_mock_youtube_videos()
         
         # Get paper details to create a relevant search query
-        paper = await get_paper_by_id(paper_id)
+        if paper is None:
+            paper = await get_paper_by_id(paper_id)
         if not paper:
             logger.warning(f"Paper with ID {paper_id} not found, using mock data")
             return _get_mock_youtube_videos()
@@ -147,7 +150,7 @@ async def fetch_youtube_videos(paper_id: str) -> List[Dict[str, Any]]:
         
         # First, try to generate a search query using the LLM
         try:
-            search_term = await generate_youtube_search_query(paper_id)
+            search_term = await generate_youtube_search_query(paper_id, paper)
             logger.info(f"Using LLM-generated search term: '{search_term}'")
         except Exception as e:
             logger.warning(f"Failed to generate search query with LLM: {str(e)}, falling back to keyword extraction")
@@ -365,12 +368,13 @@ def _get_mock_flashcards() -> List[CardItem]:
         )
     ]
 
-async def generate_flashcards(paper_id: str) -> List[CardItem]:
+async def generate_flashcards(paper_id: str, paper: Optional[Dict[str, Any]] = None) -> List[CardItem]:
     """
     Generate flashcards for the paper using OpenAI API.
     
     Args:
         paper_id: The ID of the paper
+        paper: The paper record, if the caller already fetched it
         
     Returns:
         List[CardItem]: A list of flashcards with standardized format
@@ -383,7 +387,8 @@ async def generate_flashcards(paper_id: str) -> List[CardItem]:
             return _get_mock_flashcards()
         
         # Get the paper content for context
-        paper = await get_paper_by_id(paper_id)
+        if paper is None:
+            paper = await get_paper_by_id(paper_id)
         logger.debug(f"Paper retrieval result: {paper is not None}")
         if not paper:
             logger.warning(f"Paper {paper_id} not found, using mock flashcards")
@@ -500,12 +505,13 @@ async def generate_flashcards(paper_id: str) -> List[CardItem]:
         logger.error(f"Error generating flashcards: {str(e)}", exc_info=True)
         return _get_mock_flashcards()
 
-async def generate_quiz_questions(paper_id: str) -> List[QuestionItem]:
+async def generate_quiz_questions(paper_id: str, paper: Optional[Dict[str, Any]] = None) -> List[QuestionItem]:
     """
     Generate quiz questions for the paper using OpenAI API.
     
     Args:
         paper_id: The ID of the paper
+        paper: The paper record, if the caller already fetched it
         
     Returns:
         List[QuestionItem]: A list of quiz questions with standardized format
@@ -518,7 +524,8 @@ async def generate_quiz_questions(paper_id: str) -> List[QuestionItem]:
             return _get_mock_quiz_questions()
         
         # Get the paper content for context
-        paper = await get_paper_by_id(paper_id)
+        if paper is None:
+            paper = await get_paper_by_id(paper_id)
         if not paper:
             logger.warning(f"Paper {paper_id} not found, using mock quiz questions")
             return _get_mock_quiz_questions()
@@ -748,56 +755,125 @@ async def store_learning_material(material_data: Dict[str, Any], use_mock_for_te
         return material_id
     
     try:
-        # Handle legacy video data if present
-        data = material_data.get("data", {})
-        
-        # If this is a video type and videos field is present, move it to data
-        if material_data.get("type") == "video" and material_data.get("videos"):
-            logger.info("Moving videos from videos field to data field")
-            # For backward compatibility, if we're storing multiple videos in one item
-            if isinstance(material_data.get("videos"), list) and len(material_data.get("videos")) > 0:
-                data["videos"] = material_data.get("videos")
-                logger.info(f"Moved {len(material_data.get('videos'))} videos to data.videos")
-        
-        # Use our ItemCreate model for validation
-        item_data = {
-            "id": material_id,
-            "paper_id": material_data.get("paper_id"),
-            "type": material_data.get("type"),
-            "level": material_data.get("level", "beginner"),
-            "category": material_data.get("category", "general"),
-            "data": data,
-            "order": material_data.get("order", 0)
-        }
-        
         # Insert the item into the database
-        result = supabase.table("items").insert(item_data).execute()
+        result = supabase.table("items").insert(_material_item_row(material_data, material_id)).execute()
         logger.debug(f"Stored learning material with ID {material_id}")
         
-        # If this is a quiz material, also store the questions
-        if material_data.get("type") == "quiz" and "questions" in material_data.get("data", {}):
-            for question in material_data["data"]["questions"]:
-                # Create a question_data dictionary with proper fields
-                question_data = {
-                    "id": str(uuid.uuid4()),
-                    "item_id": material_id,
-                    "type": "multiple_choice",  # Default type
-                    "text": question.get("question", question.get("text", "")),
-                    # Use options key if available, or choices key if not
-                    "choices": question.get("options", question.get("choices", [])),
-                    # Ensure correct_answer is a string
-                    "correct_answer": str(question.get("correct_answer", ""))
-                }
-                
-                # Insert the question into the database
-                supabase.table("questions").insert(question_data).execute()
-                logger.debug(f"Stored question for item {material_id}")
+        # Insert all questions in one request instead of one round trip per question
+        question_rows = _material_question_rows(material_data, material_id)
+        if question_rows:
+            supabase.table("questions").insert(question_rows).execute()
+            logger.debug(f"Stored {len(question_rows)} questions for item {material_id}")
         
         return material_id
     except Exception as e:
         logger.error(f"Error storing learning material: {str(e)}", exc_info=True)
         raise
 
+async def store_learning_materials(materials: List[Dict[str, Any]], use_mock_for_tests: bool = False) -> List[str]:
+    """
+    Store several learning materials with one insert per table.
+    
+    Args:
+        materials: Learning material data dictionaries, as for store_learning_material
+        use_mock_for_tests: Set to True in test environments to bypass database operations
+        
+    Returns:
+        List[str]: The IDs of the newly created materials, in the order given
+    """
+    material_ids = [str(uuid.uuid4()) for _ in materials]
+    if not materials:
+        return material_ids
+    
+    logger.info(f"Storing {len(materials)} learning materials for paper {materials[0].get('paper_id')}")
+    
+    # In test mode, just return the IDs without database operations
+    if use_mock_for_tests:
+        logger.info(f"Test mode: Bypassing database storage for {len(materials)} materials")
+        return material_ids
+    
+    try:
+        item_rows = [
+            _material_item_row(material_data, material_id)
+            for material_data, material_id in zip(materials, material_ids)
+        ]
+        supabase.table("items").insert(item_rows).execute()
+        
+        question_rows = [
+            row
+            for material_data, material_id in zip(materials, material_ids)
+            for row in _material_question_rows(material_data, material_id)
+        ]
+        if question_rows:
+            supabase.table("questions").insert(question_rows).execute()
+        
+        logger.debug(f"Stored learning materials with IDs {material_ids}")
+        return material_ids
+    except Exception as e:
+        logger.error(f"Error storing learning materials: {str(e)}", exc_info=True)
+        raise
+
+def _material_item_row(material_data: Dict[str, Any], material_id: str) -> Dict[str, Any]:
+    """
+    Build the items table row for a learning material.
+    
+    Args:
+        material_data: Dictionary containing learning material data
+        material_id: The ID to store the material under
+        
+    Returns:
+        The row to insert into the items table
+    """
+    # Handle legacy video data if present
+    data = material_data.get("data", {})
+    
+    # If this is a video type and videos field is present, move it to data
+    if material_data.get("type") == "video" and material_data.get("videos"):
+        logger.info("Moving videos from videos field to data field")
+        # For backward compatibility, if we're storing multiple videos in one item
+        if isinstance(material_data.get("videos"), list) and len(material_data.get("videos")) > 0:
+            data["videos"] = material_data.get("videos")
+            logger.info(f"Moved {len(material_data.get('videos'))} videos to data.videos")
+    
+    # Use our ItemCreate model for validation
+    return {
+        "id": material_id,
+        "paper_id": material_data.get("paper_id"),
+        "type": material_data.get("type"),
+        "level": material_data.get("level", "beginner"),
+        "category": material_data.get("category", "general"),
+        "data": data,
+        "order": material_data.get("order", 0)
+    }
+
+def _material_question_rows(material_data: Dict[str, Any], material_id: str) -> List[Dict[str, Any]]:
+    """
+    Build the questions table rows for a quiz learning material.
+    
+    Args:
+        material_data: Dictionary containing learning material data
+        material_id: The ID the material is stored under
+        
+    Returns:
+        The rows to insert into the questions table, empty unless the material is a quiz
+    """
+    if material_data.get("type") != "quiz" or "questions" not in material_data.get("data", {}):
+        return []
+    
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "item_id": material_id,
+            "type": "multiple_choice",  # Default type
+            "text": question.get("question", question.get("text", "")),
+            # Use options key if available, or choices key if not
+            "choices": question.get("options", question.get("choices", [])),
+            # Ensure correct_answer is a string
+            "correct_answer": str(question.get("correct_answer", ""))
+        }
+        for question in material_data["data"]["questions"]
+    ]
+
 async def get_materials_for_paper(paper_id: str, level: Optional[str] = None, use_mock_for_tests: bool = False) -> List[Dict[str, Any]]:
     """
     Retrieve learning materials for a specific paper.
@@ -945,6 +1021,9 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
                 "publication_date": datetime.now().isoformat()
             }
         
+        # Hand the fetched paper to the generators so each doesn't fetch it again
+        fetched_paper = None if use_mock_for_tests else paper
+        
         # If we have existing materials, use them; otherwise, generate new ones
         if existing_materials:
             logger.info(f"Using {len(existing_materials)} existing materials for paper {paper_id}")
@@ -1057,7 +1136,7 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
             
             # Generate videos
             try:
-                videos = await fetch_youtube_videos(paper_id)
+                videos = await fetch_youtube_videos(paper_id, fetched_paper)
                 logger.debug(f"Generated {len(videos)} YouTube videos")
             except Exception as e:
                 logger.error(f"Error in video generation: {str(e)}", exc_info=True)
@@ -1065,7 +1144,7 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
     
             # Generate flashcards
             try:
-                flashcards = await generate_flashcards(paper_id)
+                flashcards = await generate_flashcards(paper_id, fetched_paper)
                 logger.debug(f"Generated {len(flashcards)} flashcards")
             except Exception as e:
                 logger.error(f"Error in flashcard generation: {str(e)}", exc_info=True)
@@ -1073,7 +1152,7 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
     
             # Generate quiz questions
             try:
-                questions = await generate_quiz_questions(paper_id)
+                questions = await generate_quiz_questions(paper_id, fetched_paper)
                 logger.debug(f"Generated {len(questions)} quiz questions")
             except Exception as e:
                 logger.error(f"Error in quiz question generation: {str(e)}", exc_info=True)
@@ -1084,10 +1163,11 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
             
             # Generate text content for all difficulty levels at once
             # This is a critical step - if it fails, we should abort the entire process
-            text_content = await generate_text_content(paper_id)
+            text_content = await generate_text_content(paper_id, fetched_paper)
             logger.info(f"Generated {len(text_content)} text content items for paper {paper_id}")
             
             # Process text content based on difficulty level
+            text_materials = []
             for content in text_content:
                 # Get the difficulty level from the content
                 level_name = content.get("level", "beginner")
@@ -1135,10 +1215,13 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
                     "order": order_counter
                 }
                 
-                text_item_id = await store_learning_material(text_material_data, use_mock_for_tests=use_mock_for_tests)
-                stored_item_ids.append(text_item_id)
+                text_materials.append(text_material_data)
                 order_counter += 1
-                logger.info(f"Stored {content_type} material with ID {text_item_id} for level {level_name}")
+            
+            # Store all text materials in one request instead of one round trip per item
+            text_item_ids = await store_learning_materials(text_materials, use_mock_for_tests=use_mock_for_tests)
+            stored_item_ids.extend(text_item_ids)
+            logger.info(f"Stored {len(text_item_ids)} text materials for paper {paper_id}")
             
             # Store videos as individual items (only once, not per level)
             if videos:
@@ -1190,7 +1273,7 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
                 if level >= 2:
                     try:
                         logger.info(f"Generating flashcards for level {level}")
-                        flashcards = await generate_flashcards(paper_id)
+                        flashcards = await generate_flashcards(paper_id, fetched_paper)
                         
                         # Log the generated flashcards for debugging
                         logger.info(f"Generated {len(flashcards)} flashcards for level {level}")
@@ -1305,7 +1388,7 @@ async def generate_learning_path(paper_id: str, user_id: Optional[str] = None, u
     
     return learning_path
 
-async def generate_text_content(paper_id: str) -> List[Dict[str, Any]]:
+async def generate_text_content(paper_id: str, paper: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Generate explanatory text content for different aspects of the paper.
     
@@ -1317,6 +1400,7 @@ async def generate_text_content(paper_id: str) -> List[Dict[str, Any]]:
     
     Args:
         paper_id: The ID of the paper
+        paper: The paper record, if the caller already fetched it
         
     Returns:
         List[Dict[str, Any]]: A list of text content items organized by difficulty level
@@ -1331,7 +1415,8 @@ async def generate_text_content(paper_id: str) -> List[Dict[str, Any]]:
     from uuid import UUID
     
     # Get the paper details
-    paper = await get_paper_by_id(paper_id)
+    if paper is None:
+        paper = await get_paper_by_id(paper_id)
     if not paper:
         logger.error(f"Paper {paper_id} not found")
         raise ValueError(f"Paper {paper_id} not found")
@@ -1973,25 +2058,33 @@ async def generate_additional_quiz_questions(paper_id: str, user_id: str) -> Lis
                     
                 logger.info(f"Successfully created new item with ID {item_id}")
                 
-                # Now insert each question with transaction safety in mind
+                db_questions = [
+                    {
+                        "id": question_ids[i],  # Use the pre-generated question ID
+                        "item_id": item_id,
+                        "type": "multiple_choice",
+                        "text": question_data["question"],
+                        "choices": question_data["options"],
+                        "correct_answer": str(question_data["correct_answer"])
+                    }
+                    for i, question_data in enumerate(new_questions_data)
+                ]
+                
+                # Insert all questions in one request; fall back to one at a time so a
+                # single bad row doesn't drop the rest
                 inserted_question_count = 0
-                for i, question_data in enumerate(new_questions_data):
-                    try:
-                        db_question = {
-                            "id": question_ids[i],  # Use the pre-generated question ID
-                            "item_id": item_id,
-                            "type": "multiple_choice",
-                            "text": question_data["question"],
-                            "choices": question_data["options"],
-                            "correct_answer": str(question_data["correct_answer"])
-                        }
-                        
-                        # Insert the question into database
-                        supabase.table("questions").insert(db_question).execute()
-                        inserted_question_count += 1
-                    except Exception as question_error:
-                        logger.error(f"Error inserting question {i+1}: {str(question_error)}")
-                        # Continue with other questions
+                try:
+                    supabase.table("questions").insert(db_questions).execute()
+                    inserted_question_count = len(db_questions)
+                except Exception as batch_error:
+                    logger.warning(f"Batch question insert failed, inserting individually: {str(batch_error)}")
+                    for i, db_question in enumerate(db_questions):
+                        try:
+                            supabase.table("questions").insert(db_question).execute()
+                            inserted_question_count += 1
+                        except Exception as question_error:
+                            logger.error(f"Error inserting question {i+1}: {str(question_error)}")
+                            # Continue with other questions
                 
                 logger.info(f"Successfully inserted {inserted_question_count} out of {len(new_questions_data)} questions")
                 
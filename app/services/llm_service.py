@@ -1,13 +1,19 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple
 import asyncio
+import copy
+import hashlib
 import json
+import orjson
 import os
 import tempfile
 from uuid import UUID
+from collections import OrderedDict
 from openai import OpenAI, AsyncOpenAI
-import google.generativeai as genai
+import aiofiles
+import httpx
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import best_match
 from dotenv import load_dotenv
-from pathlib import Path
 import re
 import time
 
@@ -15,10 +21,13 @@ import time
 load_dotenv()
 
 from app.core.logger import get_logger
-from app.core.config import OPENAI_API_KEY, OPENAI_MODEL, GEMINI_API_KEY, GEMINI_MODEL, APP_ENV
+from app.core.config import (
+    OPENAI_API_KEY, OPENAI_MODEL, GEMINI_API_KEY, GEMINI_MODEL, APP_ENV, LLM_MAX_CONCURRENCY, LLM_MAX_OUTPUT_TOKENS
+)
 from app.core.exceptions import LLMServiceError
 from app.database.supabase_client import get_paper_full_text
-from app.services.pdf_service import get_paper_pdf
+from app.services.pdf_service import get_paper_pdf, extract_text_from_pdf
+from app.utils.batch_utils import coalesce
 
 logger = get_logger(__name__)
 
@@ -40,16 +49,260 @@ if not gemini_api_key:
         os.environ["GEMINI_API_KEY"] = gemini_api_key
         logger.info(f"Gemini client initialized with API key: {gemini_api_key[:8]}... in llm_service.py")
 
+# Bound the number of in-flight LLM requests so bursts don't exhaust connections or rate limits
+llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+def _create_openai_client() -> AsyncOpenAI:
+    """Create the OpenAI client with an explicitly sized connection pool."""
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        timeout=httpx.Timeout(60.0, read=120.0)
+    )
+    return AsyncOpenAI(api_key=openai_api_key, http_client=http_client)
+
 # Initialize the OpenAI client if API key is available
 openai_client = None
 if openai_api_key:
-    openai_client = AsyncOpenAI(api_key=openai_api_key)
+    openai_client = _create_openai_client()
     logger.info(f"OpenAI client initialized with API key: {openai_api_key[:8]}... in llm_service.py")
 
-# Initialize the Gemini client if API key is available
-if gemini_api_key:
+# The Gemini SDK takes over a second to import, so it is loaded and configured on
+# first use instead of at startup. The model is created once and shared, generation
+# settings are passed per call
+_genai: Any = None
+_gemini_model: Any = None
+_gemini_init_lock = asyncio.Lock()
+
+def _init_gemini_sync() -> Tuple[Any, Any]:
+    """Import and configure the Gemini SDK and create the shared model."""
+    import google.generativeai as genai
     genai.configure(api_key=gemini_api_key)
-    logger.info(f"Gemini client initialized with API key: {gemini_api_key[:8]}... in llm_service.py")
+    return genai, genai.GenerativeModel(GEMINI_MODEL)
+
+async def _get_gemini() -> Tuple[Any, Any]:
+    """
+    Get the Gemini SDK module and the shared model, initializing them on first use.
+    
+    Returns:
+        Tuple of the google.generativeai module and the shared GenerativeModel
+    """
+    global _genai, _gemini_model
+    if _gemini_model is None:
+        async with _gemini_init_lock:
+            if _gemini_model is None:
+                _genai, _gemini_model = await asyncio.to_thread(_init_gemini_sync)
+                logger.info(f"Gemini client initialized with API key: {gemini_api_key[:8]}... in llm_service.py")
+    return _genai, _gemini_model
+
+# Gemini File API uploads, keyed by a hash of the PDF bytes, so each PDF is only uploaded once
+GEMINI_FILE_TTL_SECONDS = 3600
+PDF_READ_CHUNK_SIZE = 1024 * 1024
+_gemini_files: Dict[str, Any] = {}
+# Uploads in progress by the same key, so concurrent requests for one PDF upload it once
+_inflight_gemini_uploads: Dict[str, asyncio.Task] = {}
+_background_tasks = set()
+
+async def _expire_gemini_file(file_key: str, uploaded_file: Any) -> None:
+    """Forget and delete an uploaded Gemini file once its TTL has passed."""
+    await asyncio.sleep(GEMINI_FILE_TTL_SECONDS)
+    _gemini_files.pop(file_key, None)
+    try:
+        genai, _ = await _get_gemini()
+        await asyncio.to_thread(genai.delete_file, uploaded_file.name)
+        logger.info(f"Deleted expired Gemini file {uploaded_file.name}")
+    except Exception as e:
+        logger.warning(f"Error deleting Gemini file {uploaded_file.name}: {str(e)}")
+
+async def _upload_gemini_file(file_key: str, pdf_path: str) -> Any:
+    """
+    Upload a PDF to the Gemini File API and remember it until its TTL passes.
+    
+    Args:
+        file_key: Hash of the PDF bytes
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        The uploaded Gemini file
+    """
+    genai, _ = await _get_gemini()
+    uploaded_file = await asyncio.to_thread(genai.upload_file, pdf_path, mime_type="application/pdf")
+    _gemini_files[file_key] = uploaded_file
+    logger.info(f"Uploaded PDF {pdf_path} to Gemini as {uploaded_file.name}")
+    
+    # Keep a reference to the task so it isn't garbage collected before it runs
+    task = asyncio.create_task(_expire_gemini_file(file_key, uploaded_file))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    
+    return uploaded_file
+
+async def get_gemini_pdf_file(pdf_path: str) -> Any:
+    """
+    Get a Gemini File API reference for a PDF, uploading it only if it hasn't been uploaded yet.
+    
+    Concurrent requests for the same PDF share a single upload.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        The uploaded Gemini file, which can be passed directly to generate_content
+    """
+    # Hash the file in chunks without blocking the event loop or holding the whole PDF in memory
+    hasher = hashlib.blake2b(digest_size=16)
+    async with aiofiles.open(pdf_path, "rb") as f:
+        while chunk := await f.read(PDF_READ_CHUNK_SIZE):
+            hasher.update(chunk)
+    
+    file_key = hasher.hexdigest()
+    uploaded_file = _gemini_files.get(file_key)
+    if uploaded_file is not None:
+        logger.info(f"Reusing uploaded Gemini file {uploaded_file.name} for PDF {pdf_path}")
+        return uploaded_file
+    
+    uploaded_file, joined = await coalesce(
+        _inflight_gemini_uploads, file_key, lambda: _upload_gemini_file(file_key, pdf_path)
+    )
+    if joined:
+        logger.info(f"Reusing in-flight Gemini upload {uploaded_file.name} for PDF {pdf_path}")
+    return uploaded_file
+
+_json_decoder = json.JSONDecoder()
+
+# Landmarks where an embedded JSON object can start: a markdown code fence or an opening brace
+_JSON_LANDMARK_RE = re.compile(r"```|\{")
+
+def _find_balanced_json(text: str, start: int, open_char: str, close_char: str) -> Optional[str]:
+    """
+    Find the first balanced JSON value delimited by open_char and close_char.
+    
+    Scans forward once, tracking nesting depth and skipping delimiters inside JSON strings,
+    so there is no regex backtracking on long or malformed responses.
+    
+    Args:
+        text: The text to search
+        start: Index to start searching from
+        open_char: The opening delimiter, "{" or "["
+        close_char: The matching closing delimiter
+        
+    Returns:
+        The text of the JSON value, or None if no balanced value is found
+    """
+    begin = text.find(open_char, start)
+    if begin < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(begin, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == open_char:
+            depth += 1
+        elif char == close_char:
+            depth -= 1
+            if depth == 0:
+                return text[begin:i + 1]
+    
+    return None
+
+def _find_json_object(text: str, start: int = 0) -> Optional[str]:
+    """
+    Find the first balanced JSON object in text at or after start.
+    
+    Args:
+        text: The text to search
+        start: Index to start searching from
+        
+    Returns:
+        The text of the JSON object, or None if no balanced object is found
+    """
+    return _find_balanced_json(text, start, "{", "}")
+
+def _find_json_array(text: str, start: int = 0) -> Optional[str]:
+    """
+    Find the first balanced JSON array in text at or after start.
+    
+    Args:
+        text: The text to search
+        start: Index to start searching from
+        
+    Returns:
+        The text of the JSON array, or None if no balanced array is found
+    """
+    return _find_balanced_json(text, start, "[", "]")
+
+def _loads_json(text: str) -> Any:
+    """Decode JSON with orjson, falling back to the stdlib for input orjson rejects (e.g. NaN)."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+def _parse_llm_json_response(response_text: str, required_keys: tuple = ()) -> Dict[str, Any]:
+    """
+    Parse a JSON object out of an LLM response.
+    
+    Tries the whole response first, then the balanced objects that start at
+    code fences or opening braces, in order of appearance.
+    
+    Args:
+        response_text: The raw response text from the LLM
+        required_keys: Keys that must be present in the parsed object
+        
+    Returns:
+        The parsed JSON object
+        
+    Raises:
+        LLMServiceError: If no JSON object can be parsed or required keys are missing
+    """
+    try:
+        result = _loads_json(response_text)
+        logger.info("Successfully parsed JSON response")
+    except json.JSONDecodeError:
+        logger.warning("Failed to parse entire response as JSON, trying to extract JSON object from the response")
+        
+        # Walk code fences and opening braces in one left-to-right pass,
+        # taking the first balanced object that parses
+        result = None
+        found_candidate = False
+        for landmark in _JSON_LANDMARK_RE.finditer(response_text):
+            json_text = _find_json_object(response_text, landmark.start())
+            if json_text is None:
+                break
+            
+            found_candidate = True
+            try:
+                result = _loads_json(json_text)
+                logger.info("Successfully extracted and parsed JSON object")
+                break
+            except json.JSONDecodeError:
+                continue
+        
+        if result is None:
+            if found_candidate:
+                raise LLMServiceError("Failed to parse extracted JSON object")
+            raise LLMServiceError("No JSON found in the response")
+    
+    if not isinstance(result, dict):
+        raise LLMServiceError("JSON response is not an object")
+    
+    # Only build the list of missing keys when there is an error to report
+    if not all(key in result for key in required_keys):
+        missing_keys = [key for key in required_keys if key not in result]
+        logger.error(f"Missing required keys in JSON response: {missing_keys}")
+        raise LLMServiceError(f"Missing required keys in JSON response: {missing_keys}")
+    
+    return result
 
 async def generate_response(
     query: str,
@@ -110,18 +363,11 @@ async def generate_response(
         # If full text is not available, use the context chunks
         if not full_text:
             logger.info(f"Full text not available, using {len(context_chunks)} context chunks")
-            # Format context chunks as a string with citations
-            formatted_chunks = []
-            for i, chunk in enumerate(context_chunks):
-                # Use chunk_id if available, otherwise use a sequential number
-                chunk_id = chunk.get("chunk_id", f"chunk_{i}")
-                text = chunk.get("text", "")
-                
-                # Add the chunk to the formatted chunks with a citation marker
-                formatted_chunks.append(f"[{i+1}] {text}")
-                
-            # Join all formatted chunks with separators
-            context_text = "\n\n".join(formatted_chunks)
+            # Format context chunks as a string with citation markers, joined in a single pass.
+            # str.join materializes generators into a list anyway, so build the list directly.
+            context_text = "\n\n".join([
+                f"[{i}] {chunk.get('text', '')}" for i, chunk in enumerate(context_chunks, 1)
+            ])
         else:
             context_text = full_text
         
@@ -151,15 +397,16 @@ Your response should be structured as follows:
         # Use Gemini if available, otherwise fall back to OpenAI
         if gemini_api_key:
             # Call the Gemini API to generate a response
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            response = await asyncio.to_thread(
-                model.generate_content,
-                prompt,
-                generation_config={
-                    "max_output_tokens": max_tokens,
-                    "temperature": 0.3,  # Lower temperature for more deterministic responses
-                }
-            )
+            _, gemini_model = await _get_gemini()
+            async with llm_semaphore:
+                response = await asyncio.to_thread(
+                    gemini_model.generate_content,
+                    prompt,
+                    generation_config={
+                        "max_output_tokens": max_tokens,
+                        "temperature": 0.3,  # Lower temperature for more deterministic responses
+                    }
+                )
             
             # Extract the response text
             response_text = response.text.strip()
@@ -168,15 +415,16 @@ Your response should be structured as follows:
             logger.warning("Gemini API key not available, falling back to OpenAI")
             
             # Call the OpenAI API to generate a response
-            response = await openai_client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[{"role": "system", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=0.3,  # Lower temperature for more deterministic responses
-            )
+            async with llm_semaphore:
+                response_text = await _openai_chat_content(
+                    model=OPENAI_MODEL,
+                    messages=[{"role": "system", "content": prompt}],
+                    max_tokens=max_tokens,
+                    temperature=0.3,  # Lower temperature for more deterministic responses
+                )
             
             # Extract the response text
-            response_text = response.choices[0].message.content.strip()
+            response_text = response_text.strip()
         else:
             raise LLMServiceError("Neither Gemini nor OpenAI API key is available")
         
@@ -249,30 +497,23 @@ Your response MUST be structured as follows:
 For each piece of supporting evidence, include the exact quote from the paper and the page number or section where it appears.
 """
 
-        # Open the PDF file
-        pdf_file = Path(pdf_path)
-        if not pdf_file.exists():
+        # Upload the PDF file (or reuse a previous upload of the same file)
+        try:
+            uploaded_pdf = await get_gemini_pdf_file(pdf_path)
+        except FileNotFoundError:
             raise LLMServiceError(f"PDF file not found: {pdf_path}")
-        
-        # Call the Gemini API with the PDF
-        model = genai.GenerativeModel(GEMINI_MODEL)
-        
-        # Upload the PDF file
-        with open(pdf_path, "rb") as f:
-            pdf_content = f.read()
             
-        # Use the file content directly in the generate_content call
-        response = await asyncio.to_thread(
-            model.generate_content,
-            [
-                prompt,
-                {"mime_type": "application/pdf", "data": pdf_content}
-            ],
-            generation_config={
-                "max_output_tokens": max_tokens,
-                "temperature": 0.3,  # Lower temperature for more deterministic responses
-            }
-        )
+        # Reference the uploaded file in the generate_content call
+        _, gemini_model = await _get_gemini()
+        async with llm_semaphore:
+            response = await asyncio.to_thread(
+                gemini_model.generate_content,
+                [prompt, uploaded_pdf],
+                generation_config={
+                    "max_output_tokens": max_tokens,
+                    "temperature": 0.3,  # Lower temperature for more deterministic responses
+                }
+            )
         
         # Extract the response text
         response_text = response.text.strip()
@@ -463,15 +704,16 @@ async def generate_text(
         # Use Gemini if available, otherwise fall back to OpenAI
         if gemini_api_key:
             # Call the Gemini API to generate a response
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            response = await asyncio.to_thread(
-                model.generate_content,
-                prompt,
-                generation_config={
-                    "max_output_tokens": max_tokens,
-                    "temperature": temperature,
-                }
-            )
+            _, gemini_model = await _get_gemini()
+            async with llm_semaphore:
+                response = await asyncio.to_thread(
+                    gemini_model.generate_content,
+                    prompt,
+                    generation_config={
+                        "max_output_tokens": max_tokens,
+                        "temperature": temperature,
+                    }
+                )
             
             # Extract the response text
             generated_text = response.text
@@ -482,19 +724,18 @@ async def generate_text(
             # Use the global client instance instead of creating a new one
             if openai_client is None:
                 # Reinitialize if needed
-                openai_client = AsyncOpenAI(api_key=openai_api_key)
+                openai_client = _create_openai_client()
                 logger.info(f"Reinitialized OpenAI client with API key prefix: {openai_api_key[:8]}...")
             
-            response = await openai_client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=temperature
-            )
-            
-            generated_text = response.choices[0].message.content
+            async with llm_semaphore:
+                generated_text = await _openai_chat_content(
+                    model=OPENAI_MODEL,
+                    messages=[
+                        {"role": "user", "content": prompt}
+                    ],
+                    max_tokens=max_tokens,
+                    temperature=temperature
+                )
         else:
             raise LLMServiceError("Neither Gemini nor OpenAI API key is available")
         
@@ -668,49 +909,13 @@ async def generate_summary_json(
                 logger.info("Generating paper summaries and extracting abstract in JSON format")
                 response_text = await generate_text(prompt, max_tokens, temperature)
             
-            # Extract JSON from the response
-            # First, try to parse the entire response as JSON
-            try:
-                result = json.loads(response_text)
-                logger.info("Successfully parsed JSON response")
-            except json.JSONDecodeError:
-                # If that fails, try to extract JSON from markdown code blocks
-                logger.warning("Failed to parse entire response as JSON, trying to extract JSON from code blocks")
-                json_match = re.search(r'```(?:json)?\s*({[\s\S]*?})\s*```', response_text)
-                
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(1))
-                        logger.info("Successfully extracted and parsed JSON from code block")
-                    except json.JSONDecodeError:
-                        raise LLMServiceError("Failed to parse extracted JSON from code block")
-                else:
-                    # Last resort: try to find anything that looks like a JSON object
-                    logger.warning("No code blocks found, trying to extract JSON object directly")
-                    json_match = re.search(r'{[\s\S]*?}', response_text)
-                    
-                    if json_match:
-                        try:
-                            result = json.loads(json_match.group(0))
-                            logger.info("Successfully extracted and parsed JSON object")
-                        except json.JSONDecodeError:
-                            raise LLMServiceError("Failed to parse extracted JSON object")
-                    else:
-                        raise LLMServiceError("No JSON found in the response")
-            
-            # Validate that the required keys are present
-            required_keys = ["beginner", "intermediate", "advanced", "extracted_abstract"]
-            missing_keys = [key for key in required_keys if key not in result]
+            # Extract JSON from the response, requiring all of the summaries
+            result = _parse_llm_json_response(response_text, ("beginner", "intermediate", "advanced"))
             
-            if missing_keys:
-                logger.error(f"Missing required keys in JSON response: {missing_keys}")
-                
-                # If only missing extracted_abstract, add a placeholder
-                if missing_keys == ["extracted_abstract"]:
-                    logger.warning("Adding placeholder for missing extracted_abstract")
-                    result["extracted_abstract"] = "Abstract extraction failed"
-                else:
-                    raise LLMServiceError(f"Missing required keys in JSON response: {missing_keys}")
+            # If only the extracted abstract is missing, add a placeholder
+            if "extracted_abstract" not in result:
+                logger.warning("Adding placeholder for missing extracted_abstract")
+                result["extracted_abstract"] = "Abstract extraction failed"
             
             logger.info("Successfully generated and parsed summaries and abstract in JSON format")
             return result
@@ -746,9 +951,15 @@ async def mock_generate_summary_json(
     Returns:
         Dictionary containing the extracted abstract and generated summaries (beginner, intermediate, advanced)
     """
-    # Extract the abstract from the prompt
-    abstract_match = re.search(r'Paper abstract: (.*?)(?:\n\n|\Z)', prompt, re.DOTALL)
-    abstract = abstract_match.group(1) if abstract_match else "Abstract not found in prompt"
+    # Extract the abstract from the prompt, up to the next blank line
+    marker = "Paper abstract: "
+    start = prompt.find(marker)
+    if start < 0:
+        abstract = "Abstract not found in prompt"
+    else:
+        start += len(marker)
+        end = prompt.find("\n\n", start)
+        abstract = prompt[start:end] if end >= 0 else prompt[start:]
     
     # Create mock summaries
     return {
@@ -756,7 +967,119 @@ async def mock_generate_summary_json(
         "beginner": f"This is a mock beginner summary based on: {abstract[:100]}...",
         "intermediate": f"This is a mock intermediate summary that provides more details about: {abstract[:150]}...",
         "advanced": f"This is a mock advanced summary with technical depth covering: {abstract[:200]}..."
-    } 
+    }
+
+async def _generate_summaries_single_call(
+    prompts: List[str],
+    max_tokens: int,
+    temperature: float
+) -> List[Dict[str, str]]:
+    """
+    Generate summary JSON for several papers with one LLM call returning a JSON array.
+    
+    Args:
+        prompts: The per-paper summary prompts, in order
+        max_tokens: Maximum tokens to generate per paper
+        temperature: Controls randomness (0.0-1.0)
+        
+    Returns:
+        List of summary dictionaries, in the same order as the prompts
+        
+    Raises:
+        LLMServiceError: If the response isn't an array with a complete summary per paper
+    """
+    required_keys = ("beginner", "intermediate", "advanced", "extracted_abstract")
+    
+    papers_text = "\n\n".join(
+        f"### PAPER {i + 1}\n{paper_prompt}" for i, paper_prompt in enumerate(prompts)
+    )
+    batch_prompt = (
+        f"For each of the following {len(prompts)} papers, follow the instructions given for that paper "
+        f"and produce its summary object.\n\n{papers_text}\n\n"
+        f"IMPORTANT: Respond with ONLY a JSON array of exactly {len(prompts)} objects, in the same order "
+        "as the papers above. Each object MUST have the keys \"beginner\", \"intermediate\", \"advanced\" "
+        "and \"extracted_abstract\"."
+    )
+    
+    response_text = await generate_text(batch_prompt, max_tokens * len(prompts), temperature)
+    
+    # Skip any prose before a markdown code fence, then take the first balanced array
+    fence = response_text.find("```")
+    array_text = _find_json_array(response_text, max(fence, 0))
+    if array_text is None:
+        raise LLMServiceError("No JSON array found in batched summary response")
+    results = _loads_json(array_text)
+    
+    if not isinstance(results, list) or len(results) != len(prompts):
+        raise LLMServiceError(f"Expected a JSON array of {len(prompts)} summaries")
+    
+    for result in results:
+        if not isinstance(result, dict) or not all(key in result for key in required_keys):
+            raise LLMServiceError("Batched summary is missing required keys")
+    
+    return results
+
+async def generate_summaries_batch(
+    prompts: List[str],
+    max_tokens: int = 2500,
+    temperature: float = 0.3,
+    max_retries: int = 3,
+    max_concurrent: int = 32
+) -> List[Dict[str, str]]:
+    """
+    Generate summary JSON for several papers, packing prompts into shared LLM calls.
+
+    The per-paper prompts are split into sub-batches whose combined output budget fits
+    within LLM_MAX_OUTPUT_TOKENS, and each sub-batch is sent as one request asking for a
+    JSON array with one summary object per paper. If a batched response cannot be used,
+    each of its prompts is sent through generate_summary_json instead. At most
+    max_concurrent requests are in flight.
+
+    Args:
+        prompts: The per-paper summary prompts, in order
+        max_tokens: Maximum tokens to generate per paper
+        temperature: Controls randomness (0.0-1.0)
+        max_retries: Maximum number of retry attempts for the per-paper fallback
+        max_concurrent: Maximum number of concurrent requests
+
+    Returns:
+        List of summary dictionaries, in the same order as the prompts
+
+    Raises:
+        LLMServiceError: If the summaries for any paper cannot be generated
+    """
+    if not prompts:
+        return []
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def generate_one(paper_prompt: str) -> Dict[str, str]:
+        async with semaphore:
+            return await generate_summary_json(paper_prompt, max_tokens, temperature, max_retries)
+
+    async def generate_group(group: List[str]) -> List[Dict[str, str]]:
+        if len(group) == 1:
+            return [await generate_one(group[0])]
+
+        try:
+            async with semaphore:
+                results = await _generate_summaries_single_call(group, max_tokens, temperature)
+            logger.info(f"Successfully generated batched summaries for {len(group)} papers")
+            return results
+        except Exception as e:
+            logger.warning(
+                f"Batched summary generation for {len(group)} papers failed: {str(e)}. "
+                "Falling back to concurrent per-paper requests"
+            )
+        return list(await asyncio.gather(*(generate_one(paper_prompt) for paper_prompt in group)))
+
+    # Each paper needs up to max_tokens of output, and a response can't exceed the model's cap
+    group_size = max(1, LLM_MAX_OUTPUT_TOKENS // max(1, max_tokens))
+    groups = [prompts[i:i + group_size] for i in range(0, len(prompts), group_size)]
+    logger.info(f"Generating summaries for {len(prompts)} papers in {len(groups)} batched requests")
+
+    group_results = await asyncio.gather(*(generate_group(group) for group in groups))
+    return [result for results in group_results for result in results]
 
 async def mock_generate_learning_content_json(prompt: str, max_tokens: int = 2500, temperature: float = 0.3) -> Dict[str, Any]:
     """
@@ -791,11 +1114,179 @@ async def mock_generate_learning_content_json(prompt: str, max_tokens: int = 250
         ]
     }
 
+# Maximum number of characters of PDF text sent to OpenAI, which can't read PDFs directly
+OPENAI_PDF_TEXT_LIMIT = 10000
+
+def _truncate_text(text: str, max_chars: int) -> str:
+    """
+    Truncate text to at most max_chars characters, ending on a sentence boundary where possible.
+    
+    Args:
+        text: The text to truncate
+        max_chars: Maximum number of characters to keep
+        
+    Returns:
+        The text unchanged if short enough, otherwise the truncated text with a marker
+    """
+    if len(text) <= max_chars:
+        return text
+    
+    # Cut after the last full sentence, unless that would throw away more than half the budget
+    cut = text.rfind(". ", 0, max_chars)
+    cut = cut + 1 if cut >= max_chars // 2 else max_chars
+    return text[:cut] + " ... [truncated]"
+
+async def _openai_chat_content(**kwargs) -> Optional[str]:
+    """
+    Run an OpenAI chat completion and return the message content.
+    
+    Reads the raw HTTP body and decodes it once with orjson, skipping the SDK's
+    Pydantic model construction for the response.
+    
+    Args:
+        **kwargs: Arguments for chat.completions.create
+        
+    Returns:
+        The content of the first choice's message
+    """
+    raw_response = await openai_client.chat.completions.with_raw_response.create(**kwargs)
+    body = orjson.loads(raw_response.http_response.content)
+    return body["choices"][0]["message"]["content"]
+
+async def _read_json_stream(text_chunks: AsyncIterator[str]) -> str:
+    """
+    Accumulate streamed response text, stopping as soon as a complete JSON object has arrived.
+    
+    Args:
+        text_chunks: Async iterator yielding pieces of the response text
+        
+    Returns:
+        The complete JSON object text if one was found, otherwise the full response text
+    """
+    buffer = ""
+    try:
+        async for text in text_chunks:
+            buffer += text
+            
+            # A complete object can only have arrived with a closing brace
+            if "}" not in text:
+                continue
+            
+            start = buffer.find("{")
+            if start < 0:
+                continue
+            
+            try:
+                _, end = _json_decoder.raw_decode(buffer, start)
+            except json.JSONDecodeError:
+                continue
+            
+            logger.info(f"Complete JSON object received after {len(buffer)} characters, closing stream")
+            return buffer[start:end]
+    finally:
+        await text_chunks.aclose()
+    
+    return buffer
+
+async def _stream_gemini_text(model, contents: Any, generation_config: Dict[str, Any]) -> AsyncIterator[str]:
+    """Yield the text of a streamed Gemini response as it arrives."""
+    response = await model.generate_content_async(
+        contents,
+        generation_config=generation_config,
+        stream=True
+    )
+    async for chunk in response:
+        yield chunk.text
+
+async def _stream_openai_text(**kwargs) -> AsyncIterator[str]:
+    """Yield the text of a streamed OpenAI chat completion as it arrives."""
+    stream = await openai_client.chat.completions.create(stream=True, **kwargs)
+    try:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    finally:
+        await stream.close()
+
+# Structured extraction results keyed by a hash of the prompt and text, most recently used last
+EXTRACTION_CACHE_SIZE = 256
+EXTRACTION_CACHE_TTL_SECONDS = 24 * 3600
+_extraction_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+def _get_cached_extraction(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached extraction result, or None if missing or expired."""
+    entry = _extraction_cache.get(cache_key)
+    if entry is None:
+        return None
+    
+    cached_at, result = entry
+    if time.monotonic() - cached_at > EXTRACTION_CACHE_TTL_SECONDS:
+        del _extraction_cache[cache_key]
+        return None
+    
+    _extraction_cache.move_to_end(cache_key)
+    return copy.deepcopy(result)
+
+def _cache_extraction(cache_key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Store an extraction result in the cache, evicting the least recently used entry if full."""
+    _extraction_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+    _extraction_cache.move_to_end(cache_key)
+    if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+        _extraction_cache.popitem(last=False)
+    return result
+
+async def _extraction_text_openai(full_prompt: str, max_tokens: int, temperature: float) -> str:
+    """Get a structured extraction response from OpenAI."""
+    try:
+        async with llm_semaphore:
+            return await _openai_chat_content(
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": "You are a helpful assistant that extracts structured data from text."},
+                    {"role": "user", "content": full_prompt}
+                ],
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+    except Exception as e:
+        logger.error(f"Error with OpenAI extraction: {str(e)}")
+        raise LLMServiceError(f"OpenAI extraction error: {str(e)}")
+
+async def _extraction_text_gemini(full_prompt: str, max_tokens: int, temperature: float) -> str:
+    """Get a structured extraction response from Gemini."""
+    try:
+        _, gemini_model = await _get_gemini()
+        async with llm_semaphore:
+            response = await asyncio.to_thread(gemini_model.generate_content, full_prompt)
+        return response.text
+    except Exception as e:
+        logger.error(f"Error with Gemini extraction: {str(e)}")
+        raise LLMServiceError(f"Gemini extraction error: {str(e)}")
+
+async def _extraction_text_mock(full_prompt: str, max_tokens: int, temperature: float) -> str:
+    """Return mock extraction data when no LLM service is available."""
+    logger.warning("No LLM service available, using mock extraction")
+    return json.dumps({
+        "title": "Mock Paper Title",
+        "authors": [{"name": "Mock Author", "affiliations": ["Mock University"]}],
+        "abstract": "This is a mock abstract for testing purposes.",
+        "publication_date": "2023-01-01"
+    })
+
+# The available providers don't change at runtime, so pick the extraction provider once
+if openai_client:
+    _extraction_text_impl = _extraction_text_openai
+elif gemini_api_key:
+    _extraction_text_impl = _extraction_text_gemini
+else:
+    _extraction_text_impl = _extraction_text_mock
+
 async def generate_structured_extraction(
     text: str,
     extraction_prompt: str,
     max_tokens: int = 1000,
-    temperature: float = 0.2
+    temperature: float = 0.2,
+    text_bytes: Optional[bytes] = None
 ) -> Dict[str, Any]:
     """
     Extract structured data from text using LLM.
@@ -805,6 +1296,8 @@ async def generate_structured_extraction(
         extraction_prompt: The prompt explaining what to extract and how to format it
         max_tokens: Maximum number of tokens to generate
         temperature: Temperature for generation (lower for more deterministic extraction)
+        text_bytes: Optional UTF-8 encoding of text the caller already has, used to key
+            the extraction cache without encoding the text again
         
     Returns:
         Dictionary containing the extracted structured data
@@ -815,113 +1308,34 @@ async def generate_structured_extraction(
     try:
         logger.info(f"Extracting structured data from text of length {len(text)}")
         
+        # Re-extracting the same text with the same prompt returns the cached result
+        key_hash = hashlib.blake2b(
+            f"{extraction_prompt}|{max_tokens}|{temperature}|".encode(),
+            digest_size=16
+        )
+        key_hash.update(text_bytes if text_bytes is not None else text.encode())
+        cache_key = key_hash.hexdigest()
+        cached_result = _get_cached_extraction(cache_key)
+        if cached_result is not None:
+            logger.info("Using cached structured extraction result")
+            return cached_result
+        
         # Combine the extraction prompt with the text
         full_prompt = f"{extraction_prompt}\n\n{text}"
         
-        # Use OpenAI if available
-        if openai_client:
-            try:
-                response = await openai_client.chat.completions.create(
-                    model=OPENAI_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that extracts structured data from text."},
-                        {"role": "user", "content": full_prompt}
-                    ],
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                
-                # Extract the JSON from the response
-                result_text = response.choices[0].message.content
-                
-                # Try to parse the JSON
-                try:
-                    # Extract JSON if it's wrapped in markdown code blocks
-                    if "```json" in result_text:
-                        json_text = result_text.split("```json")[1].split("```")[0].strip()
-                    elif "```" in result_text:
-                        json_text = result_text.split("```")[1].split("```")[0].strip()
-                    else:
-                        json_text = result_text
-                        
-                    result_json = json.loads(json_text)
-                    return result_json
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse JSON from LLM response: {result_text}")
-                    # Try to extract JSON using regex as a fallback
-                    json_pattern = r'\{.*\}'
-                    match = re.search(json_pattern, result_text, re.DOTALL)
-                    if match:
-                        try:
-                            result_json = json.loads(match.group(0))
-                            return result_json
-                        except json.JSONDecodeError:
-                            pass
-                    
-                    # If all parsing attempts fail, return a basic structure
-                    return {
-                        "title": "Parsing Error",
-                        "authors": [],
-                        "abstract": None,
-                        "publication_date": None
-                    }
-                
-            except Exception as e:
-                logger.error(f"Error with OpenAI extraction: {str(e)}")
-                raise LLMServiceError(f"OpenAI extraction error: {str(e)}")
-                
-        # Use Gemini if OpenAI is not available
-        elif gemini_api_key:
-            try:
-                model = genai.GenerativeModel(GEMINI_MODEL)
-                response = model.generate_content(full_prompt)
-                
-                # Extract the text from the response
-                result_text = response.text
-                
-                # Try to parse the JSON
-                try:
-                    # Extract JSON if it's wrapped in markdown code blocks
-                    if "```json" in result_text:
-                        json_text = result_text.split("```json")[1].split("```")[0].strip()
-                    elif "```" in result_text:
-                        json_text = result_text.split("```")[1].split("```")[0].strip()
-                    else:
-                        json_text = result_text
-                        
-                    result_json = json.loads(json_text)
-                    return result_json
-                except json.JSONDecodeError:
-                    logger.warning(f"Failed to parse JSON from LLM response: {result_text}")
-                    # Try to extract JSON using regex as a fallback
-                    json_pattern = r'\{.*\}'
-                    match = re.search(json_pattern, result_text, re.DOTALL)
-                    if match:
-                        try:
-                            result_json = json.loads(match.group(0))
-                            return result_json
-                        except json.JSONDecodeError:
-                            pass
-                    
-                    # If all parsing attempts fail, return a basic structure
-                    return {
-                        "title": "Parsing Error",
-                        "authors": [],
-                        "abstract": None,
-                        "publication_date": None
-                    }
-                
-            except Exception as e:
-                logger.error(f"Error with Gemini extraction: {str(e)}")
-                raise LLMServiceError(f"Gemini extraction error: {str(e)}")
+        # Get the response from whichever provider was selected at import
+        result_text = await _extraction_text_impl(full_prompt, max_tokens, temperature)
         
-        # If no LLM service is available, use mock data
-            logger.warning("No LLM service available, using mock extraction")
+        # Parse the JSON, returning a basic structure if that fails
+        try:
+            return _cache_extraction(cache_key, _parse_llm_json_response(result_text))
+        except LLMServiceError:
+            logger.warning(f"Failed to parse JSON from LLM response: {result_text}")
             return {
-                "title": "Mock Paper Title",
-                "authors": [{"name": "Mock Author", "affiliations": ["Mock University"]}],
-                "abstract": "This is a mock abstract for testing purposes.",
-                "publication_date": "2023-01-01"
+                "title": "Parsing Error",
+                "authors": [],
+                "abstract": None,
+                "publication_date": None
             }
             
     except Exception as e:
@@ -937,6 +1351,85 @@ async def generate_structured_extraction(
 
 
 
+async def _learning_content_text_gemini(prompt: str, pdf_path: str, max_tokens: int, temperature: float) -> str:
+    """Get a learning content response from Gemini, which reads the PDF directly."""
+    # Upload the PDF file (or reuse a previous upload of the same file)
+    try:
+        uploaded_pdf = await get_gemini_pdf_file(pdf_path)
+    except FileNotFoundError:
+        raise LLMServiceError(f"PDF file not found: {pdf_path}")
+    
+    # Stream the response so parsing can start as soon as the JSON is complete
+    _, gemini_model = await _get_gemini()
+    async with llm_semaphore:
+        return await _read_json_stream(_stream_gemini_text(
+            gemini_model,
+            [prompt, uploaded_pdf],
+            generation_config={
+                "max_output_tokens": max_tokens,
+                "temperature": temperature,
+            }
+        ))
+
+async def _learning_content_text_openai(prompt: str, pdf_path: str, max_tokens: int, temperature: float) -> str:
+    """Get a learning content response from OpenAI, using text extracted from the PDF."""
+    # Note: OpenAI doesn't support direct PDF input, so we'll need to extract text first
+    logger.warning("Gemini API key not available, falling back to OpenAI (note: PDF content may be limited)")
+    
+    # Extract text from PDF
+    pdf_text = await extract_text_from_pdf(pdf_path)
+    
+    # Truncate if too long for OpenAI
+    pdf_text = _truncate_text(pdf_text, OPENAI_PDF_TEXT_LIMIT)
+    
+    # Create a modified prompt that includes the PDF text
+    modified_prompt = f"{prompt}\n\nPDF Content:\n{pdf_text}"
+    
+    # Stream the OpenAI response so parsing can start as soon as the JSON is complete
+    async with llm_semaphore:
+        return await _read_json_stream(_stream_openai_text(
+            model=OPENAI_MODEL,
+            messages=[{"role": "user", "content": modified_prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        ))
+
+async def _learning_content_text_unavailable(prompt: str, pdf_path: str, max_tokens: int, temperature: float) -> str:
+    """Fail when no LLM service is configured."""
+    raise LLMServiceError("Neither Gemini nor OpenAI API key is available")
+
+# Gemini is preferred because it can read the PDF itself, OpenAI is the fallback
+if gemini_api_key:
+    _learning_content_text_impl = _learning_content_text_gemini
+elif openai_client:
+    _learning_content_text_impl = _learning_content_text_openai
+else:
+    _learning_content_text_impl = _learning_content_text_unavailable
+
+# Expected shape of the learning content JSON, compiled once into a validator
+_SECTION_SCHEMA = {
+    "type": "object",
+    "required": ["title", "content"]
+}
+LEARNING_CONTENT_SCHEMA = {
+    "type": "object",
+    "required": ["methodology", "results", "key_concepts"],
+    "properties": {
+        "methodology": _SECTION_SCHEMA,
+        "results": _SECTION_SCHEMA,
+        "key_concepts": {
+            "type": "array",
+            "minItems": 3,
+            "maxItems": 3,
+            "items": {
+                "type": "object",
+                "required": ["key_concept", "explainer"]
+            }
+        }
+    }
+}
+_learning_content_validator = Draft7Validator(LEARNING_CONTENT_SCHEMA)
+
 async def generate_learning_content_json_with_pdf(
     prompt: str,
     pdf_path: str,
@@ -964,115 +1457,17 @@ async def generate_learning_content_json_with_pdf(
     try:
         logger.info("Generating structured learning content with PDF in JSON format")
         
-        # Check if PDF file exists
-        pdf_file = Path(pdf_path)
-        if not pdf_file.exists():
-            raise LLMServiceError(f"PDF file not found: {pdf_path}")
-        
-        # Use Gemini if available, otherwise fall back to OpenAI
-        if gemini_api_key:
-            # Call the Gemini API with the PDF
-            model = genai.GenerativeModel(GEMINI_MODEL)
-            
-            # Read the PDF file
-            with open(pdf_path, "rb") as f:
-                pdf_content = f.read()
-            
-            # Use the file content directly in the generate_content call
-            response = await asyncio.to_thread(
-                model.generate_content,
-                [
-                    prompt,
-                    {"mime_type": "application/pdf", "data": pdf_content}
-                ],
-                generation_config={
-                    "max_output_tokens": max_tokens,
-                    "temperature": temperature,
-                }
-            )
-            
-            # Extract the response text
-            response_text = response.text
-        elif openai_api_key and openai_client:
-            # Fall back to OpenAI if Gemini is not available
-            # Note: OpenAI doesn't support direct PDF input, so we'll need to extract text first
-            logger.warning("Gemini API key not available, falling back to OpenAI (note: PDF content may be limited)")
-            
-            # Extract text from PDF
-            from app.services.pdf_service import extract_text_from_pdf
-            pdf_text = await extract_text_from_pdf(pdf_path)
-            
-            # Truncate if too long for OpenAI
-            if len(pdf_text) > 10000:
-                pdf_text = pdf_text[:10000] + "... [truncated]"
-            
-            # Create a modified prompt that includes the PDF text
-            modified_prompt = f"{prompt}\n\nPDF Content:\n{pdf_text}"
-            
-            # Call the OpenAI API
-            response = await openai_client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[{"role": "user", "content": modified_prompt}],
-                max_tokens=max_tokens,
-                temperature=temperature,
-            )
-            
-            # Extract the response text
-            response_text = response.choices[0].message.content
-        else:
-            raise LLMServiceError("Neither Gemini nor OpenAI API key is available")
+        # Get the response from whichever provider was selected at import
+        response_text = await _learning_content_text_impl(prompt, pdf_path, max_tokens, temperature)
         
         # Extract JSON from the response
-        # First, try to parse the entire response as JSON
-        try:
-            result = json.loads(response_text)
-            logger.info("Successfully parsed JSON response")
-        except json.JSONDecodeError:
-            # If that fails, try to extract JSON from markdown code blocks
-            logger.warning("Failed to parse entire response as JSON, trying to extract JSON from code blocks")
-            json_match = re.search(r'```(?:json)?\s*({[\s\S]*?})\s*```', response_text)
-            
-            if json_match:
-                try:
-                    result = json.loads(json_match.group(1))
-                    logger.info("Successfully extracted and parsed JSON from code block")
-                except json.JSONDecodeError:
-                    raise LLMServiceError("Failed to parse extracted JSON from code block")
-            else:
-                # Last resort: try to find anything that looks like a JSON object
-                logger.warning("No code blocks found, trying to extract JSON object directly")
-                json_match = re.search(r'{[\s\S]*?}', response_text)
-                
-                if json_match:
-                    try:
-                        result = json.loads(json_match.group(0))
-                        logger.info("Successfully extracted and parsed JSON object")
-                    except json.JSONDecodeError:
-                        raise LLMServiceError("Failed to parse extracted JSON object")
-                else:
-                    raise LLMServiceError("No JSON found in the response")
-        
-        # Validate that the required keys are present
-        required_keys = ["methodology", "results", "key_concepts"]
-        missing_keys = [key for key in required_keys if key not in result]
-        
-        if missing_keys:
-            logger.error(f"Missing required keys in JSON response: {missing_keys}")
-            raise LLMServiceError(f"Missing required keys in JSON response: {missing_keys}")
+        result = _parse_llm_json_response(response_text, ("methodology", "results", "key_concepts"))
         
         # Validate structure of the response
-        if not isinstance(result["methodology"], dict) or "title" not in result["methodology"] or "content" not in result["methodology"]:
-            raise LLMServiceError("Invalid structure for methodology in JSON response")
-            
-        if not isinstance(result["results"], dict) or "title" not in result["results"] or "content" not in result["results"]:
-            raise LLMServiceError("Invalid structure for results in JSON response")
-            
-        if not isinstance(result["key_concepts"], list) or len(result["key_concepts"]) != 3:
-            raise LLMServiceError("key_concepts must be an array of exactly 3 items")
-            
-        for concept in result["key_concepts"]:
-            if not isinstance(concept, dict) or "key_concept" not in concept or "explainer" not in concept:
-                raise LLMServiceError("Each key_concept item must have key_concept and explainer fields")
+        error = best_match(_learning_content_validator.iter_errors(result))
+        if error is not None:
+            path = ".".join(str(part) for part in error.absolute_path) or "response"
+            raise LLMServiceError(f"Invalid structure for {path} in JSON response: {error.message}")
         
         logger.info("Successfully generated and parsed structured learning content from PDF in JSON format")
         return result
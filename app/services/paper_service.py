@@ -1,31 +1,331 @@
-import feedparser
 import requests
 import re
 from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 import asyncio
-from urllib.parse import quote
+import xml.etree.ElementTree as ET
 import httpx
+import ciso8601
+import orjson
 import os
+import time
+import hashlib
+import aiofiles
+from pathlib import Path
+from collections import OrderedDict
+from operator import itemgetter
+from itertools import islice
 from uuid import UUID
 
 from app.api.v1.models import PaperMetadata, Author, SourceType
 from app.core.logger import get_logger
 from app.core.config import ARXIV_API_BASE_URL, OPENALEX_API_BASE_URL
 from app.core.exceptions import ArXivAPIError, InvalidArXivLinkError, PDFDownloadError
-from app.utils.pdf_utils import download_pdf, extract_text_from_pdf, clean_pdf_text
 from app.utils.url_utils import extract_paper_id_from_url
 from app.services.llm_service import generate_structured_extraction
+from app.utils.batch_utils import AsyncBatcher
+from app.utils.cache_utils import part_path, ensure_cache_dir_async
 
 logger = get_logger(__name__)
 
+# Pattern for new-style arXiv IDs, e.g. 2101.12345 or 2101.12345v2
+_ARXIV_ID_RE = re.compile(r'^\d+\.\d+(v\d+)?$')
 
-async def fetch_arxiv_metadata(arxiv_id: str) -> PaperMetadata:
+# Fallback pattern for MM/DD/YYYY dates returned by the metadata extraction
+_US_DATE_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+
+# Only the start of a paper is sent for metadata extraction; it holds the title, authors and abstract
+METADATA_TEXT_LIMIT = 10000
+
+# Prompt used to extract metadata from the start of a paper's text
+_EXTRACTION_PROMPT = """
+        Extract the following metadata from this academic paper text:
+        1. Title
+        2. Authors (with affiliations if available)
+        3. Abstract
+        4. Publication date (if available)
+        
+        Format the response as a JSON object with these fields:
+        {
+            "title": "Paper Title",
+            "authors": [
+                {"name": "Author Name", "affiliations": ["Affiliation 1", "Affiliation 2"]}
+            ],
+            "abstract": "Paper abstract...",
+            "publication_date": "YYYY-MM-DD"
+        }
+        
+        If any field is not found, set it to null.
+        
+        Here is the paper text:
+        """
+
+# XML namespaces used in arXiv API Atom responses
+_ATOM_NS = "{http://www.w3.org/2005/Atom}"
+_ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+# Bound in-flight requests per host so bursts queue here instead of timing out on the connection pool
+ARXIV_MAX_CONCURRENCY = 10
+OPENALEX_MAX_CONCURRENCY = 20
+_arxiv_semaphore = asyncio.Semaphore(ARXIV_MAX_CONCURRENCY)
+_openalex_semaphore = asyncio.Semaphore(OPENALEX_MAX_CONCURRENCY)
+
+# Shared HTTP client so arXiv/OpenAlex requests reuse pooled keep-alive connections.
+# OpenAlex JSON and arXiv Atom compress well, so ask for brotli as well as gzip.
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=15.0,
+    limits=httpx.Limits(
+        max_keepalive_connections=ARXIV_MAX_CONCURRENCY + OPENALEX_MAX_CONCURRENCY,
+        max_connections=ARXIV_MAX_CONCURRENCY + OPENALEX_MAX_CONCURRENCY
+    ),
+    headers={"Accept": "application/json", "Accept-Encoding": "gzip, br"}
+)
+
+
+# On-disk cache of processed related-paper lists, keyed by the OpenAlex search text
+OPENALEX_CACHE_DIR = Path("./openalex_cache")
+OPENALEX_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# On-disk cache of LLM-extracted metadata, keyed by a hash of the text sample
+METADATA_CACHE_DIR = Path("./meta_cache")
+METADATA_CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Titles generate_structured_extraction returns when extraction fails; these are never cached
+_EXTRACTION_ERROR_TITLES = frozenset({"Parsing Error", "Extraction Error"})
+
+# In-process LRU of arXiv metadata; a given arXiv ID's metadata doesn't change between calls
+ARXIV_METADATA_CACHE_SIZE = 2048
+_arxiv_metadata_cache: "OrderedDict[str, PaperMetadata]" = OrderedDict()
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client used for arXiv and OpenAlex requests.
+    
+    Should be called once on application shutdown.
+    """
+    await _client.aclose()
+
+
+async def _openalex_get(params: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    """
+    Query the OpenAlex works endpoint, bounded by the OpenAlex concurrency limit.
+    
+    Args:
+        params: Query parameters for the request
+        headers: Optional extra request headers
+        
+    Returns:
+        The OpenAlex response
+    """
+    async with _openalex_semaphore:
+        return await _client.get(OPENALEX_API_BASE_URL, params=params, headers=headers)
+
+
+async def _read_cache_entry(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a JSON cache entry from disk.
+    
+    Args:
+        cache_path: Path of the cache file
+        
+    Returns:
+        The decoded entry, or None if there is no readable entry
+    """
+    try:
+        async with aiofiles.open(cache_path, "rb") as f:
+            return orjson.loads(await f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+        return None
+
+
+async def _write_cache_entry(cache_path: Path, entry: Dict[str, Any]) -> None:
+    """
+    Atomically write a JSON cache entry to disk.
+    
+    Args:
+        cache_path: Path of the cache file
+        entry: The entry to store
+    """
+    # Written under a unique partial name, so concurrent writers never share a file and
+    # a crash leaves only a partial file that the first-write cleanup removes
+    tmp_path = part_path(cache_path)
+    try:
+        await ensure_cache_dir_async(cache_path.parent)
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(orjson.dumps(entry))
+        await asyncio.to_thread(os.replace, tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not write cache entry {cache_path}: {str(e)}")
+    finally:
+        await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+
+
+async def _load_related_papers_cache(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached related-papers entry.
+    
+    Args:
+        key: The cache key derived from the OpenAlex search text
+        
+    Returns:
+        Dictionary with the cached "papers", the first-sentence "search_results"
+        they were derived from, the search "etag" and the "saved_at" time,
+        or None if there is no readable entry
+    """
+    return await _read_cache_entry(OPENALEX_CACHE_DIR / f"{key}.json")
+
+
+async def _save_related_papers_cache(
+    key: str,
+    papers: List[Dict[str, Any]],
+    search_results: List[Dict[str, Any]],
+    etag: Optional[str]
+) -> None:
+    """
+    Persist a processed related-papers list together with the search it came from.
+    
+    The ETag only validates the first-sentence search, so its results are kept
+    alongside the papers; a 304 reuses them and reruns the lookups that follow.
+    
+    Args:
+        key: The cache key derived from the OpenAlex search text
+        papers: The processed related papers
+        search_results: The results of the first-sentence OpenAlex search
+        etag: The ETag returned by the first-sentence search, if any
+    """
+    entry = {"papers": papers, "search_results": search_results, "etag": etag, "saved_at": time.time()}
+    await _write_cache_entry(OPENALEX_CACHE_DIR / f"{key}.json", entry)
+
+
+class OpenAlexWorkBatcher(AsyncBatcher):
+    """Resolve OpenAlex work IDs to work records, many IDs per request."""
+    
+    async def process_batch(self, work_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch the works for a batch of short OpenAlex IDs with one filtered query.
+        
+        Args:
+            work_ids: Short OpenAlex work IDs, e.g. "W1234567890"
+            
+        Returns:
+            The work record for each ID, or None if OpenAlex didn't return it
+        """
+        unique_ids = list(dict.fromkeys(work_ids))
+        response = await _openalex_get(
+            {"filter": f"openalex_id:{'|'.join(unique_ids)}", "per_page": len(unique_ids)}
+        )
+        if response.status_code != 200:
+            logger.warning(
+                f"OpenAlex API returned non-200 status code for work lookup: {response.status_code}"
+            )
+            return [None] * len(work_ids)
+        
+        works_by_id = {
+            work.get("id", "").rpartition("/")[2]: work
+            for work in orjson.loads(response.content).get("results", [])
+        }
+        return [works_by_id.get(work_id) for work_id in work_ids]
+
+
+_work_batcher = OpenAlexWorkBatcher(max_batch_size=50, max_queue_time=0.05)
+
+
+_authorship_fields = itemgetter("author", "author_position", "institutions")
+
+
+def _format_authorship(authorship: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert an OpenAlex authorship into our related-paper author format.
+    
+    Args:
+        authorship: An entry from an OpenAlex work's "authorships" list
+        
+    Returns:
+        Dictionary with the author's name, position and primary affiliation
+    """
+    try:
+        author_obj, author_position, institutions = _authorship_fields(authorship)
+    except KeyError:
+        # OpenAlex always sends these fields, but tolerate partial records
+        author_obj = authorship.get("author", {})
+        author_position = authorship.get("author_position", "")
+        institutions = authorship.get("institutions", [])
+    
+    return {
+        "name": author_obj.get("display_name", "Unknown Author"),
+        "position": author_position,
+        # Just get primary affiliation
+        "affiliations": [
+            institution["display_name"]
+            for institution in islice(institutions or (), 1)
+            if institution.get("display_name")
+        ]
+    }
+
+
+def _discard_task(task: asyncio.Task) -> None:
+    """
+    Drop a speculative request task whose result is no longer needed.
+    
+    Pending tasks are cancelled; finished ones have their exception retrieved
+    so it isn't reported as unhandled.
+    
+    Args:
+        task: The task to discard
+    """
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _parse_arxiv_atom(body: bytes) -> Optional[Dict[str, Any]]:
+    """
+    Extract the fields we use from the first entry of an arXiv Atom response.
+    
+    Args:
+        body: The raw Atom XML returned by the arXiv API
+        
+    Returns:
+        Dictionary with title, summary, published, authors, categories and doi,
+        or None if the feed contains no entries
+    """
+    root = ET.fromstring(body)
+    entry = root.find(f"{_ATOM_NS}entry")
+    if entry is None:
+        return None
+    
+    return {
+        "title": entry.findtext(f"{_ATOM_NS}title", ""),
+        "summary": entry.findtext(f"{_ATOM_NS}summary", ""),
+        "published": entry.findtext(f"{_ATOM_NS}published", ""),
+        "authors": [
+            author.findtext(f"{_ATOM_NS}name", "")
+            for author in entry.iterfind(f"{_ATOM_NS}author")
+        ],
+        "categories": [
+            category.get("term", "")
+            for category in entry.iterfind(f"{_ATOM_NS}category")
+        ],
+        "doi": entry.findtext(f"{_ARXIV_NS}doi")
+    }
+
+
+async def fetch_arxiv_metadata(arxiv_id: str, force: bool = False) -> PaperMetadata:
     """
     Fetch paper metadata from the arXiv API.
     
+    Results are kept in an in-process LRU cache, so repeated lookups for the
+    same arXiv ID don't hit the network.
+    
     Args:
         arxiv_id: The arXiv ID of the paper
+        force: Whether to bypass the cache and re-fetch from the arXiv API
         
     Returns:
         PaperMetadata object with the paper's metadata
@@ -35,36 +335,44 @@ async def fetch_arxiv_metadata(arxiv_id: str) -> PaperMetadata:
         InvalidArXivLinkError: If the arXiv ID is invalid
     """
     # Validate arXiv ID format
-    if not re.match(r'^\d+\.\d+(v\d+)?$', arxiv_id):
+    if not _ARXIV_ID_RE.match(arxiv_id):
         logger.error(f"Invalid arXiv ID format: {arxiv_id}")
         raise InvalidArXivLinkError(f"https://arxiv.org/abs/{arxiv_id}")
     
+    if not force:
+        cached = _arxiv_metadata_cache.get(arxiv_id)
+        if cached is not None:
+            _arxiv_metadata_cache.move_to_end(arxiv_id)
+            logger.info(f"Using cached metadata for arXiv ID: {arxiv_id}")
+            return cached.model_copy(deep=True)
+    
     try:
         logger.info(f"Fetching metadata for arXiv ID: {arxiv_id}")
         
         # Construct API URL
-        query = f"id:{arxiv_id}"
-        url = f"{ARXIV_API_BASE_URL}?search_query={quote(query)}&max_results=1"
-        
-        # Fetch data from arXiv API
-        response = await asyncio.to_thread(feedparser.parse, url)
+        params = {"search_query": f"id:{arxiv_id}", "max_results": 1}
+        
+        # Fetch the Atom feed over the shared client and only hand the parsing to a thread
+        async with _arxiv_semaphore:
+            feed_response = await _client.get(
+                ARXIV_API_BASE_URL,
+                params=params,
+                headers={"Accept": "application/atom+xml"}
+            )
+        feed_response.raise_for_status()
+        entry = await asyncio.to_thread(_parse_arxiv_atom, feed_response.content)
         
-        if 'entries' not in response or not response.entries:
+        if not entry:
             logger.error(f"No entries found for arXiv ID: {arxiv_id}")
             raise ArXivAPIError(f"No paper found with arXiv ID: {arxiv_id}")
         
-        entry = response.entries[0]
-        
         # Extract authors
-        authors = []
-        for author in entry.get('authors', []):
-            name = author.get('name', '')
-            authors.append(Author(name=name, affiliations=[]))
+        authors = [Author(name=name, affiliations=[]) for name in entry['authors']]
         
         # Extract publication date
-        published = entry.get('published', '')
+        published = entry['published']
         try:
-            publication_date = datetime.strptime(published, '%Y-%m-%dT%H:%M:%SZ')
+            publication_date = ciso8601.parse_datetime_as_naive(published)
         except (ValueError, TypeError):
             publication_date = datetime.now()
         
@@ -74,16 +382,21 @@ async def fetch_arxiv_metadata(arxiv_id: str) -> PaperMetadata:
         # Create metadata object
         metadata = PaperMetadata(
             arxiv_id=arxiv_id,
-            title=entry.get('title', '').replace('\n', ' '),
+            title=entry['title'].replace('\n', ' '),
             authors=authors,
-            abstract=entry.get('summary', '').replace('\n', ' '),
+            abstract=entry['summary'].replace('\n', ' '),
             publication_date=publication_date,
-            categories=[tag.get('term', '') for tag in entry.get('tags', [])],
-            doi=entry.get('arxiv_doi', None),
+            categories=entry['categories'],
+            doi=entry['doi'],
             source_type=SourceType.ARXIV,
             source_url=source_url
         )
         
+        _arxiv_metadata_cache[arxiv_id] = metadata.model_copy(deep=True)
+        _arxiv_metadata_cache.move_to_end(arxiv_id)
+        if len(_arxiv_metadata_cache) > ARXIV_METADATA_CACHE_SIZE:
+            _arxiv_metadata_cache.popitem(last=False)
+        
         logger.info(f"Successfully fetched metadata for arXiv ID: {arxiv_id}")
         return metadata
         
@@ -92,7 +405,13 @@ async def fetch_arxiv_metadata(arxiv_id: str) -> PaperMetadata:
         raise ArXivAPIError(f"Error fetching paper metadata: {str(e)}")
 
 
-async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstract: Optional[str] = None) -> List[Dict[str, Any]]:
+async def get_related_papers(
+    paper_id: UUID,
+    paper: Optional[Dict[str, Any]] = None,
+    *,
+    title: Optional[str] = None,
+    abstract: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """
     Get related papers using the OpenAlex API.
     
@@ -103,8 +422,10 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
     
     Args:
         paper_id: The UUID of the paper (used only for logging and as a reference)
-        title: Optional title of the paper (will be fetched if not provided)
-        abstract: Optional abstract of the paper (will be fetched if not provided)
+        paper: Optional paper record the caller already fetched; its title and
+            abstract are used instead of fetching the paper again
+        title: Optional title of the paper, taking precedence over the paper record unless empty
+        abstract: Optional abstract of the paper, taking precedence over the paper record unless empty
         
     Returns:
         List of related papers with metadata (title, authors, abstract, etc.)
@@ -112,8 +433,15 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
     try:
         logger.info(f"Fetching related papers for paper ID: {paper_id} using OpenAlex API")
         
-        # If title and abstract are not provided, fetch them
-        if title is None or abstract is None:
+        if paper is not None:
+            # Use the record the caller already has rather than another database round trip;
+            # empty values passed in (e.g. a failed abstract extraction) fall back to it too
+            if not title:
+                title = paper.get("title") or ""
+            if not abstract:
+                abstract = paper.get("abstract") or ""
+        elif title is None or abstract is None:
+            # If title and abstract are not provided, fetch them
             try:
                 from app.database.supabase_client import get_paper_by_id
                 paper = await get_paper_by_id(paper_id)
@@ -129,7 +457,7 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
                 return []
         
         # Extract the first sentence from the abstract for searching
-        first_sentence = abstract.split('.')[0].strip() if abstract else ""
+        first_sentence = abstract.partition('.')[0].strip() if abstract else ""
         if not first_sentence and title:
             # Fall back to title if abstract is empty or has no sentences
             first_sentence = title
@@ -138,81 +466,101 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
             logger.error("No search text available from abstract or title")
             return []
             
+        # Serve fresh cached results without touching OpenAlex
+        cache_key = hashlib.sha1(first_sentence.encode()).hexdigest()
+        cached = await _load_related_papers_cache(cache_key)
+        if cached and time.time() - cached["saved_at"] < OPENALEX_CACHE_TTL_SECONDS:
+            logger.info(f"Using cached related papers for paper ID: {paper_id}")
+            return cached["papers"]
+        
         logger.info(f"Searching for paper using first sentence: {first_sentence[:50]}...")
         
         # Step 1: Search for the paper in OpenAlex using the abstract's first sentence
-        search_url = f"{OPENALEX_API_BASE_URL}?search={quote(first_sentence)}&filter=has_abstract:true&per_page=5"
+        search_params = {"search": first_sentence, "filter": "has_abstract:true", "per_page": 5}
         
-        logger.debug(f"Querying OpenAlex API at: {search_url}")
+        logger.debug(f"Querying OpenAlex API at: {OPENALEX_API_BASE_URL} with {search_params}")
         
-        async with httpx.AsyncClient() as client:
-            # Make async request to OpenAlex API
-            response = await client.get(
-                search_url,
-                headers={"Accept": "application/json"},
-                timeout=15.0
-            )
-            
-            # Check response status
-            if response.status_code != 200:
-                logger.warning(
-                    f"OpenAlex API returned non-200 status code: {response.status_code}"
-                )
-                return []
+        # Make async request to OpenAlex API, dispatching the title fallback
+        # search speculatively so a miss doesn't cost a second round trip
+        search_headers = None
+        if cached and cached.get("etag") and "search_results" in cached:
+            search_headers = {"If-None-Match": cached["etag"]}
+        search_task = asyncio.create_task(_openalex_get(search_params, headers=search_headers))
+        title_task = None
+        if title and title != first_sentence:
+            title_search_params = {"search": title, "per_page": 5}
+            title_task = asyncio.create_task(_openalex_get(title_search_params))
+        
+        try:
+            response = await search_task
             
-            # Parse response data
-            data = response.json()
-            search_results = data.get("results", [])
+            if response.status_code == 304 and search_headers:
+                # Only the search is validated; the citation lookups below are rerun
+                logger.info(f"OpenAlex search unchanged, reusing cached search results for paper ID: {paper_id}")
+                search_etag = cached["etag"]
+                search_results = cached["search_results"]
+            else:
+                search_etag = response.headers.get("ETag")
+                
+                # Check response status
+                if response.status_code != 200:
+                    logger.warning(
+                        f"OpenAlex API returned non-200 status code: {response.status_code}"
+                    )
+                    return []
+                
+                # Parse response data
+                data = orjson.loads(response.content)
+                search_results = data.get("results", [])
+            first_sentence_results = search_results
             
             if not search_results:
                 logger.warning(f"No papers found matching the abstract: {first_sentence[:50]}...")
                 
                 # Try searching by title as fallback
-                if title and title != first_sentence:
+                if title_task is not None:
                     logger.info(f"Trying to search by title instead: {title[:50]}...")
-                    title_search_url = f"{OPENALEX_API_BASE_URL}?search={quote(title)}&per_page=5"
-                    
-                    response = await client.get(
-                        title_search_url,
-                        headers={"Accept": "application/json"},
-                        timeout=15.0
-                    )
+                    response = await title_task
                     
                     if response.status_code == 200:
-                        data = response.json()
+                        data = orjson.loads(response.content)
                         search_results = data.get("results", [])
                 
                 if not search_results:
                     logger.warning("No papers found in OpenAlex matching this paper")
                     return []
-            
-            # Use the first result as the best match
-            # OpenAlex search should return the most relevant results first
-            if search_results:
-                work_id = search_results[0].get("id")
-                logger.info(f"Using best match with work_id: {work_id}")
-            else:
-                logger.warning("Could not determine work_id from search results")
-                return []
-            
-            # Extract just the ID part if it's a full URL
-            # OpenAlex IDs are typically in the format "https://openalex.org/W1234567890"
-            # We need just the "W1234567890" part for the API query
-            work_id_short = work_id
-            if isinstance(work_id, str) and "/" in work_id:
-                work_id_short = work_id.split("/")[-1]
-                logger.debug(f"Extracted short work_id: {work_id_short} from {work_id}")
-            
-            # Step 2: Use the work ID to find papers that cite this paper
-            cited_by_url = f"{OPENALEX_API_BASE_URL}?filter=cites:{work_id_short}&per_page=5"
-            
-            logger.debug(f"Querying OpenAlex API for citations at: {cited_by_url}")
-            
-            response = await client.get(
-                cited_by_url,
-                headers={"Accept": "application/json"},
-                timeout=15.0
-            )
+        finally:
+            if title_task is not None:
+                _discard_task(title_task)
+        
+        # Use the first result as the best match
+        # OpenAlex search should return the most relevant results first
+        if search_results:
+            work_id = search_results[0].get("id")
+            logger.info(f"Using best match with work_id: {work_id}")
+        else:
+            logger.warning("Could not determine work_id from search results")
+            return []
+        
+        # Extract just the ID part if it's a full URL
+        # OpenAlex IDs are typically in the format "https://openalex.org/W1234567890"
+        # We need just the "W1234567890" part for the API query
+        work_id_short = work_id
+        if isinstance(work_id, str) and "/" in work_id:
+            work_id_short = work_id.rpartition("/")[2]
+            logger.debug(f"Extracted short work_id: {work_id_short} from {work_id}")
+        
+        # Step 2: Use the work ID to find papers that cite this paper, fetching
+        # the work itself concurrently (batched with other lookups) in case we need its concepts
+        cited_by_params = {"filter": f"cites:{work_id_short}", "per_page": 5}
+        
+        logger.debug(f"Querying OpenAlex API for citations with {cited_by_params}")
+        
+        cites_task = asyncio.create_task(_openalex_get(cited_by_params))
+        work_task = asyncio.create_task(_work_batcher.process(work_id_short))
+        
+        try:
+            response = await cites_task
             
             if response.status_code != 200:
                 logger.warning(
@@ -221,7 +569,7 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
                 return []
             
             # Parse response data
-            data = response.json()
+            data = orjson.loads(response.content)
             results = data.get("results", [])
             
             # If no citing papers found, try papers with similar concepts
@@ -229,15 +577,9 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
                 logger.info(f"No citing papers found, searching for conceptually similar papers")
                 
                 # Extract concepts from the work
-                work_url = f"{OPENALEX_API_BASE_URL}/{work_id_short}"
-                work_response = await client.get(
-                    work_url,
-                    headers={"Accept": "application/json"},
-                    timeout=15.0
-                )
+                work_data = await work_task
                 
-                if work_response.status_code == 200:
-                    work_data = work_response.json()
+                if work_data:
                     concepts = work_data.get("concepts", [])
                     
                     if concepts:
@@ -245,80 +587,63 @@ async def get_related_papers(paper_id: UUID, title: Optional[str] = None, abstra
                         top_concept = concepts[0].get("id") if concepts else None
                         
                         if top_concept:
-                            concept_url = f"{OPENALEX_API_BASE_URL}?filter=concepts.id:{top_concept}&per_page=5"
+                            concept_params = {"filter": f"concepts.id:{top_concept}", "per_page": 5}
                             
-                            concept_response = await client.get(
-                                concept_url,
-                                headers={"Accept": "application/json"},
-                                timeout=15.0
-                            )
+                            concept_response = await _openalex_get(concept_params)
                             
                             if concept_response.status_code == 200:
-                                concept_data = concept_response.json()
+                                concept_data = orjson.loads(concept_response.content)
                                 results = concept_data.get("results", [])
+        finally:
+            _discard_task(work_task)
+        
+        # Process results into a consistent format
+        related_papers = []
+        for paper in results:
+            # Extract basic metadata from OpenAlex response
+            paper_title = paper.get("title", "Untitled Paper")
+            paper_id = paper.get("id", "")
             
-            # Process results into a consistent format
-            related_papers = []
-            for paper in results:
-                # Extract basic metadata from OpenAlex response
-                paper_title = paper.get("title", "Untitled Paper")
-                paper_id = paper.get("id", "")
-                
-                # Extract DOI if available
-                paper_doi = paper.get("doi", "")
-                
-                # Extract PDF URL if available
-                pdf_url = None
-                primary_location = paper.get("primary_location", {})
-                if primary_location:
-                    pdf_url = primary_location.get("pdf_url")
-                
-                # If no PDF URL in primary location, check all locations
-                if not pdf_url:
-                    for location in paper.get("locations", []):
-                        if location.get("pdf_url"):
-                            pdf_url = location.get("pdf_url")
-                            break
-                
-                # Extract authors (limit to top 5 for brevity)
-                authors_data = []
-                for author in paper.get("authorships", [])[:5]:  # Limit to top 5 authors
-                    author_obj = author.get("author", {})
-                    author_name = author_obj.get("display_name", "Unknown Author")
-                    
-                    # Get author position if available
-                    author_position = author.get("author_position", "")
-                    
-                    # Get primary affiliation if available
-                    affiliations = []
-                    for institution in author.get("institutions", [])[:1]:  # Just get primary affiliation
-                        if institution.get("display_name"):
-                            affiliations.append(institution.get("display_name"))
-                    
-                    authors_data.append({
-                        "name": author_name,
-                        "position": author_position,
-                        "affiliations": affiliations
-                    })
-                
-                # Extract publication year and date
-                publication_year = paper.get("publication_year", None)
-                publication_date = paper.get("publication_date", None)
-                
-                # Add paper to results
-                related_papers.append({
-                    "title": paper_title,
-                    "authors": authors_data,
-                    "openalex_id": paper_id,
-                    "doi": paper_doi,
-                    "pdf_url": pdf_url,
-                    "publication_year": publication_year,
-                    "publication_date": publication_date
-                })
+            # Extract DOI if available
+            paper_doi = paper.get("doi", "")
             
-            logger.info(f"Found {len(related_papers)} related papers for paper ID: {paper_id}")
-            return related_papers[:5]  # Limit to 5 related papers
-        
+            # Extract PDF URL if available
+            pdf_url = None
+            primary_location = paper.get("primary_location", {})
+            if primary_location:
+                pdf_url = primary_location.get("pdf_url")
+            
+            # If no PDF URL in primary location, check all locations
+            if not pdf_url:
+                for location in paper.get("locations", []):
+                    if location.get("pdf_url"):
+                        pdf_url = location.get("pdf_url")
+                        break
+            
+            # Extract authors (limit to top 5 for brevity)
+            authors_data = [_format_authorship(author) for author in islice(paper.get("authorships") or (), 5)]
+            
+            # Extract publication year and date
+            publication_year = paper.get("publication_year", None)
+            publication_date = paper.get("publication_date", None)
+            
+            # Add paper to results
+            related_papers.append({
+                "title": paper_title,
+                "authors": authors_data,
+                "openalex_id": paper_id,
+                "doi": paper_doi,
+                "pdf_url": pdf_url,
+                "publication_year": publication_year,
+                "publication_date": publication_date
+            })
+        
+        related_papers = related_papers[:5]  # Limit to 5 related papers
+        await _save_related_papers_cache(cache_key, related_papers, first_sentence_results, search_etag)
+        
+        logger.info(f"Found {len(related_papers)} related papers for paper ID: {paper_id}")
+        return related_papers
+    
     except Exception as e:
         logger.error(f"Error fetching related papers for paper ID {paper_id}: {str(e)}")
         # Return empty list instead of raising an exception
@@ -345,37 +670,27 @@ async def extract_metadata_from_text(text: str) -> PaperMetadata:
         # Use LLM to extract metadata
         # First, use only the first 10000 characters to avoid token limits
         # This should be enough to capture the title, authors, and abstract
-        text_sample = text[:10000]
+        text_sample = text[:METADATA_TEXT_LIMIT]
         
-        # Define the extraction prompt
-        extraction_prompt = """
-        Extract the following metadata from this academic paper text:
-        1. Title
-        2. Authors (with affiliations if available)
-        3. Abstract
-        4. Publication date (if available)
-        
-        Format the response as a JSON object with these fields:
-        {
-            "title": "Paper Title",
-            "authors": [
-                {"name": "Author Name", "affiliations": ["Affiliation 1", "Affiliation 2"]}
-            ],
-            "abstract": "Paper abstract...",
-            "publication_date": "YYYY-MM-DD"
-        }
-        
-        If any field is not found, set it to null.
-        
-        Here is the paper text:
-        """
+        # Encode the sample once for both the disk cache key and the LLM service's cache key
+        text_bytes = text_sample.encode()
         
-        # Use LLM service to extract structured metadata
-        metadata_json = await generate_structured_extraction(
-            text_sample, 
-            extraction_prompt,
-            max_tokens=1000
-        )
+        # Reuse a previous extraction of the same text if we have one
+        cache_path = METADATA_CACHE_DIR / f"{hashlib.blake2b(text_bytes, digest_size=16).hexdigest()}.json"
+        cached = await _read_cache_entry(cache_path)
+        if cached and time.time() - cached["saved_at"] < METADATA_CACHE_TTL_SECONDS:
+            logger.info("Using cached metadata extraction")
+            metadata_json = cached["metadata"]
+        else:
+            # Use LLM service to extract structured metadata
+            metadata_json = await generate_structured_extraction(
+                text_sample, 
+                _EXTRACTION_PROMPT,
+                max_tokens=1000,
+                text_bytes=text_bytes
+            )
+            if metadata_json.get("title") not in _EXTRACTION_ERROR_TITLES:
+                await _write_cache_entry(cache_path, {"metadata": metadata_json, "saved_at": time.time()})
         
         # Convert the JSON to a PaperMetadata object
         authors = []
@@ -387,25 +702,20 @@ async def extract_metadata_from_text(text: str) -> PaperMetadata:
         
         # Parse the publication date
         pub_date = metadata_json.get("publication_date")
-        if pub_date:
+        publication_date = None
+        if pub_date and isinstance(pub_date, str):
             try:
-                publication_date = datetime.fromisoformat(pub_date)
+                publication_date = ciso8601.parse_datetime(pub_date)
             except ValueError:
-                # Try to parse with different formats
-                try:
-                    # Try MM/DD/YYYY format
-                    if "/" in pub_date:
-                        parts = pub_date.split("/")
-                        if len(parts) == 3:
-                            month, day, year = parts
-                            publication_date = datetime(int(year), int(month), int(day))
-                    # Try Month Year format (e.g., "January 2023")
-                    else:
-                        # This is a simplification - would need more robust parsing
-                        publication_date = datetime.now()
-                except:
-                    publication_date = datetime.now()
-        else:
+                # Try MM/DD/YYYY format; other formats (e.g. "January 2023") fall back to now
+                us_date = _US_DATE_RE.match(pub_date)
+                if us_date:
+                    month, day, year = map(int, us_date.groups())
+                    try:
+                        publication_date = datetime(year, month, day)
+                    except ValueError:
+                        pass
+        if publication_date is None:
             publication_date = datetime.now()
         
         # Get abstract or provide a default
@@ -5,35 +5,547 @@ import logging
 import hashlib
 from pathlib import Path
 from uuid import UUID
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Union
 import re
-import tempfile
+import shutil
+import time
+import mmap
+from email.utils import parsedate_to_datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import aiofiles
+import orjson
 
 from app.core.logger import get_logger
+from app.core.config import PDF_DOWNLOAD_CONCURRENCY, PDF_EXTRACTION_WORKERS
 from app.core.exceptions import PDFDownloadError, InvalidPDFUrlError
 from app.database.supabase_client import get_paper_by_id
 from app.api.v1.models import SourceType
-from app.utils.pdf_utils import extract_text_from_pdf, clean_pdf_text
+from app.utils.batch_utils import coalesce
+from app.utils.cache_utils import part_path, ensure_cache_dir, ensure_cache_dir_async
+from app.utils.pdf_utils import (
+    count_pdf_pages_sync, extract_text_from_pdf_sync, extract_text_from_pdf_bytes_sync, clean_pdf_text_sync,
+    strip_non_printable_text
+)
 
 logger = get_logger(__name__)
 
-# Create a cache directory for PDFs
+# Cache directory for PDFs, created on first write
 PDF_CACHE_DIR = Path("./pdf_cache")
-PDF_CACHE_DIR.mkdir(exist_ok=True)
 
-# Create a directory for proxied PDFs
+# Directory for proxied PDFs, created on first write
 PROXIED_PDF_DIR = Path("./static/proxied_pdfs")
-PROXIED_PDF_DIR.mkdir(parents=True, exist_ok=True)
 
-async def read_pdf_file_to_bytes(file_path: str) -> bytes:
+# Subdirectory of a cache holding one hard link per distinct PDF content
+CONTENT_DIR_NAME = "by_content"
+
+# Size of the chunks streamed from the network to the PDF cache
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Cached files at or below this size are treated as broken downloads
+MIN_CACHED_PDF_SIZE = 1024
+
+# Cached PDFs older than this are revalidated with the server before use
+PDF_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# PDFs at least this large are fetched as parallel byte ranges when the server supports it
+PDF_SEGMENTED_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+PDF_DOWNLOAD_SEGMENTS = 4
+
+# In-flight downloads by cache key, so concurrent requests for the same PDF share one download
+_inflight_downloads: Dict[str, asyncio.Task] = {}
+
+# In-flight proxies by filename, so concurrent proxy requests for the same PDF publish it once
+_inflight_proxies: Dict[str, asyncio.Task] = {}
+
+# Bound concurrent downloads and retry rate-limited ones with exponential backoff
+_download_semaphore = asyncio.Semaphore(PDF_DOWNLOAD_CONCURRENCY)
+PDF_DOWNLOAD_MAX_RETRIES = 3
+PDF_DOWNLOAD_RETRY_BASE_DELAY = 1.0
+# Upper bound on a server-requested Retry-After wait, so one host can't stall a download indefinitely
+PDF_DOWNLOAD_MAX_RETRY_AFTER = 60.0
+_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+
+# Shared HTTP client so PDF downloads reuse pooled keep-alive connections
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=100)
+)
+
+
+# arXiv identifiers, abstract URLs and PDF URLs, with optional version and .pdf suffix
+_ARXIV_URL_RE = re.compile(
+    r'^(?:arxiv:|https?://(?:www\.|export\.)?arxiv\.org/(?:abs|pdf)/)'
+    r'(?P<id>\d{4}\.\d{4,5}|[a-z][a-z.-]*/\d{7})(?:v\d+)?(?:\.pdf)?/?(?:[?#].*)?$',
+    re.IGNORECASE
+)
+
+# Recently read PDFs stay mapped, keyed by path and validated against the file's inode and mtime
+PDF_MMAP_CACHE_SIZE = 32
+_mmap_cache: "OrderedDict[str, Tuple[Tuple[int, int], mmap.mmap]]" = OrderedDict()
+
+# Recently extracted text, keyed by the BLAKE2b digest of the PDF content and bounded by total characters
+PDF_TEXT_CACHE_MAX_CHARS = 128 * 1024 * 1024
+_text_cache: "OrderedDict[str, str]" = OrderedDict()
+_text_cache_chars = 0
+
+# PDFs at least this large are split into page ranges extracted by several workers at once
+PDF_PARALLEL_EXTRACTION_MIN_SIZE = 2 * 1024 * 1024
+PDF_PAGES_PER_EXTRACTION_TASK = 16
+
+# Worker processes for CPU-bound PDF text extraction, created on first use
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """
+    Return the process pool used for PDF text extraction, creating it if needed.
+    
+    Returns:
+        The shared ProcessPoolExecutor
+    """
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=PDF_EXTRACTION_WORKERS)
+    return _pdf_pool
+
+def shutdown_pdf_pool() -> None:
+    """
+    Shut down the PDF text extraction process pool if it was started.
+    
+    Should be called once on application shutdown.
+    """
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+def _sanitize_text(text: str) -> str:
+    """
+    Clean extracted PDF text and strip characters the database can't store.
+    
+    Args:
+        text: The raw extracted text
+        
+    Returns:
+        The cleaned, sanitized text
+    """
+    text = clean_pdf_text_sync(text)
+    
+    # Additional sanitization to ensure database compatibility
+    # Remove any remaining problematic characters
+    return strip_non_printable_text(text)
+
+def _extract_clean_text_sync(pdf_path: str) -> str:
+    """
+    Extract, clean and sanitize the text of a PDF file.
+    
+    Runs in a worker process, so it must stay a picklable top-level function.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        The sanitized text of the PDF
+    """
+    return _sanitize_text(extract_text_from_pdf_sync(pdf_path))
+
+def _extract_clean_text_from_bytes_sync(file_content: bytes) -> str:
+    """
+    Extract, clean and sanitize the text of in-memory PDF content.
+    
+    Runs in a worker process, so it must stay a picklable top-level function.
+    
+    Args:
+        file_content: The binary content of the PDF file
+        
+    Returns:
+        The sanitized text of the PDF
+    """
+    return _sanitize_text(extract_text_from_pdf_bytes_sync(file_content))
+
+def _page_ranges(page_count: int, workers: int) -> List[Tuple[int, int]]:
+    """
+    Split a document's pages into contiguous ranges for parallel extraction.
+    
+    Args:
+        page_count: The number of pages
+        workers: The number of worker processes available
+        
+    Returns:
+        (start, stop) page index ranges covering every page in order
+    """
+    tasks = min(workers, -(-page_count // PDF_PAGES_PER_EXTRACTION_TASK))
+    if tasks <= 1:
+        return [(0, page_count)]
+    step = -(-page_count // tasks)
+    return [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+async def _extract_text_in_pool(pdf_path: str) -> str:
+    """
+    Extract the sanitized text of a PDF file in the process pool.
+    
+    Large PDFs are split into page ranges extracted by several workers at once.
+    PyMuPDF isn't thread-safe, so pages are spread over processes, not threads.
+    The ranges are joined before cleaning, so the result is the same as
+    extracting the whole document in one worker.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        The sanitized text of the PDF
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    
+    if PDF_EXTRACTION_WORKERS > 1:
+        size = (await asyncio.to_thread(os.stat, pdf_path)).st_size
+        if size >= PDF_PARALLEL_EXTRACTION_MIN_SIZE:
+            page_count = await loop.run_in_executor(pool, count_pdf_pages_sync, pdf_path)
+            ranges = _page_ranges(page_count, PDF_EXTRACTION_WORKERS)
+            if len(ranges) > 1:
+                logger.info(f"Extracting {page_count} pages of {pdf_path} in {len(ranges)} workers")
+                range_texts = await asyncio.gather(*(
+                    loop.run_in_executor(pool, extract_text_from_pdf_sync, pdf_path, start, stop)
+                    for start, stop in ranges
+                ))
+                return await loop.run_in_executor(pool, _sanitize_text, "\n".join(range_texts))
+    
+    return await loop.run_in_executor(pool, _extract_clean_text_sync, pdf_path)
+
+async def _extract_bytes_text_in_pool(file_content: Union[bytes, memoryview]) -> str:
+    """
+    Extract the sanitized text of in-memory PDF content in the process pool.
+    
+    Args:
+        file_content: The binary content of the PDF file
+        
+    Returns:
+        The sanitized text of the PDF
+    """
+    # Views (e.g. of a memory-mapped file) can't be sent to another process
+    if not isinstance(file_content, bytes):
+        file_content = bytes(file_content)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_pdf_pool(), _extract_clean_text_from_bytes_sync, file_content)
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client used for PDF downloads.
+    
+    Should be called once on application shutdown.
+    """
+    await _client.aclose()
+
+def _remove_orphaned_content(path: Path) -> None:
+    """
+    Delete content links that no cached PDF shares any more.
+    
+    A link count of 1 means every cache entry that pointed at the content has
+    since been replaced or evicted, so the by_content/ name is the last copy.
+    
+    Args:
+        path: The by_content/ directory to clean up
+    """
+    for content_path in path.glob("*.pdf"):
+        try:
+            if content_path.stat().st_nlink == 1:
+                content_path.unlink()
+                logger.info(f"Removed orphaned content link {content_path}")
+        except FileNotFoundError:
+            pass
+
+def _canonicalize(url_or_id: str) -> str:
+    """
+    Map every way of referring to an arXiv paper to a single PDF URL.
+    
+    "arxiv:1234.5678", "https://arxiv.org/abs/1234.5678v2" and
+    "https://arxiv.org/pdf/1234.5678.pdf" all become
+    "https://arxiv.org/pdf/1234.5678.pdf", so they share one cache entry.
+    Other URLs are returned unchanged.
+    
+    Args:
+        url_or_id: A URL or an "arxiv:"-prefixed arXiv ID
+        
+    Returns:
+        The canonical URL
+    """
+    match = _ARXIV_URL_RE.match(url_or_id.strip())
+    if not match:
+        return url_or_id
+    return f'https://arxiv.org/pdf/{match.group("id")}.pdf'
+
+def _cache_key(url: str) -> str:
+    """
+    Build the cache filename key for a URL.
+    
+    Args:
+        url: The URL of the PDF
+        
+    Returns:
+        A 32-character hex BLAKE2b digest of the URL
+    """
+    return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+def _legacy_cache_key(url: str) -> str:
+    """
+    Build the MD5 cache filename key used by earlier versions.
+    
+    Args:
+        url: The URL of the PDF
+        
+    Returns:
+        The hex MD5 digest of the URL
+    """
+    return hashlib.md5(url.encode()).hexdigest()
+
+def _cached_pdf_stat(cache_path: Path) -> Optional[os.stat_result]:
+    """
+    Stat a cached PDF once, ignoring truncated leftovers.
+    
+    Args:
+        cache_path: The path of the cached PDF
+        
+    Returns:
+        The stat result if the file exists and is larger than MIN_CACHED_PDF_SIZE, otherwise None
+    """
+    try:
+        stat = os.stat(cache_path)
+    except FileNotFoundError:
+        return None
+    return stat if stat.st_size > MIN_CACHED_PDF_SIZE else None
+
+def _find_cached_pdf(url: str, cache_path: Path) -> Optional[os.stat_result]:
+    """
+    Look up a usable cached PDF for a URL.
+    
+    PDFs cached under their legacy MD5 filename are moved to the current
+    filename so existing caches stay valid.
+    
+    Args:
+        url: The URL of the PDF
+        cache_path: The current cache path for the URL
+        
+    Returns:
+        The stat result of the PDF now at cache_path, or None if there is none
+    """
+    stat = _cached_pdf_stat(cache_path)
+    if stat is not None:
+        return stat
+    
+    legacy_path = cache_path.with_name(f"{_legacy_cache_key(url)}.pdf")
+    if _cached_pdf_stat(legacy_path) is None:
+        return None
+    
+    try:
+        os.replace(legacy_path, cache_path)
+    except FileNotFoundError:
+        # Another request migrated it first
+        pass
+    return _cached_pdf_stat(cache_path)
+
+def _content_digest() -> Any:
+    """
+    Create the hash object used to address cached PDFs by content.
+    
+    Returns:
+        A 128-bit BLAKE2b hash object
+    """
+    return hashlib.blake2b(digest_size=16)
+
+def _hash_content(content: Union[bytes, memoryview]) -> str:
+    """
+    Hash PDF content held in memory.
+    
+    Args:
+        content: The PDF content
+        
+    Returns:
+        The hex digest of the content
     """
-    Read a PDF file into bytes.
+    digest = _content_digest()
+    digest.update(content)
+    return digest.hexdigest()
+
+def _get_cached_text(content_hash: str) -> Optional[str]:
+    """
+    Look up text previously extracted from a PDF with the given content.
+    
+    Args:
+        content_hash: The hex digest of the PDF content
+        
+    Returns:
+        The cached text, or None if it isn't cached
+    """
+    text = _text_cache.get(content_hash)
+    if text is not None:
+        _text_cache.move_to_end(content_hash)
+    return text
+
+def _cache_text(content_hash: str, text: str) -> None:
+    """
+    Remember the text extracted from a PDF, evicting the least recently used entries.
+    
+    Args:
+        content_hash: The hex digest of the PDF content
+        text: The extracted text
+    """
+    global _text_cache_chars
+    if len(text) > PDF_TEXT_CACHE_MAX_CHARS:
+        return
+    
+    previous = _text_cache.pop(content_hash, None)
+    if previous is not None:
+        _text_cache_chars -= len(previous)
+    _text_cache[content_hash] = text
+    _text_cache_chars += len(text)
+    
+    while _text_cache_chars > PDF_TEXT_CACHE_MAX_CHARS:
+        _, evicted = _text_cache.popitem(last=False)
+        _text_cache_chars -= len(evicted)
+
+def _hash_file(path: Path) -> str:
+    """
+    Hash a file's content in chunks.
+    
+    Args:
+        path: The file to hash
+        
+    Returns:
+        The hex digest of the file content
+    """
+    digest = _content_digest()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(PDF_DOWNLOAD_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _link_by_content(cache_path: Path, content_hash: str) -> None:
+    """
+    Share one copy on disk between cached PDFs with identical content.
+    
+    The first PDF with a given content is hard-linked into by_content/; later
+    identical downloads are replaced by a hard link to that file. Cache files
+    are only ever replaced, never rewritten in place, so linked copies can't
+    change underneath each other.
+    
+    Args:
+        cache_path: The freshly downloaded PDF
+        content_hash: The hex digest of its content
+    """
+    content_dir = cache_path.parent / CONTENT_DIR_NAME
+    ensure_cache_dir(content_dir, _remove_orphaned_content)
+    content_path = content_dir / f"{content_hash}.pdf"
+    
+    try:
+        os.link(cache_path, content_path)
+        return
+    except FileExistsError:
+        pass
+    except OSError as e:
+        # Hard links aren't supported everywhere; keep the plain copy
+        logger.warning(f"Could not link {cache_path} by content: {str(e)}")
+        return
+    
+    link_path = part_path(cache_path)
+    try:
+        os.link(content_path, link_path)
+        os.replace(link_path, cache_path)
+        logger.info(f"Deduplicated {cache_path} against {content_path}")
+    except OSError as e:
+        logger.warning(f"Could not deduplicate {cache_path}: {str(e)}")
+        link_path.unlink(missing_ok=True)
+
+def _publish_cached_pdf(cache_path: Path, dest_path: Path) -> None:
+    """
+    Make a cached PDF available at another path without copying it.
+    
+    The destination is a hard link to the cached file, so both names share one
+    copy on disk and in the page cache. If hard links aren't supported the file
+    is copied instead.
+    
+    Args:
+        cache_path: The cached PDF
+        dest_path: The path to publish it at
+    """
+    ensure_cache_dir(dest_path.parent)
+    tmp_path = part_path(dest_path)
+    try:
+        try:
+            os.link(cache_path, tmp_path)
+        except OSError as e:
+            logger.warning(f"Could not link {dest_path} to {cache_path}, copying instead: {str(e)}")
+            shutil.copyfile(cache_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def _close_mmap(mapping: mmap.mmap) -> None:
+    """
+    Close an evicted mapping unless callers still hold views of it.
+    
+    Args:
+        mapping: The mapping to close
+    """
+    try:
+        mapping.close()
+    except BufferError:
+        # Still exported through a memoryview; it is unmapped once the views are released
+        pass
+
+def _get_or_mmap(file_path: str) -> Optional[mmap.mmap]:
+    """
+    Return a read-only mapping of a file, reusing a cached one if the file is unchanged.
+    
+    Args:
+        file_path: The path to the file
+        
+    Returns:
+        The mapping, or None if the file is empty and can't be mapped
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    with open(file_path, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        version = (stat.st_ino, stat.st_mtime_ns)
+        
+        cached = _mmap_cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            _mmap_cache.move_to_end(file_path)
+            return cached[1]
+        
+        if stat.st_size == 0:
+            return None
+        
+        # The mapping stays valid after the file is closed
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    if cached is not None:
+        _close_mmap(cached[1])
+    _mmap_cache[file_path] = (version, mapping)
+    _mmap_cache.move_to_end(file_path)
+    while len(_mmap_cache) > PDF_MMAP_CACHE_SIZE:
+        _, (_, evicted) = _mmap_cache.popitem(last=False)
+        _close_mmap(evicted)
+    return mapping
+
+def read_pdf_file_to_bytes(file_path: str) -> memoryview:
+    """
+    Map a PDF file into memory.
+    
+    The file is memory-mapped read-only, so pages are loaded on demand by the
+    kernel instead of being copied into a Python bytes object. The most
+    recently read PDFs stay mapped, so reading one again costs a single stat.
     
     Args:
         file_path: The path to the PDF file
         
     Returns:
-        The binary content of the PDF file
+        A read-only view of the binary content of the PDF file
         
     Raises:
         FileNotFoundError: If the file doesn't exist
@@ -41,9 +553,9 @@ async def read_pdf_file_to_bytes(file_path: str) -> bytes:
     """
     try:
         logger.info(f"Reading PDF file: {file_path}")
-        with open(file_path, 'rb') as f:
-            content = f.read()
-        return content
+        mapping = _get_or_mmap(file_path)
+        # Empty files can't be mapped
+        return memoryview(mapping) if mapping is not None else memoryview(b"")
     except FileNotFoundError:
         logger.error(f"PDF file not found: {file_path}")
         raise
@@ -51,61 +563,490 @@ async def read_pdf_file_to_bytes(file_path: str) -> bytes:
         logger.error(f"Error reading PDF file {file_path}: {str(e)}")
         raise
 
-async def download_pdf(url: str, force_download: bool = False) -> Tuple[str, bool]:
+async def _read_cache_validators(meta_path: Path) -> Dict[str, str]:
     """
-    Download a PDF from any URL and cache it locally.
+    Read the HTTP validators stored alongside a cached PDF.
+    
+    Args:
+        meta_path: The path of the sidecar metadata file
+        
+    Returns:
+        The stored "etag" and "last_modified" values, or an empty dict if there are none
+    """
+    try:
+        async with aiofiles.open(meta_path, 'rb') as f:
+            return orjson.loads(await f.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable PDF cache metadata {meta_path}: {str(e)}")
+        return {}
+
+async def _write_cache_validators(meta_path: Path, validators: Dict[str, str]) -> None:
+    """
+    Store the HTTP validators for a cached PDF, or remove stale ones.
+    
+    Args:
+        meta_path: The path of the sidecar metadata file
+        validators: The "etag" and "last_modified" values of the response
+    """
+    if not validators:
+        await asyncio.to_thread(meta_path.unlink, missing_ok=True)
+        return
+    
+    tmp_path = part_path(meta_path)
+    try:
+        async with aiofiles.open(tmp_path, 'wb') as f:
+            await f.write(orjson.dumps(validators))
+        os.replace(tmp_path, meta_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def _response_validators(headers: httpx.Headers) -> Dict[str, str]:
+    """
+    Pick the cache validators out of response headers.
+    
+    Args:
+        headers: The response headers
+        
+    Returns:
+        The "etag" and "last_modified" values that are present
+    """
+    validators = {
+        "etag": headers.get("etag"),
+        "last_modified": headers.get("last-modified")
+    }
+    return {key: value for key, value in validators.items() if value}
+
+def _conditional_headers(validators: Dict[str, str]) -> Dict[str, str]:
+    """
+    Build conditional request headers from stored validators.
+    
+    Args:
+        validators: The stored "etag" and "last_modified" values
+        
+    Returns:
+        If-None-Match / If-Modified-Since headers for the values that are present
+    """
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+def _is_pdf_response(url: str, content_type: str) -> bool:
+    """
+    Check whether a response content type is acceptable for a PDF URL.
+    
+    Args:
+        url: The URL of the PDF
+        content_type: The lower-cased Content-Type header of the response
+        
+    Returns:
+        True if the response can be treated as a PDF
+    """
+    return 'application/pdf' in content_type or url.endswith('.pdf') or '/storage/v1/object/public/' in url
+
+async def preflight_pdf_url(url: str) -> Tuple[int, str, bool]:
+    """
+    Look up the size and type of a PDF with a HEAD request.
+    
+    Servers that reject HEAD or fail to answer it are treated as unknown, and
+    the GET request decides.
+    
+    Args:
+        url: The URL to the PDF
+        
+    Returns:
+        Tuple of the Content-Length (0 if unknown), the lower-cased Content-Type
+        ("" if unknown) and whether the server accepts byte range requests
+    """
+    return _describe_head(await _head_pdf(url))
+
+async def _head_pdf(url: str) -> Optional[httpx.Headers]:
+    """
+    Send a HEAD request for a PDF.
+    
+    Args:
+        url: The URL to the PDF
+        
+    Returns:
+        The response headers, or None if the request failed or wasn't answered with 200
+    """
+    try:
+        response = await _client.head(url, follow_redirects=True)
+    except httpx.HTTPError as e:
+        logger.warning(f"HEAD preflight for {url} failed: {str(e)}")
+        return None
+    
+    if response.status_code != 200:
+        return None
+    return response.headers
+
+def _describe_head(headers: Optional[httpx.Headers]) -> Tuple[int, str, bool]:
+    """
+    Read the size, type and range support from HEAD response headers.
+    
+    Args:
+        headers: The HEAD response headers, or None if there was no usable response
+        
+    Returns:
+        Tuple of the Content-Length (0 if unknown), the lower-cased Content-Type
+        ("" if unknown) and whether the server accepts byte range requests
+    """
+    if headers is None:
+        return 0, "", False
+    
+    try:
+        content_length = int(headers.get('content-length', 0))
+    except ValueError:
+        content_length = 0
+    accepts_ranges = headers.get('accept-ranges', '').lower() == 'bytes'
+    return content_length, headers.get('content-type', '').lower(), accepts_ranges
+
+def _unchanged_since_cached(headers: Optional[httpx.Headers], stat: os.stat_result) -> bool:
+    """
+    Decide from HEAD response headers whether a cached PDF without validators is still current.
+    
+    The cached copy is current if the server reports the same size and a
+    Last-Modified time no later than when the copy was written.
+    
+    Args:
+        headers: The HEAD response headers, or None if there was no usable response
+        stat: The stat result of the cached PDF
+        
+    Returns:
+        True if the cached PDF can be kept without downloading it again
+    """
+    if headers is None or not headers.get("last-modified"):
+        return False
+    
+    content_length, _, _ = _describe_head(headers)
+    if content_length != stat.st_size:
+        return False
+    
+    try:
+        last_modified = parsedate_to_datetime(headers["last-modified"]).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return last_modified <= stat.st_mtime
+
+async def _download_segment(url: str, fd: int, start: int, end: int) -> Optional[httpx.Headers]:
+    """
+    Download one byte range of a PDF and write it at its offset in a file.
     
     Args:
         url: The URL to the PDF
+        fd: The file descriptor to write to
+        start: The first byte of the range
+        end: The last byte of the range, inclusive
+        
+    Returns:
+        The response headers, or None if the server didn't honour the range
+        
+    Raises:
+        PDFDownloadError: If the segment is incomplete
+    """
+    async with _client.stream(
+        "GET", url, headers={"Range": f"bytes={start}-{end}"}, follow_redirects=True
+    ) as response:
+        if response.status_code != 206:
+            return None
+        
+        offset = start
+        async for chunk in response.aiter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+            await asyncio.to_thread(os.pwrite, fd, chunk, offset)
+            offset += len(chunk)
+        
+        if offset != end + 1:
+            raise PDFDownloadError(f"Incomplete segment bytes={start}-{end}: got {offset - start} bytes")
+        return response.headers
+
+async def _segmented_download(
+    url: str,
+    size: int,
+    dest_path: Path,
+    n_parts: int = PDF_DOWNLOAD_SEGMENTS
+) -> Optional[Dict[str, str]]:
+    """
+    Download a PDF as parallel byte ranges, bounded by the download semaphore.
+    
+    Args:
+        url: The URL to the PDF
+        size: The size of the PDF in bytes
+        dest_path: The file to write the PDF to
+        n_parts: The number of ranges to request concurrently
+        
+    Returns:
+        The response's "etag" and "last_modified" validators that are present,
+        or None if the server didn't honour the ranges and a single-stream
+        download is needed
+        
+    Raises:
+        PDFDownloadError: If a segment fails
+    """
+    part_size = -(-size // n_parts)
+    ranges = [(start, min(start + part_size, size) - 1) for start in range(0, size, part_size)]
+    
+    async with _download_semaphore:
+        fd = await asyncio.to_thread(os.open, dest_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            tasks = [asyncio.ensure_future(_download_segment(url, fd, start, end)) for start, end in ranges]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+        finally:
+            os.close(fd)
+    
+    if any(headers is None for headers in results):
+        logger.info(f"Server ignored byte ranges for {url}, falling back to a single download")
+        return None
+    
+    return _response_validators(results[0])
+
+def _retry_delay(headers: httpx.Headers, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a rate-limited download.
+    
+    Args:
+        headers: Headers of the 429 or 503 response
+        attempt: Zero-based number of the attempt that was refused
+        
+    Returns:
+        The Retry-After delay in seconds, capped at PDF_DOWNLOAD_MAX_RETRY_AFTER,
+        or an exponential backoff if the header is missing or malformed
+    """
+    retry_after = headers.get("retry-after", "").strip()
+    if retry_after:
+        try:
+            # Either a number of seconds or an HTTP date
+            delay = float(retry_after) if retry_after.isdigit() else (
+                parsedate_to_datetime(retry_after).timestamp() - time.time()
+            )
+            return min(max(delay, 0.0), PDF_DOWNLOAD_MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            pass
+    return PDF_DOWNLOAD_RETRY_BASE_DELAY * (2 ** attempt)
+
+async def _stream_pdf_to_file(
+    url: str,
+    dest_path: Path,
+    headers: Optional[Dict[str, str]] = None,
+    expected_size: int = 0,
+    digest: Optional[Any] = None
+) -> Optional[Dict[str, str]]:
+    """
+    Stream a PDF from a URL into a file, bounded by the download semaphore.
+    
+    Rate-limited (429) and unavailable (503) responses are retried after the
+    server's Retry-After delay, or with exponential backoff when it sends none.
+    
+    Args:
+        url: The URL to the PDF
+        dest_path: The file to write the PDF to
+        headers: Optional extra request headers, e.g. conditional request headers
+        expected_size: Optional size in bytes to preallocate for the file
+        digest: Optional hashlib object updated with the body as it is written
+        
+    Returns:
+        The response's "etag" and "last_modified" validators that are present,
+        or None if the server answered 304 Not Modified and nothing was written
+        
+    Raises:
+        PDFDownloadError: If the download fails
+        InvalidPDFUrlError: If the URL doesn't point to a PDF
+    """
+    for attempt in range(PDF_DOWNLOAD_MAX_RETRIES + 1):
+        # Hold a download slot only for the request itself, never while backing off
+        async with _download_semaphore:
+            async with _client.stream("GET", url, headers=headers, follow_redirects=True) as response:
+                if response.status_code not in _RETRYABLE_STATUS_CODES or attempt == PDF_DOWNLOAD_MAX_RETRIES:
+                    if response.status_code == 304 and headers:
+                        return None
+                    
+                    if response.status_code != 200:
+                        raise PDFDownloadError(f"Failed to download PDF: HTTP {response.status_code}")
+                    
+                    # Check content type before reading the body
+                    content_type = response.headers.get('content-type', '').lower()
+                    if not _is_pdf_response(url, content_type):
+                        raise InvalidPDFUrlError(f"URL does not point to a PDF: {url}")
+                    
+                    # Stream the PDF to disk without buffering it in memory
+                    async with aiofiles.open(dest_path, 'wb') as f:
+                        if expected_size and hasattr(os, 'posix_fallocate'):
+                            # Reserve the blocks up front to avoid fragmenting the file
+                            await asyncio.to_thread(os.posix_fallocate, f.fileno(), 0, expected_size)
+                        async for chunk in response.aiter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+                            if digest is not None:
+                                digest.update(chunk)
+                            await f.write(chunk)
+                        # Drop any preallocated space the body didn't fill
+                        await f.truncate()
+                    
+                    return _response_validators(response.headers)
+                
+                delay = _retry_delay(response.headers, attempt)
+        
+        logger.warning(
+            f"PDF download from {url} returned HTTP {response.status_code}, retrying in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+
+async def download_pdf(url: str, force_download: bool = False, validate: bool = False) -> Tuple[str, bool]:
+    """
+    Download a PDF from any URL and cache it locally.
+    
+    When a cached PDF is refreshed (force_download or validate), a conditional
+    request is sent with the cached ETag / Last-Modified so an unchanged PDF
+    isn't downloaded again.
+    
+    Args:
+        url: The URL to the PDF, or an "arxiv:"-prefixed arXiv ID
         force_download: Whether to force a re-download even if the PDF is cached
+        validate: Whether to revalidate a cached PDF with the server
         
     Returns:
         Tuple containing the path to the downloaded PDF and a boolean indicating if it's a new download
         
     Raises:
         PDFDownloadError: If there's an error downloading the PDF
+        InvalidPDFUrlError: If the URL doesn't point to a PDF
     """
     try:
-        # Convert arXiv abstract URLs to PDF URLs
-        if url.startswith('https://arxiv.org/abs/'):
-            arxiv_id = url.split('https://arxiv.org/abs/')[1].split('v')[0].split('?')[0].strip()
-            url = f'https://arxiv.org/pdf/{arxiv_id}.pdf'
-            logger.info(f"Converted arXiv abstract URL to PDF URL: {url}")
+        # Use one canonical PDF URL for every form of an arXiv reference
+        canonical_url = _canonicalize(url)
+        if canonical_url != url:
+            logger.info(f"Converted arXiv URL {url} to PDF URL: {canonical_url}")
+            url = canonical_url
         
         # Generate a cache filename based on the URL
-        url_hash = hashlib.md5(url.encode()).hexdigest()
+        url_hash = _cache_key(url)
         cache_path = PDF_CACHE_DIR / f"{url_hash}.pdf"
+        refresh = force_download or validate
         
-        # Check if the file is already cached
-        if cache_path.exists() and not force_download:
+        # Check if the file is already cached, revalidating it once it is older than the TTL
+        stat = await asyncio.to_thread(_find_cached_pdf, url, cache_path)
+        if stat is not None and time.time() - stat.st_mtime > PDF_CACHE_TTL_SECONDS:
+            logger.info(f"Cached PDF for URL {url} is stale, revalidating")
+            refresh = True
+        
+        if not refresh and stat is not None:
             logger.info(f"Using cached PDF for URL: {url}")
             return str(cache_path), False
         
-        # Download the PDF
-        logger.info(f"Downloading PDF from URL: {url}")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True, timeout=60.0)
-            
-            if response.status_code != 200:
-                raise PDFDownloadError(f"Failed to download PDF: HTTP {response.status_code}")
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'application/pdf' not in content_type and not url.endswith('.pdf') and '/storage/v1/object/public/' not in url:
-                raise InvalidPDFUrlError(f"URL does not point to a PDF: {url}")
-            
-            # Save the PDF to the cache
-            with open(cache_path, 'wb') as f:
-                f.write(response.content)
-            
-            logger.info(f"Successfully downloaded PDF to {cache_path}")
-            return str(cache_path), True
+        # Join a download of the same PDF that is already in progress
+        if url_hash in _inflight_downloads:
+            logger.info(f"Waiting for in-flight download of URL: {url}")
+        result, joined = await coalesce(
+            _inflight_downloads, url_hash, lambda: _download_to_cache(url, cache_path, refresh)
+        )
+        return (result[0], False) if joined else result
             
+    except InvalidPDFUrlError:
+        raise
     except Exception as e:
         logger.error(f"Error downloading PDF from {url}: {str(e)}")
         raise PDFDownloadError(f"Error downloading PDF: {str(e)}")
 
+async def _download_to_cache(url: str, cache_path: Path, refresh: bool) -> Tuple[str, bool]:
+    """
+    Download a PDF into the cache, revalidating an existing copy when refreshing.
+    
+    Args:
+        url: The URL to the PDF
+        cache_path: The cache path for the URL
+        refresh: Whether to refresh a PDF that is already cached
+        
+    Returns:
+        Tuple containing the path to the cached PDF and a boolean indicating if it was downloaded
+        
+    Raises:
+        PDFDownloadError: If the download fails
+        InvalidPDFUrlError: If the URL doesn't point to a PDF
+    """
+    meta_path = cache_path.with_suffix(".meta.json")
+    cached_stat = await asyncio.to_thread(_find_cached_pdf, url, cache_path)
+    is_cached = cached_stat is not None
+    
+    # Another request may have finished downloading in the meantime
+    if not refresh and is_cached:
+        logger.info(f"Using cached PDF for URL: {url}")
+        return str(cache_path), False
+    
+    # Revalidate an existing copy instead of downloading it unconditionally
+    headers = _conditional_headers(await _read_cache_validators(meta_path)) if is_cached else {}
+    
+    # Check the size and type before downloading a body, unless a 304 may spare us one
+    expected_size, accepts_ranges = 0, False
+    if not headers:
+        head = await _head_pdf(url)
+        expected_size, content_type, accepts_ranges = _describe_head(head)
+        if content_type and not _is_pdf_response(url, content_type):
+            raise InvalidPDFUrlError(f"URL does not point to a PDF: {url}")
+        
+        # Without stored validators, the HEAD response can still show the copy is current
+        if is_cached and _unchanged_since_cached(head, cached_stat):
+            logger.info(f"Cached PDF matches the server's size and modification time for URL: {url}")
+            await asyncio.to_thread(os.utime, cache_path)
+            # Keep the validators so the next refresh can be a conditional GET
+            await _write_cache_validators(meta_path, _response_validators(head))
+            return str(cache_path), False
+    
+    # Download the PDF
+    logger.info(f"Downloading PDF from URL: {url}")
+    
+    # Write to a temporary file and rename it into place once complete,
+    # so an interrupted download never leaves a truncated PDF in the cache
+    await ensure_cache_dir_async(cache_path.parent)
+    tmp_path = part_path(cache_path)
+    try:
+        validators, digest = None, None
+        if accepts_ranges and expected_size >= PDF_SEGMENTED_DOWNLOAD_MIN_SIZE and hasattr(os, 'pwrite'):
+            validators = await _segmented_download(url, expected_size, tmp_path)
+        
+        if validators is None:
+            digest = _content_digest()
+            validators = await _stream_pdf_to_file(
+                url, tmp_path, headers=headers or None, expected_size=expected_size, digest=digest
+            )
+            if validators is None:
+                logger.info(f"Cached PDF is still current for URL: {url}")
+                # Restart the TTL so the next lookup doesn't revalidate again
+                await asyncio.to_thread(os.utime, cache_path)
+                return str(cache_path), False
+        
+        os.replace(tmp_path, cache_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    
+    # Segmented downloads arrive out of order, so hash the finished file instead
+    content_hash = digest.hexdigest() if digest is not None else await asyncio.to_thread(_hash_file, cache_path)
+    await asyncio.to_thread(_link_by_content, cache_path, content_hash)
+    await _write_cache_validators(meta_path, validators)
+    
+    logger.info(f"Successfully downloaded PDF to {cache_path}")
+    return str(cache_path), True
+
+async def download_pdfs(urls: List[str]) -> List[Union[Tuple[str, bool], Exception]]:
+    """
+    Download several PDFs concurrently.
+    
+    Concurrency is bounded by PDF_DOWNLOAD_CONCURRENCY.
+    
+    Args:
+        urls: The URLs to the PDFs
+        
+    Returns:
+        For each URL, the result of download_pdf or the exception it raised
+    """
+    return await asyncio.gather(*(download_pdf(url) for url in urls), return_exceptions=True)
+
 async def get_paper_pdf(paper_id: UUID) -> Optional[str]:
     """
     Get the PDF for a paper by its ID.
@@ -132,17 +1073,17 @@ async def get_paper_pdf(paper_id: UUID) -> Optional[str]:
             logger.warning(f"Paper with ID {paper_id} doesn't have a source URL")
             return None
         
-        # For arXiv papers, convert abstract URL to PDF URL if needed
+        # download_pdf converts arXiv abstract URLs to PDF URLs; for one it can't
+        # parse, fall back to the arXiv ID stored with the paper
         source_type = paper.get("source_type", SourceType.PDF)
-        if source_type == SourceType.ARXIV and 'arxiv.org/abs/' in source_url:
-            # Extract arXiv ID and convert to PDF URL
-            from app.services.url_service import extract_paper_id_from_url
-            paper_ids = await extract_paper_id_from_url(source_url)
-            arxiv_id = paper_ids.get('arxiv_id') or paper.get("arxiv_id")
-            
-            if arxiv_id:
-                source_url = f'https://arxiv.org/pdf/{arxiv_id}.pdf'
-                logger.info(f"Converted arXiv abstract URL to PDF URL: {source_url}")
+        if (
+            source_type == SourceType.ARXIV
+            and 'arxiv.org/abs/' in source_url
+            and _canonicalize(source_url) == source_url
+            and paper.get("arxiv_id")
+        ):
+            source_url = f'https://arxiv.org/pdf/{paper["arxiv_id"]}.pdf'
+            logger.info(f"Converted arXiv abstract URL to PDF URL: {source_url}")
         
         # Download the PDF
         pdf_path, _ = await download_pdf(source_url)
@@ -152,15 +1093,146 @@ async def get_paper_pdf(paper_id: UUID) -> Optional[str]:
         logger.error(f"Error getting PDF for paper with ID {paper_id}: {str(e)}")
         raise PDFDownloadError(f"Error getting PDF for paper with ID {paper_id}: {str(e)}")
 
+async def get_paper_pdf_bytes(paper_id: UUID) -> Optional[memoryview]:
+    """
+    Get the content of a paper's PDF as a memory-mapped view.
+    
+    Args:
+        paper_id: The UUID of the paper
+        
+    Returns:
+        A read-only view of the PDF content, or None if the paper doesn't exist
+        
+    Raises:
+        PDFDownloadError: If there's an error downloading the PDF
+    """
+    pdf_path = await get_paper_pdf(paper_id)
+    if pdf_path is None:
+        return None
+    return read_pdf_file_to_bytes(pdf_path)
+
+async def get_paper_pdfs(paper_ids: List[UUID]) -> List[Union[Optional[str], Exception]]:
+    """
+    Get the PDFs for several papers concurrently.
+    
+    Args:
+        paper_ids: The UUIDs of the papers
+        
+    Returns:
+        For each paper, the result of get_paper_pdf or the exception it raised
+    """
+    return await asyncio.gather(*(get_paper_pdf(paper_id) for paper_id in paper_ids), return_exceptions=True)
+
+async def _read_cached_text(txt_path: Path, content_hash: str) -> Optional[str]:
+    """
+    Read the text previously extracted from a PDF if it is still current.
+    
+    The sidecar is keyed on the PDF's content rather than its modification
+    time, since revalidating a cached PDF touches it without changing it.
+    
+    Args:
+        txt_path: The path of the cached text
+        content_hash: The content hash of the PDF the text is wanted for
+        
+    Returns:
+        The cached text, or None if there is none or it was extracted from other content
+    """
+    try:
+        # newline='' so carriage returns in the text come back exactly as extracted
+        async with aiofiles.open(txt_path, 'r', encoding='utf-8', newline='') as f:
+            stored_hash, _, text = (await f.read()).partition("\n")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Ignoring unreadable cached text {txt_path}: {str(e)}")
+        return None
+    
+    return text if stored_hash == content_hash else None
+
+async def _write_cached_text(txt_path: Path, content_hash: str, text: str) -> None:
+    """
+    Store the text extracted from a PDF next to it.
+    
+    Args:
+        txt_path: The path of the cached text
+        content_hash: The content hash of the PDF the text was extracted from
+        text: The extracted text
+    """
+    tmp_path = part_path(txt_path)
+    try:
+        async with aiofiles.open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            await f.write(f"{content_hash}\n")
+            await f.write(text)
+        os.replace(tmp_path, txt_path)
+    except OSError as e:
+        logger.warning(f"Could not cache extracted text at {txt_path}: {str(e)}")
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+async def extract_text_from_pdf(pdf_path: str) -> str:
+    """
+    Extract and clean the text of a PDF on disk, e.g. one in the PDF cache.
+    
+    The file is left in place. Recently extracted text is kept in memory keyed
+    by PDF content, and the text is also cached next to the PDF and reused
+    until the PDF changes.
+    
+    Args:
+        pdf_path: The path to the PDF file
+        
+    Returns:
+        The cleaned text of the PDF
+        
+    Raises:
+        PDFExtractionError: If the text cannot be extracted
+    """
+    # Reuse text extracted from a PDF with the same content in this process
+    content_hash = await asyncio.to_thread(_hash_content, read_pdf_file_to_bytes(pdf_path))
+    text = _get_cached_text(content_hash)
+    if text is not None:
+        logger.info(f"Using in-memory cached text for PDF {pdf_path}")
+        return text
+    
+    # Reuse text extracted from this version of the PDF
+    txt_path = Path(pdf_path).with_suffix(".txt")
+    text = await _read_cached_text(txt_path, content_hash)
+    if text is not None:
+        logger.info(f"Using cached text for PDF {pdf_path}")
+        _cache_text(content_hash, text)
+        return text
+    
+    # Extract and clean text with PyMuPDF in a worker process
+    text = await _extract_text_in_pool(pdf_path)
+    await _write_cached_text(txt_path, content_hash, text)
+    _cache_text(content_hash, text)
+    return text
+
+async def extract_texts_from_pdfs(pdf_paths: List[str]) -> List[Union[str, Exception]]:
+    """
+    Extract the text of several PDFs on disk concurrently.
+    
+    The PDFs are parsed in parallel across the extraction worker processes,
+    bounded by PDF_EXTRACTION_WORKERS.
+    
+    Args:
+        pdf_paths: The paths to the PDF files
+        
+    Returns:
+        For each PDF, the result of extract_text_from_pdf or the exception it raised
+    """
+    return await asyncio.gather(*(extract_text_from_pdf(pdf_path) for pdf_path in pdf_paths), return_exceptions=True)
+
 async def download_and_process_paper(source_url: str, paper_id: Optional[UUID] = None, source_type: str = SourceType.ARXIV) -> str:
     """
     Download and extract text from a paper.
     
     This function:
     1. Downloads the PDF from the source URL
-    2. Extracts text from the PDF using PyPDF2
+    2. Extracts text from the PDF using PyMuPDF
     3. Cleans the extracted text
     
+    Extracted text is cached as described in extract_text_from_pdf.
+    
     Args:
         source_url: The URL to the paper
         paper_id: Optional UUID of the paper in the database
@@ -178,16 +1250,9 @@ async def download_and_process_paper(source_url: str, paper_id: Optional[UUID] =
         # Download PDF
         pdf_path, is_new = await download_pdf(source_url)
         
-        # Extract text from PDF using PyPDF2
+        # Extract the text, reusing a previous extraction where possible
         text = await extract_text_from_pdf(pdf_path)
         
-        # Clean text
-        text = await clean_pdf_text(text)
-        
-        # Additional sanitization to ensure database compatibility
-        # Remove any remaining problematic characters
-        text = re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
-        
         logger.info(f"Successfully extracted and sanitized text from PDF")
         
         return text
@@ -196,7 +1261,7 @@ async def download_and_process_paper(source_url: str, paper_id: Optional[UUID] =
         logger.error(f"Error processing PDF for source {source_url}: {str(e)}")
         raise PDFDownloadError(f"Error processing PDF: {str(e)}")
 
-async def extract_text_from_pdf_bytes(file_content: bytes) -> str:
+async def extract_text_from_pdf_bytes(file_content: Union[bytes, memoryview]) -> str:
     """
     Extract text directly from PDF bytes without saving to disk first.
     
@@ -212,20 +1277,16 @@ async def extract_text_from_pdf_bytes(file_content: bytes) -> str:
     try:
         logger.info("Extracting text from PDF bytes")
         
-        # Create a temporary file to store the PDF content
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(file_content)
-            temp_path = temp_file.name
-        
-        # Extract text from the temporary file
-        text = await extract_text_from_pdf(temp_path)
-        
-        # Clean text
-        text = await clean_pdf_text(text)
+        # Reuse text extracted from a PDF with the same content in this process
+        content_hash = await asyncio.to_thread(_hash_content, file_content)
+        text = _get_cached_text(content_hash)
+        if text is not None:
+            logger.info("Using in-memory cached text for PDF bytes")
+            return text
         
-        # Additional sanitization to ensure database compatibility
-        # Remove any remaining problematic characters
-        text = re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
+        # Extract and clean text with PyMuPDF in a worker process, straight from memory
+        text = await _extract_bytes_text_in_pool(file_content)
+        _cache_text(content_hash, text)
         
         logger.info("Successfully extracted and sanitized text from PDF bytes")
         
@@ -257,57 +1318,43 @@ async def proxy_pdf_from_url(url: str, paper_id: Optional[str] = None) -> Dict[s
         if not url:
             raise InvalidPDFUrlError("URL is required")
             
+        # Convert arXiv abstract URLs to PDF URLs if needed
+        canonical_url = _canonicalize(url)
+        if canonical_url != url:
+            logger.info(f"Converted arXiv URL {url} to PDF URL: {canonical_url}")
+        
         # Generate a unique filename for the PDF
         if paper_id:
             filename = f"{paper_id}.pdf"
         else:
-            # Create a filename based on the URL hash
-            url_hash = hashlib.md5(url.encode()).hexdigest()
-            filename = f"{url_hash}.pdf"
+            # Create a filename based on the canonical URL hash, so every form of
+            # an arXiv reference shares one proxied file
+            filename = f"{_cache_key(canonical_url)}.pdf"
+            
+            # Keep serving PDFs proxied under the raw URL's BLAKE2b or legacy MD5 filename
+            for earlier_filename in (f"{_cache_key(url)}.pdf", f"{_legacy_cache_key(url)}.pdf"):
+                if earlier_filename != filename and await asyncio.to_thread((PROXIED_PDF_DIR / earlier_filename).exists):
+                    logger.info(f"PDF already proxied: {earlier_filename}")
+                    return {"url": f"/static/proxied_pdfs/{earlier_filename}"}
         
         # Define path where the PDF will be stored
         pdf_path = PROXIED_PDF_DIR / filename
         
         # Check if the file already exists
-        if pdf_path.exists():
+        if await asyncio.to_thread(pdf_path.exists):
             logger.info(f"PDF already proxied: {filename}")
             return {"url": f"/static/proxied_pdfs/{filename}"}
         
-        # Download the PDF
-        logger.info(f"Downloading PDF from URL: {url}")
+        # Fetch through the PDF cache, so a PDF that was already downloaded for
+        # processing isn't fetched again, then publish the cached file
+        async def publish() -> None:
+            cache_path, _ = await download_pdf(canonical_url)
+            await asyncio.to_thread(_publish_cached_pdf, Path(cache_path), pdf_path)
         
-        # Convert arXiv abstract URLs to PDF URLs if needed
-        if url.startswith('https://arxiv.org/abs/'):
-            arxiv_id = url.split('https://arxiv.org/abs/')[1].split('v')[0].split('?')[0].strip()
-            url = f'https://arxiv.org/pdf/{arxiv_id}.pdf'
-            logger.info(f"Converted arXiv abstract URL to PDF URL: {url}")
-        
-        # Download the PDF
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url, 
-                follow_redirects=True, 
-                timeout=30.0,
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                    "Accept": "application/pdf"
-                }
-            )
-            
-            if response.status_code != 200:
-                raise PDFDownloadError(f"Failed to download PDF: HTTP {response.status_code}")
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'application/pdf' not in content_type and not url.endswith('.pdf') and '/storage/v1/object/public/' not in url:
-                raise InvalidPDFUrlError(f"URL does not point to a PDF: {url}")
-            
-            # Save the PDF
-            with open(pdf_path, 'wb') as f:
-                f.write(response.content)
-            
+        _, joined = await coalesce(_inflight_proxies, filename, publish)
+        if not joined:
             logger.info(f"Successfully proxied PDF to {pdf_path}")
-            return {"url": f"/static/proxied_pdfs/{filename}"}
+        return {"url": f"/static/proxied_pdfs/{filename}"}
             
     except PDFDownloadError as e:
         logger.error(f"Error downloading PDF for proxying: {str(e)}")
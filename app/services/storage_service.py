@@ -1,7 +1,9 @@
 import os
 import uuid
+import asyncio
 import httpx
-from typing import Optional, Tuple
+import aiofiles
+from typing import Optional, Tuple, Union, AsyncIterator
 import mimetypes
 from datetime import datetime
 
@@ -19,6 +21,103 @@ logger = get_logger(__name__)
 # Maximum file size in bytes (default to 10MB if not specified)
 MAX_FILE_SIZE = int(MAX_FILE_SIZE_MB or 10) * 1024 * 1024
 
+# Chunk size used when streaming a file from disk to storage
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Shared HTTP client so storage requests reuse pooled HTTP/2 connections to Supabase
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32)
+)
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client used for storage requests.
+    
+    Should be called once on application shutdown.
+    """
+    await _client.aclose()
+
+def _prepare_upload(file_size: int, file_name: str) -> Tuple[str, str, dict]:
+    """
+    Validate an upload and build its storage path, URL and headers.
+    
+    Args:
+        file_size: The size of the file in bytes
+        file_name: The name of the file
+        
+    Returns:
+        A tuple of (file path in storage, storage API URL, request headers)
+        
+    Raises:
+        StorageError: If the file is too large or not a PDF
+    """
+    # Check file size
+    if file_size > MAX_FILE_SIZE:
+        max_size_mb = MAX_FILE_SIZE // (1024 * 1024)
+        raise StorageError(f"File size exceeds maximum allowed size of {max_size_mb}MB")
+    
+    # Check file type
+    content_type = mimetypes.guess_type(file_name)[0]
+    if content_type != 'application/pdf':
+        raise StorageError("Only PDF files are supported")
+    
+    # Generate a unique file path to avoid collisions
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    unique_id = str(uuid.uuid4())[:8]
+    file_path = f"{timestamp}_{unique_id}_{file_name}"
+    
+    # Construct the storage API URL
+    storage_url = f"{SUPABASE_URL}/storage/v1/object/{SUPABASE_STORAGE_BUCKET}/{file_path}"
+    
+    headers = {
+        "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
+        "Content-Type": content_type,
+        "Content-Length": str(file_size)
+    }
+    return file_path, storage_url, headers
+
+async def _post_upload(
+    storage_url: str,
+    headers: dict,
+    content: Union[bytes, AsyncIterator[bytes]],
+    file_name: str,
+    file_path: str
+) -> str:
+    """
+    Send an upload request to Supabase storage.
+    
+    Args:
+        storage_url: The storage API URL
+        headers: The request headers
+        content: The request body
+        file_name: The name of the file, for logging
+        file_path: The path to the file in storage
+        
+    Returns:
+        The path to the file in storage
+        
+    Raises:
+        StorageError: If the storage API rejects the upload
+    """
+    logger.info(f"Uploading file {file_name} to Supabase storage")
+    
+    response = await _client.post(
+        storage_url,
+        headers=headers,
+        content=content,
+        timeout=60.0  # Longer timeout for file uploads
+    )
+    
+    if response.status_code != 200:
+        logger.error(f"Error uploading file to storage: {response.text}")
+        raise StorageError(f"Error uploading file: {response.text}")
+    
+    logger.info(f"Successfully uploaded file to {file_path}")
+    return file_path
+
 async def upload_file_to_storage(file_content: bytes, file_name: str) -> str:
     """
     Upload a file to Supabase storage.
@@ -34,46 +133,51 @@ async def upload_file_to_storage(file_content: bytes, file_name: str) -> str:
         StorageError: If there's an error uploading the file
     """
     try:
-        # Check file size
-        if len(file_content) > MAX_FILE_SIZE:
-            max_size_mb = MAX_FILE_SIZE // (1024 * 1024)
-            raise StorageError(f"File size exceeds maximum allowed size of {max_size_mb}MB")
-        
-        # Check file type
-        content_type = mimetypes.guess_type(file_name)[0]
-        if content_type != 'application/pdf':
-            raise StorageError("Only PDF files are supported")
-        
-        # Generate a unique file path to avoid collisions
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
-        file_path = f"{timestamp}_{unique_id}_{file_name}"
-        
-        # Construct the storage API URL
-        storage_url = f"{SUPABASE_URL}/storage/v1/object/{SUPABASE_STORAGE_BUCKET}/{file_path}"
+        file_path, storage_url, headers = _prepare_upload(len(file_content), file_name)
+        return await _post_upload(storage_url, headers, file_content, file_name, file_path)
+            
+    except Exception as e:
+        logger.error(f"Error uploading file to storage: {str(e)}")
+        raise StorageError(f"Error uploading file: {str(e)}")
+
+async def _iter_file(local_path: str) -> AsyncIterator[bytes]:
+    """
+    Read a file in chunks without blocking the event loop.
+    
+    Args:
+        local_path: The path to the file
         
-        # Upload the file
-        headers = {
-            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
-            "Content-Type": content_type
-        }
+    Yields:
+        Successive chunks of the file
+    """
+    async with aiofiles.open(local_path, 'rb') as f:
+        while True:
+            chunk = await f.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+async def upload_path_to_storage(local_path: str, file_name: str) -> str:
+    """
+    Upload a file on disk to Supabase storage, streaming it from disk.
+    
+    Unlike upload_file_to_storage the file is never held in memory as a whole,
+    and reads happen off the event loop.
+    
+    Args:
+        local_path: The path to the file on disk
+        file_name: The name of the file
         
-        logger.info(f"Uploading file {file_name} to Supabase storage")
+    Returns:
+        The path to the file in storage
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                storage_url,
-                headers=headers,
-                content=file_content,
-                timeout=60.0  # Longer timeout for file uploads
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Error uploading file to storage: {response.text}")
-                raise StorageError(f"Error uploading file: {response.text}")
-            
-            logger.info(f"Successfully uploaded file to {file_path}")
-            return file_path
+    Raises:
+        StorageError: If there's an error uploading the file
+    """
+    try:
+        file_size = (await asyncio.to_thread(os.stat, local_path)).st_size
+        file_path, storage_url, headers = _prepare_upload(file_size, file_name)
+        return await _post_upload(storage_url, headers, _iter_file(local_path), file_name, file_path)
             
     except Exception as e:
         logger.error(f"Error uploading file to storage: {str(e)}")
@@ -112,19 +216,18 @@ async def delete_file_from_storage(file_path: str) -> bool:
         
         logger.info(f"Deleting file {file_path} from Supabase storage")
         
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                storage_url,
-                headers=headers,
-                timeout=30.0
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Error deleting file from storage: {response.text}")
-                return False
-            
-            logger.info(f"Successfully deleted file {file_path}")
-            return True
+        response = await _client.delete(
+            storage_url,
+            headers=headers,
+            timeout=30.0
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Error deleting file from storage: {response.text}")
+            return False
+        
+        logger.info(f"Successfully deleted file {file_path}")
+        return True
             
     except Exception as e:
         logger.error(f"Error deleting file from storage: {str(e)}")
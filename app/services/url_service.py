@@ -1,7 +1,6 @@
 import re
-import httpx
 import asyncio
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Union
 from datetime import datetime
 import PyPDF2
 import tempfile
@@ -11,6 +10,7 @@ from app.api.v1.models import PaperMetadata, Author, SourceType
 from app.core.logger import get_logger
 from app.core.exceptions import InvalidPDFUrlError, PDFDownloadError, StorageError
 from app.services.storage_service import get_file_url
+from app.services.pdf_service import download_pdf, preflight_pdf_url, read_pdf_file_to_bytes
 from app.utils.url_utils import extract_paper_id_from_url
 
 logger = get_logger(__name__)
@@ -68,12 +68,9 @@ async def is_pdf_url(url: str) -> bool:
         True if the URL points to a PDF, False otherwise
     """
     try:
-        async with httpx.AsyncClient() as client:
-            # Just get the headers to check content type
-            response = await client.head(url, follow_redirects=True, timeout=10.0)
-            
-            content_type = response.headers.get('content-type', '')
-            return 'application/pdf' in content_type.lower()
+        # Just get the headers to check content type, over the PDF download connection pool
+        _, content_type, _ = await preflight_pdf_url(url)
+        return 'application/pdf' in content_type
     except Exception as e:
         logger.warning(f"Error checking if URL is PDF: {str(e)}")
         return False
@@ -132,14 +129,9 @@ async def fetch_metadata_from_url(url: str, url_type: str) -> PaperMetadata:
     
     # For all other types (PDF, FILE) or if arXiv API fails, extract metadata from PDF
     try:
-        # Download the PDF
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, follow_redirects=True, timeout=30.0)
-            
-            if response.status_code != 200:
-                raise PDFDownloadError(f"Failed to download PDF from {url}: HTTP {response.status_code}")
-                
-            pdf_content = response.content
+        # Download the PDF, streamed into the shared PDF cache so later processing reuses it
+        pdf_path, _ = await download_pdf(url)
+        pdf_content = read_pdf_file_to_bytes(pdf_path)
             
         # Extract metadata from PDF
         metadata = await extract_metadata_from_pdf(pdf_content, url)
@@ -159,7 +151,7 @@ async def fetch_metadata_from_url(url: str, url_type: str) -> PaperMetadata:
         logger.error(f"Error extracting metadata from PDF at {url}: {str(e)}")
         raise PDFDownloadError(f"Error extracting metadata from PDF: {str(e)}")
 
-async def extract_metadata_from_pdf(pdf_content: bytes, source_url: str) -> PaperMetadata:
+async def extract_metadata_from_pdf(pdf_content: Union[bytes, memoryview], source_url: str) -> PaperMetadata:
     """
     Extract metadata from PDF content.
     
@@ -0,0 +1,156 @@
+import abc
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncBatcher(abc.ABC):
+    """
+    Coalesce concurrent single-item requests into batched calls.
+
+    Items passed to process() are queued until either max_batch_size items are
+    waiting or max_queue_time seconds have passed since the first one arrived.
+    The queued items are then handed to process_batch() in one call and each
+    caller receives the result at its own position.
+
+    Subclasses implement process_batch().
+    """
+
+    def __init__(self, max_batch_size: int = 50, max_queue_time: float = 0.05):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch_size: Maximum number of items sent in a single batch
+            max_queue_time: Maximum time in seconds an item waits for a batch to fill
+        """
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def process(self, item: Any) -> Any:
+        """
+        Queue an item and wait for the result of the batch it ends up in.
+
+        Args:
+            item: The item to process
+
+        Returns:
+            The result process_batch() produced for this item
+
+        Raises:
+            Exception: Whatever process_batch() raised for the batch
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Items queued on a previous event loop can never be flushed, so start over
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_queue_time, self._flush)
+
+        return await future
+
+    @abc.abstractmethod
+    async def process_batch(self, items: List[Any]) -> List[Any]:
+        """
+        Process a batch of items.
+
+        Args:
+            items: The queued items, in arrival order
+
+        Returns:
+            One result per item, in the same order
+        """
+
+    def _flush(self) -> None:
+        """Send all queued items as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Run process_batch() and resolve each caller's future."""
+        try:
+            results = await self.process_batch([item for item, _ in batch])
+            if len(results) != len(batch):
+                # zip() would silently leave the unmatched callers waiting forever
+                raise ValueError(f"process_batch returned {len(results)} results for {len(batch)} items")
+        except asyncio.CancelledError:
+            # Cancel the callers too (e.g. on shutdown) rather than leave them waiting forever
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Error processing batch of {len(batch)} items: {str(e)}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+def _forget_inflight(inflight: Dict[str, asyncio.Task], key: str, task: asyncio.Task) -> None:
+    """
+    Remove a finished operation from the inflight map.
+
+    Args:
+        inflight: Map of keys to the tasks of operations in progress
+        key: The key identifying the operation
+        task: The finished task
+    """
+    if inflight.get(key) is task:
+        del inflight[key]
+    # Mark any exception as retrieved in case every caller had gone away
+    if not task.cancelled():
+        task.exception()
+
+
+async def coalesce(
+    inflight: Dict[str, asyncio.Task], key: str, start: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """
+    Run an operation once for concurrent callers that share a key.
+
+    The first caller starts start() as its own task in the inflight map, and
+    every caller, including the first, awaits it through asyncio.shield. A
+    caller that is cancelled (e.g. by a client disconnect) only stops waiting;
+    the operation carries on for the others.
+
+    Args:
+        inflight: Map of keys to the tasks of operations in progress
+        key: The key identifying the operation
+        start: Factory for the coroutine performing the operation
+
+    Returns:
+        Tuple of the operation's result and whether it was joined rather than run
+    """
+    task = inflight.get(key)
+    joined = task is not None
+    if task is None:
+        task = asyncio.ensure_future(start())
+        inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(inflight, key, done))
+    return await asyncio.shield(task), joined
@@ -0,0 +1,79 @@
+import asyncio
+import secrets
+import time
+from pathlib import Path
+from typing import Callable, Optional, Set
+
+from app.core.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Directories already created by ensure_cache_dir
+_created_dirs: Set[Path] = set()
+
+# Partial files older than this were left behind by a crashed process
+STALE_PART_FILE_SECONDS = 60 * 60
+
+def part_path(path: Path) -> Path:
+    """
+    Build a unique partial-file path next to a file that is about to be replaced.
+
+    Content is written to the partial file and moved into place with
+    os.replace, so readers never see a half-written file.
+
+    Args:
+        path: The final path of the file
+
+    Returns:
+        A sibling path ending in ".part.<random hex>"
+    """
+    return path.with_name(f"{path.name}.part.{secrets.token_hex(4)}")
+
+def remove_stale_parts(path: Path) -> None:
+    """
+    Delete partial files that a crashed process left in a directory.
+
+    Args:
+        path: The directory to clean up
+    """
+    cutoff = time.time() - STALE_PART_FILE_SECONDS
+    for stale_path in path.glob("*.part.*"):
+        try:
+            if stale_path.stat().st_mtime < cutoff:
+                stale_path.unlink()
+                logger.info(f"Removed stale partial file {stale_path}")
+        except FileNotFoundError:
+            pass
+
+def ensure_cache_dir(path: Path, cleanup: Optional[Callable[[Path], None]] = None) -> None:
+    """
+    Create a cache directory the first time it is written to.
+
+    Partial files left behind by a crashed process are removed at the same time.
+    This lists and stats the directory, so async code should use
+    ensure_cache_dir_async instead.
+
+    Args:
+        path: The directory to create
+        cleanup: Optional extra cleanup to run on the directory the first time
+    """
+    if path not in _created_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        remove_stale_parts(path)
+        if cleanup is not None:
+            cleanup(path)
+        _created_dirs.add(path)
+
+async def ensure_cache_dir_async(path: Path, cleanup: Optional[Callable[[Path], None]] = None) -> None:
+    """
+    Create a cache directory from async code.
+
+    The first-time cleanup runs in a worker thread rather than on the event loop;
+    later calls are a set lookup.
+
+    Args:
+        path: The directory to create
+        cleanup: Optional extra cleanup to run on the directory the first time
+    """
+    if path not in _created_dirs:
+        await asyncio.to_thread(ensure_cache_dir, path, cleanup)
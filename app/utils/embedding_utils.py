@@ -1,6 +1,8 @@
-import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
 import asyncio
+import base64
+import httpx
+import numpy as np
 from typing import List, Dict, Any
 import os
 from dotenv import load_dotenv
@@ -22,13 +24,45 @@ try:
         # Ensure it's also in the environment
         os.environ["OPENAI_API_KEY"] = api_key
     
-    client = OpenAI(api_key=api_key)
+    # Async client over a persistent HTTP/2 connection, so batches don't each hold a worker thread
+    client = AsyncOpenAI(
+        api_key=api_key,
+        http_client=httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, read=120.0),
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        )
+    )
     logger.info(f"OpenAI client initialized with API key: {api_key[:8]}... in embedding_utils.py")
 except Exception as e:
     logger.error(f"Error initializing OpenAI client: {str(e)}")
     client = None
 
 EMBEDDING_MODEL = settings.OPENAI_EMBEDDING_MODEL  # Use the model from settings
+EMBEDDING_BATCH_SIZE = max(1, settings.OPENAI_EMBEDDING_BATCH_SIZE)
+EMBEDDING_DIMENSIONS = max(0, settings.OPENAI_EMBEDDING_DIMENSIONS)
+EMBEDDING_CONCURRENCY = max(1, settings.OPENAI_EMBEDDING_CONCURRENCY)
+
+async def close_http_client() -> None:
+    """
+    Close the HTTP client used for embedding requests.
+    
+    Should be called once on application shutdown.
+    """
+    if client is not None:
+        await client.close()
+
+def _decode_embedding(encoded: str) -> List[float]:
+    """
+    Decode a base64-encoded embedding returned by the OpenAI API.
+    
+    Args:
+        encoded: The base64 string of little-endian float32 values
+        
+    Returns:
+        The embedding as a list of floats
+    """
+    return np.frombuffer(base64.b64decode(encoded), dtype="<f4").tolist()
 
 async def generate_embeddings(texts: List[str]) -> List[List[float]]:
     """
@@ -38,7 +72,8 @@ async def generate_embeddings(texts: List[str]) -> List[List[float]]:
         texts: List of text chunks to embed
         
     Returns:
-        List of embeddings (as float lists), OpenAI embeddings are 3072 dimensions
+        List of embeddings (as float lists) of EMBEDDING_DIMENSIONS dimensions, or the
+        model's full size (3072 for text-embedding-3-large) when that is 0
     """
     if not texts:
         logger.warning("No texts provided for embedding generation")
@@ -51,38 +86,40 @@ async def generate_embeddings(texts: List[str]) -> List[List[float]]:
     try:
         logger.info(f"Generating embeddings for {len(texts)} texts using OpenAI model {EMBEDDING_MODEL}")
         
-        # Process in batches to avoid rate limits and large payload issues
-        batch_size = 10  # OpenAI can handle more, but this is a safe batch size
-        all_embeddings = []
+        # Large batches keep the number of round trips low; the API accepts up to 2048 inputs
+        batch_size = EMBEDDING_BATCH_SIZE
+        # Matryoshka-style shortened embeddings cut payload and storage size at little cost to retrieval
+        dimensions = {"dimensions": EMBEDDING_DIMENSIONS} if EMBEDDING_DIMENSIONS else {}
+        semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            
+        async def embed_batch(start: int) -> List[List[float]]:
             # Handle empty strings which OpenAI API rejects
-            batch = [text if text.strip() else " " for text in batch]
+            batch = [text if text.strip() else " " for text in texts[start:start + batch_size]]
             
             # Log first text in batch (shortened for readability)
             first_text = batch[0][:100] + "..." if batch else ""
-            logger.info(f"Batch {i//batch_size + 1}: Generating embeddings for {len(batch)} texts. First text: {first_text}")
+            logger.info(f"Batch {start//batch_size + 1}: Generating embeddings for {len(batch)} texts. First text: {first_text}")
             
-            # Use the correct client instance
-            response = await asyncio.to_thread(
-                client.embeddings.create,
-                model=EMBEDDING_MODEL,
-                input=batch
-            )
+            # Request base64 float32 payloads, which are about a quarter the size of JSON floats
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model=EMBEDDING_MODEL,
+                    input=batch,
+                    encoding_format="base64",
+                    **dimensions
+                )
             
             # Extract embeddings from response
-            batch_embeddings = [item.embedding for item in response.data]
-            all_embeddings.extend(batch_embeddings)
+            batch_embeddings = [_decode_embedding(item.embedding) for item in response.data]
             
             # Log information about dimensions
             if batch_embeddings:
                 logger.info(f"Generated embeddings with {len(batch_embeddings[0])} dimensions")
-            
-            # Add a small delay to avoid rate limiting
-            if i + batch_size < len(texts):
-                await asyncio.sleep(0.5)
+            return batch_embeddings
+        
+        # Batches are independent, so send them concurrently; gather keeps them in input order
+        batches = await asyncio.gather(*(embed_batch(i) for i in range(0, len(texts), batch_size)))
+        all_embeddings = [embedding for batch_embeddings in batches for embedding in batch_embeddings]
         
         logger.info(f"Successfully generated {len(all_embeddings)} embeddings using OpenAI. First embedding has {len(all_embeddings[0]) if all_embeddings else 0} dimensions")
         return all_embeddings
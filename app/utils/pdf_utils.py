@@ -1,52 +1,91 @@
-import PyPDF2
-import os
-import tempfile
-import requests
 from app.core.logger import get_logger
 from app.core.exceptions import PDFExtractionError
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 import re
 
+try:
+    import pymupdf as fitz
+except ImportError:
+    # PyMuPDF releases before 1.24.3 only provide the fitz module name
+    import fitz
+
 logger = get_logger(__name__)
 
-async def download_pdf(url: str) -> str:
+# Control characters the database can't store; tab, newline and carriage return are kept
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)] + [0x7F]
+)
+
+# The same control characters as a bytes.translate deletion set, for text already encoded to ASCII
+_CONTROL_BYTES = bytes(_CONTROL_CHARS_TABLE)
+
+# Plain-text extraction flags with image blocks explicitly off. MuPDF still interprets the
+# whole content stream, but no image or vector-drawing blocks are built for graphics-heavy pages
+_TEXT_ONLY_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_IMAGES
+
+def _extract_document_text(
+    doc: "fitz.Document",
+    source: str,
+    start: int = 0,
+    stop: Optional[int] = None
+) -> str:
     """
-    Download a PDF from a URL to a temporary file.
+    Extract the text of the pages of an open PyMuPDF document.
     
     Args:
-        url: URL of the PDF to download
+        doc: The open document
+        source: A description of the document for log messages
+        start: The index of the first page to extract
+        stop: The index after the last page to extract, or None for the end of the document
         
     Returns:
-        Path to the downloaded PDF file
+        The text of the pages, separated by newlines
+    """
+    page_texts = []
+    for page_num, page in enumerate(doc.pages(start, stop), start):
+        try:
+            page_text = page.get_text("text", flags=_TEXT_ONLY_FLAGS)
+            # Sanitize text immediately to handle problematic characters
+            if page_text:
+                # Remove null bytes and other control characters
+                page_text = page_text.translate(_CONTROL_CHARS_TABLE)
+            page_texts.append(page_text or "")
+        except Exception as e:
+            logger.warning(f"Error extracting text from page {page_num} of {source}: {str(e)}")
+            # Continue with next page instead of failing completely
+            continue
+    return "\n".join(page_texts)
+
+def count_pdf_pages_sync(pdf_path: str) -> int:
+    """
+    Count the pages of a PDF file with PyMuPDF.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        The number of pages
         
     Raises:
-        PDFExtractionError: If the PDF cannot be downloaded
+        PDFExtractionError: If the PDF cannot be opened
     """
     try:
-        # Create a temporary file
-        pdf_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        pdf_path = pdf_file.name
-        
-        # Download the PDF
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-        
-        with open(pdf_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-                
-        logger.info(f"Downloaded PDF from {url} to {pdf_path}")
-        return pdf_path
+        with fitz.open(pdf_path) as doc:
+            return doc.page_count
     except Exception as e:
-        logger.error(f"Failed to download PDF from {url}: {str(e)}")
-        raise PDFExtractionError("N/A", f"Failed to download PDF from {url}: {str(e)}")
-        
-async def extract_text_from_pdf(pdf_path: str) -> str:
+        logger.error(f"Failed to open PDF {pdf_path}: {str(e)}")
+        raise PDFExtractionError(pdf_path, str(e))
+
+def extract_text_from_pdf_sync(pdf_path: str, start: int = 0, stop: Optional[int] = None) -> str:
     """
-    Extract text from a PDF file.
+    Extract text from a PDF file synchronously with PyMuPDF, leaving the file in place.
+    
+    This is CPU-bound and is meant to be run in a worker process or thread.
     
     Args:
         pdf_path: Path to the PDF file
+        start: The index of the first page to extract
+        stop: The index after the last page to extract, or None for the end of the document
         
     Returns:
         Extracted text from the PDF
@@ -55,43 +94,39 @@ async def extract_text_from_pdf(pdf_path: str) -> str:
         PDFExtractionError: If the text cannot be extracted
     """
     try:
-        with open(pdf_path, 'rb') as f:
-            pdf_reader = PyPDF2.PdfReader(f)
-            text = ""
-            
-            for page_num in range(len(pdf_reader.pages)):
-                try:
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    # Sanitize text immediately to handle problematic characters
-                    if page_text:
-                        # Remove null bytes and other control characters
-                        page_text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', page_text)
-                    text += page_text or ""
-                except Exception as e:
-                    logger.warning(f"Error extracting text from page {page_num} of {pdf_path}: {str(e)}")
-                    # Continue with next page instead of failing completely
-                    continue
+        with fitz.open(pdf_path) as doc:
+            text = _extract_document_text(doc, pdf_path, start, stop)
                 
         logger.info(f"Extracted text from PDF {pdf_path}")
-        
-        # Clean up the temporary file if it exists
-        if os.path.exists(pdf_path):
-            os.unlink(pdf_path)
-            logger.info(f"Deleted temporary PDF file {pdf_path}")
-                
         return text
     except Exception as e:
         logger.error(f"Failed to extract text from PDF {pdf_path}: {str(e)}")
-        
-        # Clean up the temporary file if it exists
-        if os.path.exists(pdf_path):
-            os.unlink(pdf_path)
-            logger.info(f"Deleted temporary PDF file {pdf_path}")
-            
         raise PDFExtractionError(pdf_path, str(e))
+
+def extract_text_from_pdf_bytes_sync(file_content: Union[bytes, bytearray]) -> str:
+    """
+    Extract text from in-memory PDF content synchronously with PyMuPDF.
+    
+    Args:
+        file_content: The binary content of the PDF file
         
-async def clean_pdf_text(text: str) -> str:
+    Returns:
+        Extracted text from the PDF
+        
+    Raises:
+        PDFExtractionError: If the text cannot be extracted
+    """
+    try:
+        with fitz.open(stream=file_content, filetype="pdf") as doc:
+            text = _extract_document_text(doc, "PDF bytes")
+        
+        logger.info(f"Extracted text from {len(file_content)} bytes of PDF")
+        return text
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF bytes: {str(e)}")
+        raise PDFExtractionError("N/A", str(e))
+
+def clean_pdf_text_sync(text: str) -> str:
     """
     Clean extracted text from a PDF, removing artifacts and fixing common issues.
     
@@ -102,7 +137,7 @@ async def clean_pdf_text(text: str) -> str:
         Cleaned text
     """
     # Remove null bytes and other control characters that can cause database issues
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_CONTROL_CHARS_TABLE)
     
     # Remove multiple consecutive newlines
     text = re.sub(r'\n{3,}', '\n\n', text)
@@ -117,4 +152,33 @@ async def clean_pdf_text(text: str) -> str:
     # This is a simplified approach - might need customization for specific journals
     text = re.sub(r'\n.*(submitted|received|accepted|published).*\n', '\n', text, flags=re.IGNORECASE)
     
-    return text 
\ No newline at end of file
+    return text
+
+def strip_non_printable_text(text: str) -> str:
+    """
+    Keep only printable ASCII plus tab, newline and carriage return.
+    
+    Equivalent to ``re.sub(r'[^\x20-\x7E\n\r\t]', '', text)``, but done as an
+    ASCII encode that drops everything above 0x7F followed by a bytes deletion
+    of the remaining control characters, both single C-level passes that never
+    dispatch on individual unicode characters.
+    
+    Args:
+        text: The text to sanitize
+        
+    Returns:
+        The sanitized text
+    """
+    return text.encode("ascii", "ignore").translate(None, _CONTROL_BYTES).decode("ascii")
+
+async def clean_pdf_text(text: str) -> str:
+    """
+    Clean extracted text from a PDF, removing artifacts and fixing common issues.
+    
+    Args:
+        text: Extracted text from a PDF
+        
+    Returns:
+        Cleaned text
+    """
+    return clean_pdf_text_sync(text)
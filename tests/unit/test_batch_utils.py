@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from app.utils.batch_utils import AsyncBatcher, coalesce
+
+
+class RecordingBatcher(AsyncBatcher):
+    """Batcher that doubles numbers and records the batches it receives."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def process_batch(self, items):
+        self.batches.append(items)
+        if "boom" in items:
+            raise ValueError("bad item")
+        if "short" in items:
+            return [item * 2 for item in items[1:]]
+        return [item * 2 for item in items]
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_splits_on_max_batch_size():
+    """Test that results are routed back per item and batches respect the size limit."""
+    batcher = RecordingBatcher(max_batch_size=2, max_queue_time=0.01)
+
+    results = await asyncio.gather(*(batcher.process(n) for n in range(5)))
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batcher.batches == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_propagates_batch_errors():
+    """Test that an exception from process_batch reaches every caller in the batch."""
+    batcher = RecordingBatcher(max_batch_size=10, max_queue_time=0.01)
+
+    results = await asyncio.gather(
+        batcher.process("boom"), batcher.process("x"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_fails_callers_on_short_results():
+    """Test that every caller fails when process_batch returns fewer results than items."""
+    batcher = RecordingBatcher(max_batch_size=10, max_queue_time=0.01)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.process("short"), batcher.process("x"), return_exceptions=True),
+        timeout=1
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_async_batcher_requires_process_batch():
+    """Test that a batcher without process_batch can't be instantiated."""
+    with pytest.raises(TypeError):
+        AsyncBatcher()
+
+
+@pytest.mark.asyncio
+async def test_async_batcher_cancels_callers_when_batch_is_cancelled():
+    """Test that cancelling a running batch cancels its callers instead of leaving them pending."""
+    started = asyncio.Event()
+
+    class StuckBatcher(AsyncBatcher):
+        async def process_batch(self, items):
+            started.set()
+            await asyncio.Event().wait()
+
+    batcher = StuckBatcher(max_batch_size=2, max_queue_time=0.01)
+    callers = [asyncio.ensure_future(batcher.process(n)) for n in range(2)]
+    await started.wait()
+
+    for task in list(batcher._batch_tasks):
+        task.cancel()
+    results = await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), timeout=1)
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_runs_once_per_key():
+    """Test that concurrent callers with one key share a single run and the key is then forgotten."""
+    inflight = {}
+    runs = []
+
+    async def start():
+        runs.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    results = await asyncio.gather(*(coalesce(inflight, "key", start) for _ in range(3)))
+
+    assert results == [("result", False), ("result", True), ("result", True)]
+    assert len(runs) == 1
+    assert inflight == {}
@@ -0,0 +1,51 @@
+import os
+import threading
+
+import pytest
+
+from app.utils import cache_utils
+
+
+def test_part_path_is_unique_sibling(tmp_path):
+    """Test that partial paths sit next to the target and differ on every call."""
+    target = tmp_path / "entry.json"
+
+    first = cache_utils.part_path(target)
+    second = cache_utils.part_path(target)
+
+    assert first.parent == second.parent == tmp_path
+    assert first.name.startswith("entry.json.part.")
+    assert first != second
+
+
+def test_ensure_cache_dir_removes_stale_partial_files(tmp_path, monkeypatch):
+    """Test that old partial files are cleaned up while recent ones are kept."""
+    monkeypatch.setattr(cache_utils, "_created_dirs", set())
+    stale = tmp_path / "abc.pdf.part.1234"
+    stale.write_bytes(b"partial")
+    os.utime(stale, (0, 0))
+    recent = tmp_path / "def.json.part.5678"
+    recent.write_bytes(b"partial")
+    cleaned = []
+
+    cache_utils.ensure_cache_dir(tmp_path, cleaned.append)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["def.json.part.5678"]
+    assert cleaned == [tmp_path]
+
+
+@pytest.mark.asyncio
+async def test_ensure_cache_dir_async_sweeps_in_worker_thread(tmp_path, monkeypatch):
+    """Test that the first-time cleanup runs off the event loop, and only once."""
+    monkeypatch.setattr(cache_utils, "_created_dirs", set())
+    threads = []
+
+    def record_cleanup(path):
+        threads.append(threading.current_thread())
+
+    await cache_utils.ensure_cache_dir_async(tmp_path / "cache", record_cleanup)
+    await cache_utils.ensure_cache_dir_async(tmp_path / "cache", record_cleanup)
+
+    assert (tmp_path / "cache").is_dir()
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
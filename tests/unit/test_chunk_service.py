@@ -4,7 +4,7 @@ import asyncio
 from typing import List, Dict, Any
 from unittest.mock import patch, Mock
 
-from app.services.chunk_service import chunk_text, extract_sections
+from app.services.chunk_service import chunk_text, extract_sections, _section_flags, _get_text_splitter
 from app.core.exceptions import ChunkingError
 
 
@@ -97,6 +97,32 @@ These are our conclusions.
     assert "CONCLUSION" in section_titles
 
 
+def test_extract_sections_keeps_headers_on_one_line():
+    """Test that headers never swallow the following line and content is sliced between headers."""
+    text = "Preamble line\n\n1. Introduction\nWe study THINGS.\nMORE CAPS\n\n2. Related Work  \nPrior work.\n"
+
+    sections = extract_sections(text)
+
+    # "MORE CAPS" is a header with no content of its own, so it is dropped
+    assert sections == [
+        ("Introduction", "Preamble line\n"),
+        ("1. Introduction", "We study THINGS."),
+        ("2. Related Work", "Prior work.\n"),
+    ]
+
+
+def test_section_flags_match_title_keywords():
+    """Test that section titles are classified case-insensitively, including partial words."""
+    assert _section_flags("1. INTRODUCTION") == {
+        "is_introduction": True, "is_conclusion": False, "is_methodology": False, "is_abstract": False
+    }
+    assert _section_flags("Experimental Results and Discussion") == {
+        "is_introduction": False, "is_conclusion": True, "is_methodology": True, "is_abstract": False
+    }
+    assert _section_flags("Abstract")["is_abstract"]
+    assert not any(_section_flags("Related Work").values())
+
+
 @pytest.mark.asyncio
 async def test_chunk_text_with_sections():
     """Test that chunk_text correctly processes text with sections."""
@@ -216,4 +242,10 @@ async def test_chunk_text_exception_handling():
     # Use patch to force extract_sections to raise an exception
     with patch('app.services.chunk_service.extract_sections', side_effect=Exception("Test exception")):
         with pytest.raises(ChunkingError):
-            await chunk_text("Sample text", uuid.uuid4()) 
\ No newline at end of file
+            await chunk_text("Sample text", uuid.uuid4()) 
+
+
+def test_get_text_splitter_is_shared_per_configuration():
+    """Test that splitters are built once per chunk size and overlap."""
+    assert _get_text_splitter(1000, 100) is _get_text_splitter(1000, 100)
+    assert _get_text_splitter(500, 50) is not _get_text_splitter(1000, 100)
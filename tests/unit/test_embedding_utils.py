@@ -0,0 +1,81 @@
+import asyncio
+import base64
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.utils import embedding_utils
+
+
+class _FakeEmbeddings:
+    """Stand-in for client.embeddings that records each request."""
+
+    def __init__(self):
+        self.calls = []
+        self.dimensions = []
+
+    async def create(self, model, input, encoding_format, dimensions=None):
+        self.calls.append((list(input), encoding_format))
+        self.dimensions.append(dimensions)
+        data = [
+            SimpleNamespace(embedding=base64.b64encode(np.array([len(text), 0.5], dtype="<f4").tobytes()).decode())
+            for text in input
+        ]
+        return SimpleNamespace(data=data)
+
+
+@pytest.mark.asyncio
+async def test_generate_embeddings_batches_and_decodes_base64(monkeypatch):
+    """Test that texts are sent in configured batches and base64 vectors are decoded in order."""
+    fake = _FakeEmbeddings()
+    monkeypatch.setattr(embedding_utils, "client", SimpleNamespace(embeddings=fake))
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_SIZE", 2)
+
+    embeddings = await embedding_utils.generate_embeddings(["a", "bb", "", "dddd", "eeeee"])
+
+    assert embeddings == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+    assert [len(batch) for batch, _ in fake.calls] == [2, 2, 1]
+    assert fake.calls[1][0] == [" ", "dddd"]
+    assert all(encoding == "base64" for _, encoding in fake.calls)
+
+
+@pytest.mark.asyncio
+async def test_generate_embeddings_sends_batches_concurrently_in_order(monkeypatch):
+    """Test that batches run concurrently up to the limit and results keep input order."""
+    in_flight = []
+    peak = []
+
+    class _SlowEmbeddings(_FakeEmbeddings):
+        async def create(self, model, input, encoding_format, dimensions=None):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            # Let earlier batches finish last to check ordering
+            await asyncio.sleep(0.01 * (10 - len(input[0])))
+            in_flight.pop()
+            return await super().create(model, input, encoding_format, dimensions)
+
+    monkeypatch.setattr(embedding_utils, "client", SimpleNamespace(embeddings=_SlowEmbeddings()))
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_BATCH_SIZE", 1)
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_CONCURRENCY", 3)
+
+    texts = ["a" * n for n in range(1, 7)]
+    embeddings = await embedding_utils.generate_embeddings(texts)
+
+    assert [embedding[0] for embedding in embeddings] == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+    assert max(peak) == 3
+
+
+@pytest.mark.asyncio
+async def test_generate_embeddings_requests_configured_dimensions(monkeypatch):
+    """Test that shortened embeddings are requested, and omitted when set to the model's full size."""
+    fake = _FakeEmbeddings()
+    monkeypatch.setattr(embedding_utils, "client", SimpleNamespace(embeddings=fake))
+
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_DIMENSIONS", 1024)
+    await embedding_utils.generate_embeddings(["a"])
+    monkeypatch.setattr(embedding_utils, "EMBEDDING_DIMENSIONS", 0)
+    await embedding_utils.generate_embeddings(["a"])
+
+    assert fake.dimensions == [1024, None]
+
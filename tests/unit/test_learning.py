@@ -1,7 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 import uuid
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 import asyncio
 
 from app.main import app
@@ -240,4 +240,73 @@ def test_get_user_progress(test_paper_id):
         # Check that our recorded progress is in the list
         matching_progress = [p for p in progress_data if p["item_id"] == item_id]
         assert len(matching_progress) >= 1
-        assert matching_progress[0]["status"] == "completed" 
\ No newline at end of file
+        assert matching_progress[0]["status"] == "completed" 
+
+@pytest.mark.asyncio
+async def test_store_learning_material_inserts_questions_in_one_request():
+    """Test that quiz questions are stored with a single bulk insert."""
+    from app.services import learning_service
+
+    fake_supabase = MagicMock()
+    material = {
+        "paper_id": "paper-1",
+        "type": "quiz",
+        "data": {
+            "questions": [
+                {"question": "Q1", "options": ["a", "b"], "correct_answer": 0},
+                {"question": "Q2", "options": ["c", "d"], "correct_answer": 1},
+            ]
+        },
+    }
+
+    with patch.object(learning_service, "supabase", fake_supabase):
+        material_id = await learning_service.store_learning_material(material)
+
+    question_inserts = [
+        call.args[0]
+        for call in fake_supabase.table.return_value.insert.call_args_list
+        if isinstance(call.args[0], list)
+    ]
+    assert len(question_inserts) == 1
+    assert [row["text"] for row in question_inserts[0]] == ["Q1", "Q2"]
+    assert all(row["item_id"] == material_id for row in question_inserts[0])
+    assert fake_supabase.table.return_value.insert.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_store_learning_materials_inserts_items_in_one_request():
+    """Test that several materials, and their quiz questions, are stored with one insert per table."""
+    from app.services import learning_service
+
+    fake_supabase = MagicMock()
+    materials = [
+        {"paper_id": "paper-1", "type": "concepts", "level": "beginner", "data": {"title": "A"}, "order": 1},
+        {"paper_id": "paper-1", "type": "results", "level": "advanced", "data": {"title": "B"}, "order": 2},
+        {"paper_id": "paper-1", "type": "quiz", "data": {"questions": [{"question": "Q1", "correct_answer": 0}]}},
+    ]
+
+    with patch.object(learning_service, "supabase", fake_supabase):
+        material_ids = await learning_service.store_learning_materials(materials)
+
+    inserts = [call.args[0] for call in fake_supabase.table.return_value.insert.call_args_list]
+    assert len(inserts) == 2
+    item_rows, question_rows = inserts
+    assert [row["id"] for row in item_rows] == material_ids
+    assert [row["order"] for row in item_rows] == [1, 2, 0]
+    assert [row["item_id"] for row in question_rows] == [material_ids[2]]
+
+
+@pytest.mark.asyncio
+async def test_generate_youtube_search_query_uses_given_paper():
+    """Test that a paper passed in by the caller is used instead of fetching it again."""
+    from app.services import learning_service
+
+    paper = {"id": "paper-1", "title": "Attention Is All You Need", "abstract": "Transformers."}
+    fetch = AsyncMock()
+
+    with patch.object(learning_service, "get_paper_by_id", fetch), \
+         patch.object(learning_service, "generate_text", AsyncMock(return_value="transformer attention tutorial")):
+        query = await learning_service.generate_youtube_search_query("paper-1", paper)
+
+    assert query == "transformer attention tutorial"
+    fetch.assert_not_awaited()
@@ -0,0 +1,209 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import llm_service
+from app.services.llm_service import (
+    _find_json_array,
+    _find_json_object,
+    _get_cached_extraction,
+    _cache_extraction,
+    _parse_llm_json_response,
+    _truncate_text,
+    mock_generate_summary_json
+)
+from app.core.exceptions import LLMServiceError
+
+
+def test_parse_llm_json_response_plain_json():
+    """Test that a response containing only JSON is parsed directly."""
+    result = _parse_llm_json_response('{"title": "A Paper", "authors": []}')
+
+    assert result == {"title": "A Paper", "authors": []}
+
+
+def test_parse_llm_json_response_code_block():
+    """Test that JSON wrapped in a markdown code block is extracted."""
+    response_text = 'Here is the result:\n```json\n{"methodology": {"title": "M", "content": "C"}}\n```\nDone.'
+
+    result = _parse_llm_json_response(response_text)
+
+    assert result == {"methodology": {"title": "M", "content": "C"}}
+
+
+def test_parse_llm_json_response_embedded_object():
+    """Test that a nested JSON object embedded in prose is extracted."""
+    response_text = 'Sure! {"beginner": "b", "nested": {"a": 1}} Hope this helps.'
+
+    result = _parse_llm_json_response(response_text)
+
+    assert result == {"beginner": "b", "nested": {"a": 1}}
+
+
+def test_parse_llm_json_response_skips_invalid_candidates():
+    """Test that a brace in prose before the real JSON doesn't stop extraction."""
+    response_text = 'Using the {template} format:\n```json\n{"results": {"title": "R", "content": "C"}}\n```'
+
+    result = _parse_llm_json_response(response_text, ("results",))
+
+    assert result == {"results": {"title": "R", "content": "C"}}
+
+def test_parse_llm_json_response_missing_keys():
+    """Test that missing required keys raise an LLMServiceError."""
+    with pytest.raises(LLMServiceError) as exc_info:
+        _parse_llm_json_response('{"beginner": "b"}', ("beginner", "advanced"))
+
+    assert "advanced" in str(exc_info.value)
+
+
+def test_parse_llm_json_response_no_json():
+    """Test that a response without any JSON raises an LLMServiceError."""
+    with pytest.raises(LLMServiceError):
+        _parse_llm_json_response("I could not find any metadata in this text.")
+
+
+def test_find_json_object_ignores_braces_in_strings():
+    """Test that braces inside JSON strings don't end the object early."""
+    text = 'Result: {"content": "use {x} and \\"}\\"", "n": {"a": 1}} trailing }'
+
+    assert _find_json_object(text) == '{"content": "use {x} and \\"}\\"", "n": {"a": 1}}'
+
+
+def test_find_json_object_unbalanced():
+    """Test that an unterminated object is not returned."""
+    assert _find_json_object('prefix {"a": {"b": 1}') is None
+
+def test_find_json_array_stops_at_matching_bracket():
+    """Test that the first balanced array is returned, not everything up to the last bracket."""
+    text = '```json\n[{"a": "x]"}, {"b": [1]}]\n```\nAlso see ```[2]```'
+
+    assert _find_json_array(text) == '[{"a": "x]"}, {"b": [1]}]'
+
+@pytest.mark.asyncio
+async def test_mock_generate_summary_json_extracts_abstract():
+    """Test that the mock summary generator picks the abstract out of the prompt."""
+    prompt = "Summarize this.\n\nPaper abstract: We study attention.\n\nFull paper text: ..."
+
+    result = await mock_generate_summary_json(prompt)
+
+    assert "We study attention." in result["beginner"]
+    assert "Full paper text" not in result["beginner"]
+
+
+def test_truncate_text_on_sentence_boundary():
+    """Test that long text is cut after the last full sentence within the limit."""
+    text = "First sentence here. Second sentence here. Third sentence is much longer than the rest."
+
+    truncated = _truncate_text(text, 50)
+
+    assert truncated == "First sentence here. Second sentence here. ... [truncated]"
+    assert _truncate_text(text, len(text)) == text
+
+
+def test_extraction_cache_round_trip():
+    """Test that cached extraction results are returned as independent copies."""
+    result = {"title": "A Paper", "authors": [{"name": "A. Author"}]}
+    _cache_extraction("test-key", result)
+
+    cached = _get_cached_extraction("test-key")
+    cached["authors"].append({"name": "Someone Else"})
+
+    assert _get_cached_extraction("test-key") == result
+    assert _get_cached_extraction("missing-key") is None
+    llm_service._extraction_cache.pop("test-key", None)
+
+
+@pytest.mark.asyncio
+async def test_generate_structured_extraction_text_bytes_share_cache_key(monkeypatch):
+    """Test that passing pre-encoded text hits the same cache entry as passing the text alone."""
+    calls = []
+
+    async def fake_impl(full_prompt, max_tokens, temperature):
+        calls.append(full_prompt)
+        return '{"title": "Cached Title"}'
+
+    monkeypatch.setattr(llm_service, "_extraction_text_impl", fake_impl)
+    monkeypatch.setattr(llm_service, "_extraction_cache", llm_service.OrderedDict())
+
+    first = await llm_service.generate_structured_extraction("Paper text é", "Extract:")
+    second = await llm_service.generate_structured_extraction(
+        "Paper text é", "Extract:", text_bytes="Paper text é".encode()
+    )
+
+    assert first == second == {"title": "Cached Title"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_gemini_initializes_once(monkeypatch):
+    """Test that concurrent first uses of Gemini share a single lazy initialization."""
+    calls = []
+
+    def fake_init():
+        calls.append(1)
+        return "genai", "model"
+
+    monkeypatch.setattr(llm_service, "_init_gemini_sync", fake_init)
+    monkeypatch.setattr(llm_service, "_genai", None)
+    monkeypatch.setattr(llm_service, "_gemini_model", None)
+
+    results = await asyncio.gather(*(llm_service._get_gemini() for _ in range(3)))
+
+    assert results == [("genai", "model")] * 3
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_generate_summaries_batch_splits_to_fit_output_limit(monkeypatch):
+    """Test that batches are split so no request asks for more than the output token cap."""
+    budgets = []
+
+    async def fake_generate_text(prompt, max_tokens, temperature):
+        budgets.append(max_tokens)
+        summary = '{"beginner": "b", "intermediate": "i", "advanced": "a", "extracted_abstract": "e"}'
+        if prompt.startswith("For each of the following"):
+            count = int(prompt.split()[5])
+            return "Here you go:\n```json\n[" + ", ".join([summary] * count) + "]\n```\nNotes: ```[1]```"
+        return summary
+
+    monkeypatch.setattr(llm_service, "generate_text", fake_generate_text)
+    monkeypatch.setattr(llm_service, "LLM_MAX_OUTPUT_TOKENS", 5000)
+
+    results = await llm_service.generate_summaries_batch([f"paper {i}" for i in range(5)], max_tokens=2500)
+
+    assert len(results) == 5
+    assert all(result["beginner"] == "b" for result in results)
+    assert sorted(budgets) == [2500, 5000, 5000]
+
+
+@pytest.mark.asyncio
+async def test_get_gemini_pdf_file_uploads_once_for_concurrent_requests(monkeypatch, tmp_path):
+    """Test that concurrent requests for the same PDF share one Gemini upload."""
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 shared")
+    uploads = []
+
+    class FakeGenai:
+        @staticmethod
+        def upload_file(path, mime_type):
+            uploads.append(path)
+            time.sleep(0.05)
+            return SimpleNamespace(name=f"files/{len(uploads)}")
+
+    async def fake_get_gemini():
+        return FakeGenai, None
+
+    async def no_expiry(file_key, uploaded_file):
+        pass
+
+    monkeypatch.setattr(llm_service, "_get_gemini", fake_get_gemini)
+    monkeypatch.setattr(llm_service, "_expire_gemini_file", no_expiry)
+    monkeypatch.setattr(llm_service, "_gemini_files", {})
+
+    results = await asyncio.gather(*(llm_service.get_gemini_pdf_file(str(pdf_path)) for _ in range(3)))
+
+    assert len(uploads) == 1
+    assert {result.name for result in results} == {"files/1"}
+    assert llm_service._inflight_gemini_uploads == {}
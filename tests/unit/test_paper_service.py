@@ -0,0 +1,327 @@
+import asyncio
+import uuid
+from urllib.parse import unquote_plus
+
+import httpx
+import pytest
+
+from app.services import paper_service
+
+
+def _openalex_transport(routes):
+    """Build a mock transport answering OpenAlex requests from a {matcher: payload} dict."""
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = unquote_plus(str(request.url))
+        requested.append(url)
+        for matcher, payload in routes.items():
+            if matcher in url:
+                return httpx.Response(200, json=payload)
+        return httpx.Response(404)
+
+    return httpx.MockTransport(handler), requested
+
+
+@pytest.fixture
+def openalex(monkeypatch, tmp_path):
+    """Point the paper service's shared client and cache at a mock OpenAlex setup."""
+    monkeypatch.setattr(paper_service, "OPENALEX_CACHE_DIR", tmp_path)
+
+    def install(routes):
+        transport, requested = _openalex_transport(routes)
+        monkeypatch.setattr(paper_service, "_client", httpx.AsyncClient(transport=transport))
+        return requested
+
+    return install
+
+
+def _work(work_id, title):
+    return {
+        "id": f"https://openalex.org/{work_id}",
+        "title": title,
+        "doi": None,
+        "primary_location": {"pdf_url": f"https://example.org/{work_id}.pdf"},
+        "authorships": [
+            {
+                "author": {"display_name": "A. Author"},
+                "author_position": "first",
+                "institutions": [{"display_name": "Uni"}, {"display_name": "Other"}]
+            }
+        ],
+        "publication_year": 2024,
+        "publication_date": "2024-01-01"
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_uses_citing_works(openalex):
+    """Test that citing works are returned when OpenAlex has citations."""
+    openalex({
+        "filter=cites:W1": {"results": [_work("W2", "Citing Paper")]},
+        "search=": {"results": [_work("W1", "Original Paper")]},
+        "filter=openalex_id:W1": {"results": [{"id": "https://openalex.org/W1", "concepts": []}]}
+    })
+
+    related = await paper_service.get_related_papers(
+        uuid.uuid4(), title="Original Paper", abstract="We study things. More text."
+    )
+
+    assert [paper["title"] for paper in related] == ["Citing Paper"]
+    assert related[0]["authors"] == [
+        {"name": "A. Author", "position": "first", "affiliations": ["Uni"]}
+    ]
+    assert related[0]["pdf_url"] == "https://example.org/W2.pdf"
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_falls_back_to_title_and_concepts(openalex):
+    """Test the title search fallback and the concept lookup when nothing cites the paper."""
+    openalex({
+        "filter=cites:W1": {"results": []},
+        "filter=concepts.id:C9": {"results": [_work("W3", "Similar Paper")]},
+        "search=Original": {"results": [_work("W1", "Original Paper")]},
+        "search=": {"results": []},
+        "filter=openalex_id:W1": {"results": [{"id": "https://openalex.org/W1", "concepts": [{"id": "C9"}]}]}
+    })
+
+    related = await paper_service.get_related_papers(
+        uuid.uuid4(), title="Original Paper", abstract="We study things. More text."
+    )
+
+    assert [paper["title"] for paper in related] == ["Similar Paper"]
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_uses_prefetched_paper(openalex, monkeypatch):
+    """Test that a prefetched paper record is used without another database lookup."""
+    openalex({
+        "filter=cites:W1": {"results": [_work("W2", "Citing Paper")]},
+        "search=": {"results": [_work("W1", "Original Paper")]}
+    })
+
+    async def fail_lookup(paper_id):
+        raise AssertionError("paper should not be fetched again")
+
+    monkeypatch.setattr("app.database.supabase_client.get_paper_by_id", fail_lookup)
+
+    related = await paper_service.get_related_papers(
+        uuid.uuid4(), paper={"title": "Original Paper", "abstract": None}
+    )
+
+    assert [paper["title"] for paper in related] == ["Citing Paper"]
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_empty_abstract_falls_back_to_record(openalex):
+    """Test that an empty abstract argument doesn't hide the abstract in the paper record."""
+    requested = openalex({
+        "filter=cites:W1": {"results": [_work("W2", "Citing Paper")]},
+        "search=": {"results": [_work("W1", "Original Paper")]}
+    })
+
+    related = await paper_service.get_related_papers(
+        uuid.uuid4(), paper={"title": "Original Paper", "abstract": "Stored abstract. More."}, abstract=""
+    )
+
+    assert [paper["title"] for paper in related] == ["Citing Paper"]
+    assert any("search=Stored abstract" in url for url in requested)
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_serves_cached_results(openalex):
+    """Test that a second lookup for the same paper is answered from the cache."""
+    requested = openalex({
+        "filter=cites:W1": {"results": [_work("W2", "Citing Paper")]},
+        "search=": {"results": [_work("W1", "Original Paper")]}
+    })
+
+    first = await paper_service.get_related_papers(uuid.uuid4(), title="T", abstract="We study things.")
+    request_count = len(requested)
+    second = await paper_service.get_related_papers(uuid.uuid4(), title="T", abstract="We study things.")
+
+    assert second == first
+    assert len(requested) == request_count
+
+
+@pytest.mark.asyncio
+async def test_get_related_papers_revalidates_stale_cache(openalex, monkeypatch):
+    """Test that a 304 on the search reuses its cached results but reruns the citation lookup."""
+    await paper_service._save_related_papers_cache(
+        paper_service.hashlib.sha1(b"We study things").hexdigest(),
+        [{"title": "Stale Paper"}],
+        [_work("W1", "Original Paper")],
+        '"abc"'
+    )
+    monkeypatch.setattr(paper_service, "OPENALEX_CACHE_TTL_SECONDS", 0)
+    seen_etags = []
+
+    def handler(request):
+        url = unquote_plus(str(request.url))
+        if "search=" in url:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            return httpx.Response(304)
+        if "filter=cites:W1" in url:
+            return httpx.Response(200, json={"results": [_work("W2", "Citing Paper")]})
+        return httpx.Response(404)
+
+    monkeypatch.setattr(
+        paper_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    related = await paper_service.get_related_papers(uuid.uuid4(), title="T", abstract="We study things.")
+
+    assert [paper["title"] for paper in related] == ["Citing Paper"]
+    assert '"abc"' in seen_etags
+
+
+@pytest.mark.asyncio
+async def test_write_cache_entry_removes_temp_file_on_failure(monkeypatch, tmp_path):
+    """Test that a failed cache write leaves neither the entry nor its temporary file behind."""
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(paper_service.os, "replace", failing_replace)
+
+    await paper_service._write_cache_entry(tmp_path / "entry.json", {"papers": []})
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_work_batcher_coalesces_lookups(openalex):
+    """Test that concurrent work lookups share a single OpenAlex request."""
+    requested = openalex({
+        "filter=openalex_id:": {"results": [
+            {"id": "https://openalex.org/W1", "concepts": [{"id": "C1"}]},
+            {"id": "https://openalex.org/W2", "concepts": [{"id": "C2"}]}
+        ]}
+    })
+    batcher = paper_service.OpenAlexWorkBatcher(max_batch_size=10, max_queue_time=0.01)
+
+    works = await asyncio.gather(
+        batcher.process("W1"), batcher.process("W2"), batcher.process("W3")
+    )
+
+    assert [work and work["concepts"][0]["id"] for work in works] == ["C1", "C2", None]
+    assert len(requested) == 1
+
+
+ARXIV_FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <title>ArXiv Query</title>
+  <entry>
+    <id>http://arxiv.org/abs/2101.12345v1</id>
+    <published>2021-01-29T18:00:00Z</published>
+    <title>A Test
+  Paper</title>
+    <summary>We study
+  attention.</summary>
+    <author><name>Ada Lovelace</name></author>
+    <author><name>Alan Turing</name></author>
+    <arxiv:doi>10.1000/test</arxiv:doi>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+@pytest.mark.asyncio
+async def test_fetch_arxiv_metadata_parses_feed(monkeypatch):
+    """Test that the arXiv Atom feed is turned into PaperMetadata."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=ARXIV_FEED))
+    monkeypatch.setattr(paper_service, "_client", httpx.AsyncClient(transport=transport))
+
+    metadata = await paper_service.fetch_arxiv_metadata("2101.12345", force=True)
+
+    assert metadata.title == "A Test   Paper"
+    assert metadata.abstract == "We study   attention."
+    assert [author.name for author in metadata.authors] == ["Ada Lovelace", "Alan Turing"]
+    assert metadata.categories == ["cs.AI", "cs.LG"]
+    assert metadata.publication_date.year == 2021
+
+
+@pytest.mark.asyncio
+async def test_fetch_arxiv_metadata_is_cached(monkeypatch):
+    """Test that repeated lookups reuse the cached metadata unless forced."""
+    requests_made = []
+
+    def handler(request):
+        requests_made.append(request.url)
+        return httpx.Response(200, content=ARXIV_FEED)
+
+    monkeypatch.setattr(paper_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(paper_service, "_arxiv_metadata_cache", paper_service.OrderedDict())
+
+    first = await paper_service.fetch_arxiv_metadata("2101.12345")
+    first.title = "Changed by caller"
+    second = await paper_service.fetch_arxiv_metadata("2101.12345")
+    await paper_service.fetch_arxiv_metadata("2101.12345", force=True)
+
+    assert second.title == "A Test   Paper"
+    assert len(requests_made) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_arxiv_metadata_invalid_id():
+    """Test that malformed arXiv IDs are rejected before any request is made."""
+    with pytest.raises(paper_service.InvalidArXivLinkError):
+        await paper_service.fetch_arxiv_metadata("not-an-id")
+
+
+def test_parse_arxiv_atom_without_entries():
+    """Test that a feed with no entries yields None."""
+    body = b'<feed xmlns="http://www.w3.org/2005/Atom"><title>ArXiv Query</title></feed>'
+
+    assert paper_service._parse_arxiv_atom(body) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pub_date, expected", [
+    ("2023-05-01", (2023, 5, 1)),
+    ("05/01/2023", (2023, 5, 1)),
+])
+async def test_extract_metadata_from_text_parses_dates(monkeypatch, tmp_path, pub_date, expected):
+    """Test that ISO and MM/DD/YYYY publication dates are both understood."""
+    monkeypatch.setattr(paper_service, "METADATA_CACHE_DIR", tmp_path)
+
+    async def fake_extraction(text, prompt, max_tokens=1000, text_bytes=None):
+        return {"title": "A Paper", "authors": [], "abstract": "Text.", "publication_date": pub_date}
+
+    monkeypatch.setattr(paper_service, "generate_structured_extraction", fake_extraction)
+
+    metadata = await paper_service.extract_metadata_from_text("A Paper\nText.")
+
+    assert metadata.title == "A Paper"
+    date = metadata.publication_date
+    assert (date.year, date.month, date.day) == expected
+
+
+@pytest.mark.asyncio
+async def test_extract_metadata_from_text_uses_disk_cache(monkeypatch, tmp_path):
+    """Test that extracting the same text twice only calls the LLM once."""
+    monkeypatch.setattr(paper_service, "METADATA_CACHE_DIR", tmp_path)
+    calls = []
+
+    async def fake_extraction(text, prompt, max_tokens=1000, text_bytes=None):
+        calls.append(text)
+        return {"title": "A Paper", "authors": [{"name": "A. Author"}], "abstract": "Text."}
+
+    monkeypatch.setattr(paper_service, "generate_structured_extraction", fake_extraction)
+
+    first = await paper_service.extract_metadata_from_text("A Paper\nText.")
+    second = await paper_service.extract_metadata_from_text("A Paper\nText.")
+
+    assert len(calls) == 1
+    assert second.title == first.title == "A Paper"
+    assert [author.name for author in second.authors] == ["A. Author"]
+
+
+def test_format_authorship_handles_partial_records():
+    """Test that authorships missing optional fields still produce an author entry."""
+    assert paper_service._format_authorship({"author": {"display_name": "B. Author"}}) == {
+        "name": "B. Author",
+        "position": "",
+        "affiliations": []
+    }
@@ -262,4 +262,24 @@ def test_get_related_papers_paper_not_found(mock_dependencies):
         
         # Check the response
         assert response.status_code == 404
-        assert response.json()["detail"] == f"Paper with ID {paper_id} not found" 
\ No newline at end of file
+        assert response.json()["detail"] == f"Paper with ID {paper_id} not found" 
+
+@pytest.mark.asyncio
+async def test_download_and_run_immediate_processing_extracts_from_cached_file():
+    """Test that downloaded PDFs are extracted from the cached file without loading their bytes."""
+    from app.api.v1.endpoints import papers
+
+    paper_id = uuid.uuid4()
+    with patch.object(papers, "update_paper", AsyncMock()), \
+         patch.object(papers, "download_pdf", AsyncMock(return_value=("/cache/paper.pdf", True))), \
+         patch.object(papers, "extract_text_from_pdf", AsyncMock(return_value="Full text")) as extract_path, \
+         patch.object(papers, "extract_text_from_pdf_bytes", AsyncMock()) as extract_bytes, \
+         patch.object(papers, "run_immediate_processing", AsyncMock()) as run_processing:
+        await papers.download_and_run_immediate_processing(
+            "https://example.org/paper.pdf", SourceType.PDF, paper_id
+        )
+
+    extract_path.assert_awaited_once_with("/cache/paper.pdf")
+    extract_bytes.assert_not_awaited()
+    assert run_processing.await_args.kwargs["full_text"] == "Full text"
+    assert run_processing.await_args.kwargs["file_content"] is None
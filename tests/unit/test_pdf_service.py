@@ -0,0 +1,799 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import fitz
+import pytest
+
+from app.core.exceptions import PDFDownloadError, InvalidPDFUrlError
+from app.services import pdf_service
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 4096 + b"\n%%EOF"
+
+
+@pytest.fixture(autouse=True)
+def empty_text_cache(monkeypatch):
+    """Start every test with an empty in-memory text cache."""
+    monkeypatch.setattr(pdf_service, "_text_cache", OrderedDict())
+    monkeypatch.setattr(pdf_service, "_text_cache_chars", 0)
+
+
+@pytest.fixture
+def pdf_server(monkeypatch, tmp_path):
+    """Serve PDFs from a mock transport and cache them in a temporary directory."""
+    monkeypatch.setattr(pdf_service, "PDF_CACHE_DIR", tmp_path)
+    requested = []
+
+    def install(body=PDF_BYTES, status_code=200, content_type="application/pdf"):
+        def handler(request):
+            if request.method == "GET":
+                requested.append(str(request.url))
+            return httpx.Response(status_code, content=body, headers={"content-type": content_type})
+
+        monkeypatch.setattr(
+            pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+        return requested
+
+    return install
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_writes_cache(pdf_server):
+    """Test that a downloaded PDF is written to the cache and reused afterwards."""
+    requested = pdf_server()
+
+    path, is_new = await pdf_service.download_pdf("https://example.org/paper.pdf")
+    cached_path, cached_is_new = await pdf_service.download_pdf("https://example.org/paper.pdf")
+
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+    assert (is_new, cached_is_new) == (True, False)
+    assert cached_path == path
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_converts_arxiv_abstract_url(pdf_server):
+    """Test that arXiv abstract URLs are rewritten to their PDF URL."""
+    requested = pdf_server()
+
+    await pdf_service.download_pdf("https://arxiv.org/abs/2101.12345")
+
+    assert requested == ["https://arxiv.org/pdf/2101.12345.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_rejects_http_errors(pdf_server):
+    """Test that a non-200 response raises PDFDownloadError."""
+    pdf_server(status_code=404)
+
+    with pytest.raises(PDFDownloadError):
+        await pdf_service.download_pdf("https://example.org/missing.pdf")
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_coalesces_concurrent_downloads(pdf_server):
+    """Test that concurrent requests for the same PDF download it only once."""
+    requested = pdf_server()
+
+    results = await asyncio.gather(
+        *(pdf_service.download_pdf("https://example.org/shared.pdf") for _ in range(3))
+    )
+
+    assert len({path for path, _ in results}) == 1
+    assert sorted(is_new for _, is_new in results) == [False, False, True]
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_survives_cancelled_first_caller(monkeypatch, tmp_path):
+    """Test that cancelling the caller that started a download doesn't fail the callers joining it."""
+    monkeypatch.setattr(pdf_service, "PDF_CACHE_DIR", tmp_path)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    requested = []
+
+    async def handler(request):
+        if request.method == "GET":
+            requested.append(str(request.url))
+            started.set()
+            await release.wait()
+        return httpx.Response(200, content=PDF_BYTES, headers={"content-type": "application/pdf"})
+
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    url = "https://example.org/cancelled.pdf"
+
+    first = asyncio.create_task(pdf_service.download_pdf(url))
+    await started.wait()
+    second = asyncio.create_task(pdf_service.download_pdf(url))
+    # Let the second caller get past its cache check and join the download
+    await asyncio.sleep(0.1)
+    first.cancel()
+    release.set()
+
+    path, _ = await second
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+    assert len(requested) == 1
+    assert pdf_service._inflight_downloads == {}
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_failure_leaves_no_cache_file(pdf_server, tmp_path):
+    """Test that a failed download doesn't leave a partial file in the cache."""
+    pdf_server(status_code=500)
+
+    with pytest.raises(PDFDownloadError):
+        await pdf_service.download_pdf("https://example.org/broken.pdf")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_replaces_truncated_cache_file(pdf_server, tmp_path):
+    """Test that an empty cached file is treated as missing and downloaded again."""
+    requested = pdf_server()
+    url = "https://example.org/truncated.pdf"
+    cache_path = tmp_path / f"{pdf_service._cache_key(url)}.pdf"
+    cache_path.write_bytes(b"")
+
+    path, is_new = await pdf_service.download_pdf(url)
+
+    assert is_new
+    assert len(requested) == 1
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+
+
+@pytest.mark.asyncio
+async def test_proxy_pdf_from_url_stores_pdf(pdf_server, monkeypatch, tmp_path):
+    """Test that proxied PDFs are written under the proxied PDF directory."""
+    pdf_server()
+    proxied_dir = tmp_path / "proxied"
+    monkeypatch.setattr(pdf_service, "PROXIED_PDF_DIR", proxied_dir)
+
+    result = await pdf_service.proxy_pdf_from_url("https://example.org/paper.pdf", paper_id="abc")
+
+    assert result == {"url": "/static/proxied_pdfs/abc.pdf"}
+    assert (proxied_dir / "abc.pdf").read_bytes() == PDF_BYTES
+    assert sorted(path.name for path in proxied_dir.iterdir()) == ["abc.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_proxy_pdf_from_url_reuses_cached_download(pdf_server, monkeypatch, tmp_path):
+    """Test that proxying an already cached PDF links the cached file instead of fetching it again."""
+    requested = pdf_server()
+    proxied_dir = tmp_path / "proxied"
+    monkeypatch.setattr(pdf_service, "PROXIED_PDF_DIR", proxied_dir)
+
+    cache_path, _ = await pdf_service.download_pdf("https://arxiv.org/abs/2101.12345")
+    result = await pdf_service.proxy_pdf_from_url("https://arxiv.org/pdf/2101.12345v2")
+
+    filename = f"{pdf_service._cache_key('https://arxiv.org/pdf/2101.12345.pdf')}.pdf"
+    assert result == {"url": f"/static/proxied_pdfs/{filename}"}
+    assert len(requested) == 1
+    assert pdf_service.os.stat(proxied_dir / filename).st_ino == pdf_service.os.stat(cache_path).st_ino
+
+
+@pytest.mark.asyncio
+async def test_proxy_pdf_from_url_coalesces_concurrent_proxies(pdf_server, monkeypatch, tmp_path):
+    """Test that concurrent proxy requests for the same PDF publish it only once."""
+    requested = pdf_server()
+    proxied_dir = tmp_path / "proxied"
+    monkeypatch.setattr(pdf_service, "PROXIED_PDF_DIR", proxied_dir)
+    published = []
+    publish = pdf_service._publish_cached_pdf
+
+    def record_publish(cache_path, dest_path):
+        published.append(dest_path)
+        publish(cache_path, dest_path)
+
+    monkeypatch.setattr(pdf_service, "_publish_cached_pdf", record_publish)
+
+    results = await asyncio.gather(
+        *(pdf_service.proxy_pdf_from_url("https://example.org/shared.pdf") for _ in range(3))
+    )
+
+    assert len({result["url"] for result in results}) == 1
+    assert len(published) == 1
+    assert len(requested) == 1
+    assert not pdf_service._inflight_proxies
+
+
+@pytest.mark.asyncio
+async def test_proxy_pdf_from_url_rejects_non_pdf(pdf_server, monkeypatch, tmp_path):
+    """Test that proxying a URL that isn't a PDF raises InvalidPDFUrlError."""
+    pdf_server(body=b"<html></html>", content_type="text/html")
+    monkeypatch.setattr(pdf_service, "PROXIED_PDF_DIR", tmp_path / "proxied")
+
+    with pytest.raises(InvalidPDFUrlError):
+        await pdf_service.proxy_pdf_from_url("https://example.org/page")
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_retries_rate_limited_responses(pdf_server, monkeypatch):
+    """Test that 429 responses are retried before the PDF is downloaded."""
+    monkeypatch.setattr(pdf_service, "PDF_DOWNLOAD_RETRY_BASE_DELAY", 0)
+    statuses = iter([429, 503, 200])
+
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        return httpx.Response(next(statuses), content=PDF_BYTES, headers={"content-type": "application/pdf"})
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    path, is_new = await pdf_service.download_pdf("https://example.org/busy.pdf")
+
+    assert is_new
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_releases_slot_while_backing_off(pdf_server, monkeypatch):
+    """Test that a download waiting out Retry-After doesn't hold the download semaphore."""
+    monkeypatch.setattr(pdf_service, "_download_semaphore", asyncio.Semaphore(1))
+    monkeypatch.setattr(pdf_service, "PDF_DOWNLOAD_MAX_RETRY_AFTER", 0.2)
+    refused = []
+
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        if "busy" in str(request.url) and not refused:
+            refused.append(request.url)
+            return httpx.Response(429, headers={"retry-after": "120"})
+        return httpx.Response(200, content=PDF_BYTES, headers={"content-type": "application/pdf"})
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    finished = []
+
+    async def fetch(url):
+        await pdf_service.download_pdf(url)
+        finished.append(url)
+
+    busy = asyncio.create_task(fetch("https://example.org/busy.pdf"))
+    while not refused:
+        await asyncio.sleep(0)
+    await fetch("https://example.org/free.pdf")
+    await busy
+
+    assert finished == ["https://example.org/free.pdf", "https://example.org/busy.pdf"]
+
+
+def test_retry_delay_honours_retry_after(monkeypatch):
+    """Test that Retry-After seconds and dates are used, capped, and backoff covers the rest."""
+    monkeypatch.setattr(pdf_service, "PDF_DOWNLOAD_RETRY_BASE_DELAY", 1.0)
+    monkeypatch.setattr(pdf_service, "PDF_DOWNLOAD_MAX_RETRY_AFTER", 60.0)
+
+    assert pdf_service._retry_delay(httpx.Headers({"retry-after": "7"}), 0) == 7.0
+    assert pdf_service._retry_delay(httpx.Headers({"retry-after": "3600"}), 0) == 60.0
+    assert pdf_service._retry_delay(httpx.Headers({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}), 0) == 0.0
+    assert pdf_service._retry_delay(httpx.Headers({"retry-after": "soon"}), 2) == 4.0
+    assert pdf_service._retry_delay(httpx.Headers(), 1) == 2.0
+
+
+@pytest.mark.asyncio
+async def test_download_pdfs_reports_failures_per_url(pdf_server, monkeypatch):
+    """Test that one failing URL doesn't prevent the others from downloading."""
+    def handler(request):
+        if "missing" in str(request.url):
+            return httpx.Response(404)
+        return httpx.Response(200, content=PDF_BYTES, headers={"content-type": "application/pdf"})
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    results = await pdf_service.download_pdfs(
+        ["https://example.org/a.pdf", "https://example.org/missing.pdf", "https://example.org/b.pdf"]
+    )
+
+    assert isinstance(results[1], PDFDownloadError)
+    assert [result[1] for result in (results[0], results[2])] == [True, True]
+
+
+def test_read_pdf_file_to_bytes_maps_file(tmp_path):
+    """Test that PDF files are mapped into memory, including empty ones."""
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(PDF_BYTES)
+    empty_path = tmp_path / "empty.pdf"
+    empty_path.write_bytes(b"")
+
+    content = pdf_service.read_pdf_file_to_bytes(str(pdf_path))
+
+    assert isinstance(content, memoryview)
+    assert content.tobytes() == PDF_BYTES
+    assert len(pdf_service.read_pdf_file_to_bytes(str(empty_path))) == 0
+
+
+def _text_pdf(text):
+    """Build a one-page PDF containing the given text."""
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    return doc.tobytes()
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_pdf_bytes_reads_from_memory(tmp_path):
+    """Test that text is extracted from PDF bytes and memory-mapped views in the process pool."""
+    pdf_path = tmp_path / "hello.pdf"
+    pdf_path.write_bytes(_text_pdf("Hello PDF"))
+
+    try:
+        from_bytes = await pdf_service.extract_text_from_pdf_bytes(pdf_path.read_bytes())
+        from_view = await pdf_service.extract_text_from_pdf_bytes(pdf_service.read_pdf_file_to_bytes(str(pdf_path)))
+    finally:
+        pdf_service.shutdown_pdf_pool()
+
+    assert from_bytes.strip() == from_view.strip() == "Hello PDF"
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_migrates_legacy_cache_file(pdf_server, tmp_path):
+    """Test that PDFs cached under their legacy MD5 name are reused and renamed."""
+    requested = pdf_server()
+    url = "https://example.org/legacy.pdf"
+    legacy_path = tmp_path / f"{pdf_service.hashlib.md5(url.encode()).hexdigest()}.pdf"
+    legacy_path.write_bytes(PDF_BYTES)
+
+    path, is_new = await pdf_service.download_pdf(url)
+
+    assert not is_new
+    assert requested == []
+    assert path == str(tmp_path / f"{pdf_service._cache_key(url)}.pdf")
+    assert not legacy_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_revalidates_with_etag(pdf_server, monkeypatch):
+    """Test that validate=True sends the stored ETag and reuses the cache on 304."""
+    seen_headers = []
+
+    def handler(request):
+        if request.method == "HEAD":
+            return httpx.Response(405)
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=PDF_BYTES, headers={"content-type": "application/pdf", "etag": '"v1"'}
+        )
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    url = "https://example.org/versioned.pdf"
+
+    path, is_new = await pdf_service.download_pdf(url)
+    revalidated_path, revalidated_is_new = await pdf_service.download_pdf(url, validate=True)
+
+    assert (is_new, revalidated_is_new) == (True, False)
+    assert revalidated_path == path
+    assert seen_headers == [None, '"v1"']
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_shares_inflight_failure(pdf_server):
+    """Test that callers joining a failing download all see the error and nothing is left in flight."""
+    requested = pdf_server(status_code=500)
+
+    results = await asyncio.gather(
+        *(pdf_service.download_pdf("https://example.org/flaky.pdf") for _ in range(3)),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, PDFDownloadError) for result in results)
+    assert len(requested) == 1
+    assert pdf_service._inflight_downloads == {}
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_creates_cache_dir_on_demand(pdf_server, monkeypatch, tmp_path):
+    """Test that the PDF cache directory is created when the first PDF is written."""
+    pdf_server()
+    cache_dir = tmp_path / "nested" / "pdf_cache"
+    monkeypatch.setattr(pdf_service, "PDF_CACHE_DIR", cache_dir)
+
+    path, _ = await pdf_service.download_pdf("https://example.org/fresh.pdf")
+
+    assert cache_dir.is_dir()
+    assert path.startswith(str(cache_dir))
+
+
+@pytest.mark.asyncio
+async def test_extract_text_in_pool_keeps_file(tmp_path):
+    """Test that text is extracted in the process pool without deleting the PDF."""
+    pdf_path = tmp_path / "hello.pdf"
+    pdf_path.write_bytes(_text_pdf("Hello PDF"))
+
+    try:
+        text = await pdf_service._extract_text_in_pool(str(pdf_path))
+    finally:
+        pdf_service.shutdown_pdf_pool()
+
+    assert text.strip() == "Hello PDF"
+    assert pdf_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_preflight_rejects_non_pdf(pdf_server, monkeypatch):
+    """Test that a HEAD response with a non-PDF type stops the download before any GET."""
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        return httpx.Response(200, headers={"content-type": "text/html", "content-length": "10"})
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    with pytest.raises(InvalidPDFUrlError):
+        await pdf_service.download_pdf("https://example.org/landing-page")
+
+    assert methods == ["HEAD"]
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_preallocates_from_content_length(pdf_server, monkeypatch):
+    """Test that an overstated Content-Length doesn't leave padding in the cached PDF."""
+    def handler(request):
+        headers = {"content-type": "application/pdf"}
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={**headers, "content-length": str(len(PDF_BYTES) * 2)})
+        return httpx.Response(200, content=PDF_BYTES, headers=headers)
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    path, _ = await pdf_service.download_pdf("https://example.org/sized.pdf")
+
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+
+
+def _ranged_handler(ranges_seen, honour_ranges=True):
+    """Build a mock handler that serves PDF_BYTES with byte range support."""
+    def handler(request):
+        headers = {"content-type": "application/pdf", "accept-ranges": "bytes", "etag": '"r1"'}
+        if request.method == "HEAD":
+            return httpx.Response(200, headers={**headers, "content-length": str(len(PDF_BYTES))})
+
+        byte_range = request.headers.get("Range")
+        ranges_seen.append(byte_range)
+        if byte_range and honour_ranges:
+            start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+            return httpx.Response(206, content=PDF_BYTES[start:end + 1], headers=headers)
+        return httpx.Response(200, content=PDF_BYTES, headers=headers)
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("honour_ranges", [True, False])
+async def test_download_pdf_segmented(pdf_server, monkeypatch, honour_ranges):
+    """Test that large PDFs are fetched as byte ranges, falling back when ranges are ignored."""
+    ranges_seen = []
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "PDF_SEGMENTED_DOWNLOAD_MIN_SIZE", 1024)
+    monkeypatch.setattr(
+        pdf_service, "_client",
+        httpx.AsyncClient(transport=httpx.MockTransport(_ranged_handler(ranges_seen, honour_ranges)))
+    )
+
+    path, is_new = await pdf_service.download_pdf("https://example.org/large.pdf")
+
+    assert is_new
+    with open(path, "rb") as f:
+        assert f.read() == PDF_BYTES
+    assert len([r for r in ranges_seen if r]) == pdf_service.PDF_DOWNLOAD_SEGMENTS
+    assert ranges_seen.count(None) == (0 if honour_ranges else 1)
+
+
+def test_read_pdf_file_to_bytes_reuses_mapping(tmp_path, monkeypatch):
+    """Test that mappings are reused until the file is replaced and evicted beyond the cache size."""
+    monkeypatch.setattr(pdf_service, "_mmap_cache", pdf_service.OrderedDict())
+    monkeypatch.setattr(pdf_service, "PDF_MMAP_CACHE_SIZE", 1)
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(PDF_BYTES)
+
+    first = pdf_service.read_pdf_file_to_bytes(str(pdf_path))
+    second = pdf_service.read_pdf_file_to_bytes(str(pdf_path))
+    assert first.obj is second.obj
+
+    replacement = tmp_path / "replacement.pdf"
+    replacement.write_bytes(PDF_BYTES[::-1])
+    pdf_service.os.replace(replacement, pdf_path)
+    assert pdf_service.read_pdf_file_to_bytes(str(pdf_path)).tobytes() == PDF_BYTES[::-1]
+
+    other_path = tmp_path / "other.pdf"
+    other_path.write_bytes(PDF_BYTES)
+    pdf_service.read_pdf_file_to_bytes(str(other_path))
+    assert list(pdf_service._mmap_cache) == [str(other_path)]
+    assert first.tobytes() == PDF_BYTES
+
+
+@pytest.mark.parametrize("url_or_id, expected", [
+    ("arxiv:2101.12345", "https://arxiv.org/pdf/2101.12345.pdf"),
+    ("https://arxiv.org/abs/2101.12345v2", "https://arxiv.org/pdf/2101.12345.pdf"),
+    ("http://export.arxiv.org/pdf/2101.12345v1.pdf", "https://arxiv.org/pdf/2101.12345.pdf"),
+    ("https://arxiv.org/pdf/2101.12345", "https://arxiv.org/pdf/2101.12345.pdf"),
+    ("https://arxiv.org/abs/hep-th/9901001v3?context=x", "https://arxiv.org/pdf/hep-th/9901001.pdf"),
+    ("https://example.org/2101.12345.pdf", "https://example.org/2101.12345.pdf"),
+])
+def test_canonicalize_arxiv_references(url_or_id, expected):
+    """Test that every form of an arXiv reference maps to the same PDF URL."""
+    assert pdf_service._canonicalize(url_or_id) == expected
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_shares_cache_across_arxiv_forms(pdf_server):
+    """Test that abstract and PDF URLs of the same arXiv paper are downloaded once."""
+    requested = pdf_server()
+
+    first, _ = await pdf_service.download_pdf("https://arxiv.org/abs/2101.12345v2")
+    second, is_new = await pdf_service.download_pdf("https://arxiv.org/pdf/2101.12345.pdf")
+
+    assert second == first
+    assert not is_new
+    assert len(requested) == 1
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_revalidates_stale_cache(pdf_server, monkeypatch):
+    """Test that a cached PDF older than the TTL is revalidated and its TTL restarted on 304."""
+    methods = []
+
+    def handler(request):
+        methods.append(request.method)
+        if request.headers.get("If-None-Match"):
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=PDF_BYTES, headers={"content-type": "application/pdf", "etag": '"v1"'}
+        )
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    url = "https://example.org/aging.pdf"
+
+    path, _ = await pdf_service.download_pdf(url)
+    pdf_service.os.utime(path, (0, 0))
+    methods.clear()
+
+    stale_path, is_new = await pdf_service.download_pdf(url)
+    await pdf_service.download_pdf(url)
+
+    assert (stale_path, is_new) == (path, False)
+    assert methods == ["GET"]
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_links_identical_content(pdf_server, tmp_path):
+    """Test that two URLs serving the same bytes share one file on disk."""
+    pdf_server()
+
+    first, _ = await pdf_service.download_pdf("https://example.org/mirror-a.pdf")
+    second, _ = await pdf_service.download_pdf("https://example.org/mirror-b.pdf")
+
+    assert first != second
+    assert pdf_service.os.stat(first).st_ino == pdf_service.os.stat(second).st_ino
+    assert len(list((tmp_path / "by_content").iterdir())) == 1
+
+
+@pytest.mark.asyncio
+async def test_proxy_pdf_from_url_converts_arxiv_abstract_url(pdf_server, monkeypatch, tmp_path):
+    """Test that proxied arXiv abstract URLs with versions and query strings fetch the PDF URL."""
+    requested = pdf_server()
+    monkeypatch.setattr(pdf_service, "PROXIED_PDF_DIR", tmp_path)
+
+    await pdf_service.proxy_pdf_from_url("http://arxiv.org/abs/2101.12345v3?context=cs", paper_id="abc")
+
+    assert requested == ["https://arxiv.org/pdf/2101.12345.pdf"]
+
+
+def test_remove_orphaned_content_prunes_unshared_links(tmp_path):
+    """Test that content links no cached PDF shares any more are removed."""
+    content_dir = tmp_path / pdf_service.CONTENT_DIR_NAME
+    content_dir.mkdir()
+    (content_dir / "orphan.pdf").write_bytes(PDF_BYTES)
+    (content_dir / "shared.pdf").write_bytes(PDF_BYTES)
+    pdf_service.os.link(content_dir / "shared.pdf", tmp_path / "cached.pdf")
+
+    pdf_service._remove_orphaned_content(content_dir)
+
+    assert [path.name for path in content_dir.iterdir()] == ["shared.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_download_and_process_paper_caches_text(pdf_server, monkeypatch):
+    """Test that text extracted from a cached PDF is reused until the PDF's content changes."""
+    pdf_server()
+    extractions = []
+
+    async def fake_extract(path):
+        extractions.append(path)
+        return "Extracted text"
+
+    monkeypatch.setattr(pdf_service, "_extract_text_in_pool", fake_extract)
+    url = "https://example.org/text.pdf"
+
+    first = await pdf_service.download_and_process_paper(url)
+    pdf_service._text_cache.clear()
+    second = await pdf_service.download_and_process_paper(url)
+    pdf_path = extractions[0]
+    # Revalidation touches the PDF without changing it, so the text stays current
+    future = pdf_service.time.time() + 60
+    pdf_service.os.utime(pdf_path, (future, future))
+    pdf_service._text_cache.clear()
+    await pdf_service.download_and_process_paper(url)
+    with open(pdf_path, "ab") as f:
+        f.write(b"%% changed")
+    pdf_service._text_cache.clear()
+    await pdf_service.download_and_process_paper(url)
+
+    assert first == second == "Extracted text"
+    assert extractions == [pdf_path, pdf_path]
+
+
+@pytest.mark.asyncio
+async def test_cached_text_round_trips_line_endings(tmp_path):
+    """Test that cached text keeps its carriage returns and unreadable sidecars are a miss."""
+    txt_path = tmp_path / "paper.txt"
+    text = "line one\r\nline two\rline three\n"
+
+    await pdf_service._write_cached_text(txt_path, "hash", text)
+    cached = await pdf_service._read_cached_text(txt_path, "hash")
+    txt_path.write_bytes(b"hash\n\xff\xfe not utf-8")
+    undecodable = await pdf_service._read_cached_text(txt_path, "hash")
+
+    assert cached == text
+    assert undecodable is None
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_pdf_bytes_reuses_text_for_same_content(monkeypatch):
+    """Test that extracting identical PDF content twice only runs the extraction once."""
+    extractions = []
+
+    async def fake_extract(content):
+        extractions.append(bytes(content))
+        return f"text {len(extractions)}"
+
+    monkeypatch.setattr(pdf_service, "_extract_bytes_text_in_pool", fake_extract)
+
+    first = await pdf_service.extract_text_from_pdf_bytes(b"%PDF-1.4 same")
+    second = await pdf_service.extract_text_from_pdf_bytes(memoryview(b"%PDF-1.4 same"))
+    other = await pdf_service.extract_text_from_pdf_bytes(b"%PDF-1.4 other")
+
+    assert (first, second, other) == ("text 1", "text 1", "text 2")
+    assert len(extractions) == 2
+
+
+def test_text_cache_evicts_least_recently_used(monkeypatch):
+    """Test that the text cache stays under its character budget by evicting old entries."""
+    monkeypatch.setattr(pdf_service, "PDF_TEXT_CACHE_MAX_CHARS", 10)
+
+    pdf_service._cache_text("a", "aaaa")
+    pdf_service._cache_text("b", "bbbb")
+    assert pdf_service._get_cached_text("a") == "aaaa"
+    pdf_service._cache_text("c", "cccc")
+    pdf_service._cache_text("huge", "x" * 11)
+
+    assert pdf_service._get_cached_text("b") is None
+    assert pdf_service._get_cached_text("huge") is None
+    assert list(pdf_service._text_cache) == ["a", "c"]
+    assert pdf_service._text_cache_chars == 8
+
+
+@pytest.mark.asyncio
+async def test_extract_text_from_pdf_keeps_cached_file(tmp_path):
+    """Test that extracting text from a cached PDF leaves the PDF in place."""
+    pdf_path = tmp_path / "cached.pdf"
+    pdf_path.write_bytes(_text_pdf("Cached paper"))
+
+    text = await pdf_service.extract_text_from_pdf(str(pdf_path))
+
+    assert "Cached paper" in text
+    assert pdf_path.exists()
+    stored_hash, _, stored_text = (tmp_path / "cached.txt").read_text().partition("\n")
+    assert stored_hash == pdf_service._hash_content(pdf_path.read_bytes())
+    assert stored_text == text
+
+
+@pytest.mark.asyncio
+async def test_extract_texts_from_pdfs_returns_results_in_order(tmp_path):
+    """Test that batch extraction keeps input order and reports failures per PDF."""
+    first = tmp_path / "first.pdf"
+    first.write_bytes(_text_pdf("First paper"))
+    second = tmp_path / "second.pdf"
+    second.write_bytes(_text_pdf("Second paper"))
+
+    results = await pdf_service.extract_texts_from_pdfs(
+        [str(first), str(tmp_path / "missing.pdf"), str(second)]
+    )
+
+    assert "First paper" in results[0]
+    assert isinstance(results[1], Exception)
+    assert "Second paper" in results[2]
+
+
+def test_page_ranges_cover_every_page_in_order():
+    """Test that page ranges are contiguous, ordered and bounded by the worker count."""
+    assert pdf_service._page_ranges(10, 4) == [(0, 10)]
+    assert pdf_service._page_ranges(40, 4) == [(0, 14), (14, 28), (28, 40)]
+    assert pdf_service._page_ranges(200, 4) == [(0, 50), (50, 100), (100, 150), (150, 200)]
+
+
+@pytest.mark.asyncio
+async def test_extract_text_in_pool_splits_large_pdfs_across_workers(tmp_path, monkeypatch):
+    """Test that extracting a large PDF by page ranges gives the same text as one worker."""
+    doc = fitz.open()
+    for page_num in range(40):
+        doc.new_page().insert_text((72, 72), f"Page {page_num} con-\ntinues here")
+    pdf_path = tmp_path / "long.pdf"
+    pdf_path.write_bytes(doc.tobytes())
+    monkeypatch.setattr(pdf_service, "PDF_PARALLEL_EXTRACTION_MIN_SIZE", 0)
+    monkeypatch.setattr(pdf_service, "PDF_EXTRACTION_WORKERS", 3)
+    extracted_ranges = []
+    original = pdf_service.extract_text_from_pdf_sync
+
+    def recording_extract(path, start=0, stop=None):
+        extracted_ranges.append((start, stop))
+        return original(path, start, stop)
+
+    monkeypatch.setattr(pdf_service, "extract_text_from_pdf_sync", recording_extract)
+    # A single thread keeps the patched function visible and PyMuPDF calls serialized
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        monkeypatch.setattr(pdf_service, "_get_pdf_pool", lambda: pool)
+        text = await pdf_service._extract_text_in_pool(str(pdf_path))
+
+    assert extracted_ranges == [(0, 14), (14, 28), (28, 40)]
+    assert text == pdf_service._extract_clean_text_sync(str(pdf_path))
+    assert "Page 39 continues here" in text
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_revalidates_without_validators_using_head(pdf_server, monkeypatch, tmp_path):
+    """Test that a cached PDF without stored validators is kept when HEAD shows it is unchanged."""
+    requests_seen = []
+    last_modified = {"value": "Mon, 01 Jan 2001 00:00:00 GMT"}
+
+    def handler(request):
+        requests_seen.append(request.method)
+        headers = {
+            "content-type": "application/pdf",
+            "content-length": str(len(PDF_BYTES)),
+            "last-modified": last_modified["value"],
+            "etag": '"v1"',
+        }
+        if request.method == "HEAD":
+            return httpx.Response(200, headers=headers)
+        return httpx.Response(200, content=PDF_BYTES, headers=headers)
+
+    pdf_server()
+    monkeypatch.setattr(pdf_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    url = "https://example.org/no-validators.pdf"
+    cache_path = tmp_path / f"{pdf_service._cache_key(url)}.pdf"
+    cache_path.write_bytes(PDF_BYTES)
+
+    path, is_new = await pdf_service.download_pdf(url, validate=True)
+
+    assert (path, is_new) == (str(cache_path), False)
+    assert requests_seen == ["HEAD"]
+    assert pdf_service.orjson.loads(cache_path.with_suffix(".meta.json").read_bytes())["etag"] == '"v1"'
+
+    # A server copy modified after the cached one is downloaded again
+    cache_path.with_suffix(".meta.json").unlink()
+    last_modified["value"] = "Fri, 01 Jan 2100 00:00:00 GMT"
+    requests_seen.clear()
+
+    _, is_new = await pdf_service.download_pdf(url, validate=True)
+
+    assert is_new
+    assert requests_seen == ["HEAD", "GET"]
@@ -0,0 +1,32 @@
+import re
+
+import fitz
+
+from app.utils import pdf_utils
+
+
+def test_strip_non_printable_text_matches_regex_filter():
+    """Test that the translate-based filter keeps exactly printable ASCII plus whitespace."""
+    text = "Café \x00naïve\x7f\tline\r\nend — \U0001f600\x0b\ud800ok~ "
+
+    assert pdf_utils.strip_non_printable_text(text) == re.sub(r'[^\x20-\x7E\n\r\t]', '', text)
+    assert pdf_utils.strip_non_printable_text(text) == "Caf nave\tline\r\nend  ok~ "
+
+
+def test_clean_pdf_text_sync_strips_control_characters():
+    """Test that control characters are removed while tabs and newlines survive."""
+    assert pdf_utils.clean_pdf_text_sync("a\x00b\x08c\td\x1fe\x7ff\n") == "abc\tdef\n"
+
+
+def test_extract_text_from_pdf_bytes_sync_ignores_images():
+    """Test that pages with images and drawings yield only their text."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), "Caption text")
+    page.draw_rect(fitz.Rect(100, 100, 300, 300), color=(1, 0, 0), fill=(0, 0, 1))
+    pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+    page.insert_image(fitz.Rect(100, 400, 200, 500), pixmap=pixmap)
+
+    text = pdf_utils.extract_text_from_pdf_bytes_sync(doc.tobytes())
+
+    assert text.strip() == "Caption text"
@@ -0,0 +1,50 @@
+import httpx
+import pytest
+
+from app.core.exceptions import StorageError
+from app.services import storage_service
+
+
+@pytest.fixture
+def storage_requests(monkeypatch):
+    """Route the shared storage client through a mock transport and record request bodies."""
+    received = []
+
+    async def handler(request):
+        received.append((request, await request.aread()))
+        return httpx.Response(200, json={"Key": request.url.path})
+
+    monkeypatch.setattr(
+        storage_service, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return received
+
+
+@pytest.mark.asyncio
+async def test_upload_path_to_storage_streams_file(storage_requests, tmp_path, monkeypatch):
+    """Test that a file on disk is streamed to storage in chunks with its full size declared."""
+    monkeypatch.setattr(storage_service, "UPLOAD_CHUNK_SIZE", 1000)
+    content = b"%PDF-1.4 " + bytes(range(256)) * 20
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(content)
+
+    file_path = await storage_service.upload_path_to_storage(str(pdf_path), "paper.pdf")
+
+    assert file_path.endswith("_paper.pdf")
+    request, body = storage_requests[0]
+    assert body == content
+    assert request.headers["Content-Length"] == str(len(content))
+    assert request.headers["Content-Type"] == "application/pdf"
+
+
+@pytest.mark.asyncio
+async def test_upload_path_to_storage_rejects_large_files(storage_requests, tmp_path, monkeypatch):
+    """Test that oversized files are rejected before anything is sent."""
+    monkeypatch.setattr(storage_service, "MAX_FILE_SIZE", 10)
+    pdf_path = tmp_path / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 too large")
+
+    with pytest.raises(StorageError):
+        await storage_service.upload_path_to_storage(str(pdf_path), "paper.pdf")
+
+    assert storage_requests == []
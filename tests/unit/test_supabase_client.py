@@ -0,0 +1,33 @@
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.database import supabase_client
+
+
+@pytest.mark.asyncio
+async def test_get_paper_full_text_selects_only_full_text():
+    """Test that the full text lookup fetches just the full_text column."""
+    fake_supabase = MagicMock()
+    query = fake_supabase.table.return_value.select.return_value.eq.return_value
+    query.execute.return_value = MagicMock(data=[{"full_text": "Paper body"}])
+    paper_id = uuid.uuid4()
+
+    with patch.object(supabase_client, "supabase", fake_supabase):
+        full_text = await supabase_client.get_paper_full_text(paper_id)
+
+    assert full_text == "Paper body"
+    fake_supabase.table.return_value.select.assert_called_once_with("full_text")
+    fake_supabase.table.return_value.select.return_value.eq.assert_called_once_with("id", str(paper_id))
+
+
+@pytest.mark.asyncio
+async def test_get_paper_full_text_missing_paper_returns_none():
+    """Test that an unknown paper yields None."""
+    fake_supabase = MagicMock()
+    query = fake_supabase.table.return_value.select.return_value.eq.return_value
+    query.execute.return_value = MagicMock(data=[])
+
+    with patch.object(supabase_client, "supabase", fake_supabase):
+        assert await supabase_client.get_paper_full_text(uuid.uuid4()) is None
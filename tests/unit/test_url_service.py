@@ -0,0 +1,50 @@
+import fitz
+import pytest
+
+from app.api.v1.models import SourceType
+from app.services import url_service
+from app.utils.url_utils import extract_paper_id_from_url
+
+
+@pytest.mark.asyncio
+async def test_fetch_metadata_from_url_reads_cached_pdf(monkeypatch, tmp_path):
+    """Test that PDF metadata is read from the file downloaded into the PDF cache."""
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), "A Cached Paper")
+    doc.set_metadata({"title": "A Cached Paper", "author": "Ada Lovelace"})
+    pdf_path = tmp_path / "paper.pdf"
+    doc.save(str(pdf_path))
+
+    async def fake_download(url):
+        return str(pdf_path), True
+
+    monkeypatch.setattr(url_service, "download_pdf", fake_download)
+
+    metadata = await url_service.fetch_metadata_from_url("https://example.org/paper.pdf", SourceType.PDF)
+
+    assert metadata.title == "A Cached Paper"
+    assert [author.name for author in metadata.authors] == ["Ada Lovelace"]
+
+
+@pytest.mark.asyncio
+async def test_is_pdf_url_uses_content_type(monkeypatch):
+    """Test that is_pdf_url reports the type returned by the PDF preflight request."""
+    async def fake_preflight(url):
+        return 10, "application/pdf" if url.endswith("paper") else "text/html", False
+
+    monkeypatch.setattr(url_service, "preflight_pdf_url", fake_preflight)
+
+    assert await url_service.is_pdf_url("https://example.org/paper")
+    assert not await url_service.is_pdf_url("https://example.org/page")
+
+
+@pytest.mark.asyncio
+async def test_extract_paper_id_from_url_strips_versions():
+    """Test that arXiv IDs are extracted without their version suffix."""
+    abs_ids = await extract_paper_id_from_url("https://arxiv.org/abs/2401.12345v3?context=cs")
+    fallback_ids = await extract_paper_id_from_url("https://export.arxiv.org/pdf/2401.12345v2.pdf")
+    doi_ids = await extract_paper_id_from_url("https://doi.org/10.1000/xyz123")
+
+    assert abs_ids == {"arxiv_id": "2401.12345", "doi": None}
+    assert fallback_ids["arxiv_id"] == "2401.12345"
+    assert doi_ids == {"arxiv_id": None, "doi": "10.1000/xyz123"}